@@ -1,6 +1,52 @@
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions
-from seleniumactions.elements import FluentFinder, Locator, Using
-from seleniumactions.actions import Actions
-from seleniumactions.conditions import LocatorExists
-from seleniumactions.pages import Page
+"""
+Package exports are resolved lazily (on first attribute access), so importing Locator / Using
+doesn't load selenium WebDriver stack and submodules are imported only when used.
+"""
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    'Keys': 'selenium.webdriver.common.keys',
+    'expected_conditions': 'selenium.webdriver.support',
+    'Locator': 'seleniumactions.locators',
+    'Using': 'seleniumactions.locators',
+    'FluentFinder': 'seleniumactions.elements',
+    'Actions': 'seleniumactions.actions',
+    'LocatorExists': 'seleniumactions.conditions',
+    'PollingWait': 'seleniumactions.waits',
+    'FixedPolling': 'seleniumactions.waits',
+    'BackoffPolling': 'seleniumactions.waits',
+    'FailureConditionMet': 'seleniumactions.waits',
+    'ObserverFinder': 'seleniumactions.observers',
+    'instrumentation': 'seleniumactions.instrumentation',
+    'Page': 'seleniumactions.pages',
+    'enable_logging': 'seleniumactions.logs',
+    'disable_logging': 'seleniumactions.logs',
+    'logging_stats': 'seleniumactions.logs',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions
+    from seleniumactions.locators import Locator, Using
+    from seleniumactions.elements import FluentFinder
+    from seleniumactions.actions import Actions
+    from seleniumactions.conditions import LocatorExists
+    from seleniumactions.waits import PollingWait, FixedPolling, BackoffPolling, FailureConditionMet
+    from seleniumactions.observers import ObserverFinder
+    from seleniumactions.instrumentation import instrumentation
+    from seleniumactions.pages import Page
+    from seleniumactions.logs import enable_logging, disable_logging, logging_stats
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS: raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    import importlib
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
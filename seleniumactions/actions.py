@@ -1,29 +1,235 @@
-import logging, sys
-from time import sleep, time
+import asyncio
+import inspect
+import logging
+from functools import wraps
+from time import perf_counter, sleep
+from typing import Dict, List, Union
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
-from seleniumactions.elements import Finder
+from seleniumactions import scripts
+from seleniumactions.capture import Capture
+from seleniumactions.conditions import BatchRead, Condition, RunSteps
+from seleniumactions.elements import Finder, Locator
+from seleniumactions.instrumentation import instrumented, waiting
+from seleniumactions.navigation import MUTATING_STEPS, Navigation
+from seleniumactions.pipeline import Pipeline, PipelineResult, Step
+from seleniumactions.retry import IDEMPOTENT_STEPS, RETRYABLE_STEPS, Attempts, RetryPolicy
+from seleniumactions.waits import FailureConditionMet, PollingStrategy
 
 
 logger = logging.getLogger('ACTIONS')
-stream_handler = logging.StreamHandler(sys.stdout)
-logger.addHandler(stream_handler)
 
 
-def time_it(f):
+def action(f):
     """
-    Mesure execution in seconds
+    Actions method step: instrumentation span and WebDriver command counting (when finder has command counter).
+    Finder is notified about stale elements, so it can drop cached ones.
+    Flaky steps are retried according to actions retry policy when set (seleniumactions.retry).
+    Failed (and every N-th) steps are handed to actions capture (seleniumactions.capture) when set.
+    Mutating steps mark page dirty for goto reuse (seleniumactions.navigation) and start new finder document generation,
+    in settle mode request tracking hooks are installed before them (RequestTracking).
     """
-    def wrapper(*args, **kwargs):
-        begin = time()
-        result = f(*args, **kwargs)
-        end = time()
-        logger.info(f'({f.__name__}) took {str(round((end - begin), 3))} seconds.')
+    name = f.__name__
+    mutating = name in MUTATING_STEPS
+    retryable = name in RETRYABLE_STEPS
+    signature = inspect.signature(f)
+    f = instrumented(f)
+
+    def locator(args: tuple, kwargs: dict):
+        return args[0] if args else kwargs.get('locator_tuple')
+
+    def stale(self, args: tuple, kwargs: dict) -> None:
+        locator_tuple = locator(args, kwargs)
+        if isinstance(locator_tuple, tuple): self.finder.element_stale(locator_tuple)
+
+    def attempts(self, args: tuple, kwargs: dict) -> Attempts:
+        if not retryable or self.retry is None: return None
+        return self.retry.attempts(locator(args, kwargs), self.retry.budget_seconds(self.finder),
+                                   idempotent=name in IDEMPOTENT_STEPS)
+
+    def within_budget(self, args: tuple, kwargs: dict, retry: Attempts) -> tuple:
+        """ args, kwargs of next attempt - its element lookup waits at most for what is left of retry budget """
+        bound = signature.bind(self, *args, **kwargs)
+        t = self.finder.timeout_seconds(bound.arguments.get('timeout'), bound.arguments.get('explicit_timeout') or None,
+                                        getattr(self.finder, 'default_timeout', self.wait_for_condition_timeout))
+        left = max(retry.remaining, 0.001)
+        if t is None or t > left: bound.arguments['explicit_timeout'] = left
+        return bound.args[1:], bound.kwargs
+
+    if inspect.iscoroutinefunction(f):
+        async def async_call(self, args: tuple, kwargs: dict):
+            counter = self.finder.command_counter
+            if counter is None: return await f(self, *args, **kwargs)
+            with counter.scope(name):
+                return await f(self, *args, **kwargs)
+
+        @wraps(f)
+        async def async_wrapper(self, *args, **kwargs):
+            if mutating: self.navigation.dirty = True
+            if mutating and self.settle and self.wait_between_sec:
+                await self.run(self.finder.contexts.top)
+                await self.run(self.requests.before_step, self.webdriver)
+            retry = attempts(self, args, kwargs)
+            try:
+                while True:
+                    try:
+                        result = await async_call(self, args, kwargs)
+                        break
+                    except Exception as e:
+                        if isinstance(e, StaleElementReferenceException): stale(self, args, kwargs)
+                        delay = retry.failed(e) if retry is not None else None
+                        if delay is None: raise
+                        logger.info('retry %s %s in %.3f sec after %s', name, locator(args, kwargs), delay,
+                                    type(e).__name__)
+                        await asyncio.sleep(delay)
+                        args, kwargs = within_budget(self, args, kwargs, retry)
+                        retry.next()
+            except Exception as e:
+                if self.capture is not None:
+                    await self.run(self.capture.failure, self.webdriver, name, e, self.finder.contexts)
+                raise
+            finally:
+                if mutating: self.finder.document_changed()
+            if retry is not None: retry.succeeded()
+            if self.capture is not None and self.capture.every:
+                await self.run(self.capture.step, self.webdriver, name, self.finder.contexts)
+            return result
+        return async_wrapper
+
+    def call(self, args: tuple, kwargs: dict):
+        counter = self.finder.command_counter
+        if counter is None: return f(self, *args, **kwargs)
+        with counter.scope(name):
+            return f(self, *args, **kwargs)
+
+    @wraps(f)
+    def wrapper(self, *args, **kwargs):
+        if mutating: self.navigation.dirty = True
+        if mutating and self.settle and self.wait_between_sec:
+            self.finder.contexts.top()
+            self.requests.before_step(self.webdriver)
+        retry = attempts(self, args, kwargs)
+        try:
+            while True:
+                try:
+                    result = call(self, args, kwargs)
+                    break
+                except Exception as e:
+                    if isinstance(e, StaleElementReferenceException): stale(self, args, kwargs)
+                    delay = retry.failed(e) if retry is not None else None
+                    if delay is None: raise
+                    logger.info('retry %s %s in %.3f sec after %s', name, locator(args, kwargs), delay,
+                                type(e).__name__)
+                    sleep(delay)
+                    args, kwargs = within_budget(self, args, kwargs, retry)
+                    retry.next()
+        except Exception as e:
+            if self.capture is not None: self.capture.failure(self.webdriver, name, e, self.finder.contexts)
+            raise
+        finally:
+            if mutating: self.finder.document_changed()
+        if retry is not None: retry.succeeded()
+        if self.capture is not None and self.capture.every:
+            self.capture.step(self.webdriver, name, self.finder.contexts)
         return result
     return wrapper
 
 
+class SettleStats:
+    """
+    Time spent settling page after actions (settle mode), reported separately from actions themselves.
+
+    settled: seconds spent waiting for page to get quiet
+    budget: seconds which fixed wait_between sleeps would take
+    saved: budget - settled
+    timeouts: number of settles which hit wait_between upper bound
+    untracked: number of settles which had to install request hooks (requests started before were not counted)
+    """
+    def __init__(self) -> None:
+        self.count = 0
+        self.timeouts = 0
+        self.untracked = 0
+        self.settled = 0.0
+        self.budget = 0.0
+
+    @property
+    def saved(self) -> float:
+        return self.budget - self.settled
+
+    def __str__(self):
+        return f'settled {self.count} times in {round(self.settled, 3)} sec, saved {round(self.saved, 3)} sec, ' \
+               f'timeouts: {self.timeouts}, untracked: {self.untracked}'
+
+    def __repr__(self):
+        return self.__str__()
+
+    def add(self, spent: float, budget: float, result: dict) -> None:
+        self.count += 1
+        self.settled += spent
+        self.budget += budget
+        if not result or not result.get('settled'): self.timeouts += 1
+        if result and not result.get('tracked', True): self.untracked += 1
+
+
+class RequestTracking:
+    """
+    Fetch / XHR counting hooks settle mode waits for (scripts.HOOK_REQUESTS). They are installed after goto
+    and before mutating steps, so requests started by the step itself are counted.
+    With Chrome DevTools Protocol (execute_cdp_cmd) hooks are registered once for every new document
+    (Page.addScriptToEvaluateOnNewDocument), so requests of pages loaded by click / submit are counted from the start.
+    Without it they are installed with a script call, skipped when settle found them in current document
+    after the last step.
+
+    installed: current document is known to have hooks
+    on_new_document: hooks are registered with CDP (None - not tried yet)
+    """
+    def __init__(self) -> None:
+        self.installed = False
+        self.on_new_document = None
+
+    def install(self, driver: WebDriver) -> None:
+        """ make sure current document has hooks """
+        if self.on_new_document is None: self.on_new_document = self.__register(driver)
+        if self.installed: return
+        try:
+            driver.execute_script(scripts.TRACK_REQUESTS)
+            self.installed = True
+        except WebDriverException as e:
+            logger.info('request tracking failed (%s)', e.__class__.__name__)
+
+    def before_step(self, driver: WebDriver) -> None:
+        """ hooks in current document, step may load new one - only CDP registered hooks are there for sure """
+        self.install(driver)
+        self.installed = bool(self.on_new_document)
+
+    def navigated(self, driver: WebDriver) -> None:
+        """ new document loaded by goto """
+        self.installed = bool(self.on_new_document)
+        self.install(driver)
+
+    def settled(self, result: dict) -> None:
+        """ settle installs hooks when they are missing """
+        if result: self.installed = True
+
+    @staticmethod
+    def __register(driver: WebDriver) -> bool:
+        execute_cdp = getattr(driver, 'execute_cdp_cmd', None)
+        if execute_cdp is None: return False
+        try:
+            execute_cdp('Page.addScriptToEvaluateOnNewDocument', {'source': f'({scripts.HOOK_REQUESTS})();'})
+        except WebDriverException as e:
+            logger.info('request tracking on new documents not supported (%s)', e.__class__.__name__)
+            return False
+        return True
+
+    def __str__(self):
+        return f'request tracking -> installed: {self.installed}, on new document: {self.on_new_document}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
 class Actions:
     """
     Action - responsible for webdriver operations:
@@ -34,6 +240,14 @@ class Actions:
     finder:  abs.elements.Finder instance (u can use abs.elements.FluentFinder or implement your own :) )
     wait_for_condition_timeout: default wait for condition timeout when using wait_for method
     wait_between: default delay between action method calls, defaults 0sec
+    settle: settle mode - instead of sleeping wait_between after actions, wait until page is quiet
+            (document ready, no pending fetch/XHR, idle animation frames) with wait_between as an upper bound.
+            Request hooks are installed before mutating steps (.requests - RequestTracking).
+            Time spent settling is reported in .settle_stats
+    capture: seleniumactions.capture.Capture - screenshot / DOM snapshot of failed (and every N-th) steps
+    retry: seleniumactions.retry.RetryPolicy - retry flaky steps (stale element, intercepted click, Grid hiccup)
+
+    .navigation (seleniumactions.navigation.Navigation) - goto reuse mode, loaded url, Page.open timings
 
     WebDriver and Finder are accessible with properties .webdriver and .finder
 
@@ -77,10 +291,19 @@ class Actions:
     - sleep_after (bool)
     Ex: actions.click(loc, sleep_after=False)
     """
+    settle_quiet_frames = 2
 
-    def __init__(self, finder: Finder, wait_for_condition_timeout: int, wait_between: int = 0) -> None:
+    def __init__(self, finder: Finder, wait_for_condition_timeout: int, wait_between: int = 0,
+                 settle: bool = False, capture: Capture = None, retry: RetryPolicy = None) -> None:
         self.wait_between_sec = wait_between
         self.wait_for_condition_timeout = wait_for_condition_timeout
+        self.settle = settle
+        self.settle_stats = SettleStats()
+        self.requests = RequestTracking()
+        self.capture = capture
+        self.retry = retry
+        if retry is not None: retry.check(finder)
+        self.navigation = Navigation()
         self.__finder = finder
 
     @property
@@ -97,15 +320,43 @@ class Actions:
         """
         return self.__finder
 
-    @time_it
-    def goto(self, url: str) -> None:
+    def scoped(self, root_locator: tuple) -> 'Actions':
         """
-        Go to url.
+        Actions with element lookups (and batch reads / pipelines) scoped to component root element,
+        root is located once and cached (see seleniumactions.elements.ScopedFinder).
+
+        Examples:
+          sidebar = actions.scoped(("id", "sidebar"))
+          sidebar.click(("xpath", "//a[.='News']"))  # -> link within #sidebar
         """
-        logger.info(f'goto {url}')
-        self.webdriver.get(url)
+        scoped = type(self)(self.finder.scoped(root_locator), self.wait_for_condition_timeout,
+                            self.wait_between_sec, self.settle, self.capture, self.retry)
+        scoped.settle_stats = self.settle_stats
+        scoped.requests = self.requests
+        scoped.navigation = self.navigation
+        return scoped
+
+    @action
+    def goto(self, url: str, reuse: str = None) -> str:
+        """
+        Go to url, returns how: get | reload | skip.
+        reuse: never | skip | reload - skip (or refresh) when url is already loaded, see seleniumactions.navigation
+               (defaults to actions.navigation.reuse - never)
 
-    @time_it
+        Examples:
+          actions.goto('https://some.site.io')
+          actions.goto('https://some.site.io', reuse='skip')  # no-op when page is loaded and wasn't touched since
+        """
+        how = self.navigation.plan(url, reuse, lambda: self.webdriver.current_url)
+        logger.info('goto %s (%s)', url, how)
+        if how != 'skip': self.finder.navigated()
+        if how == 'get': self.webdriver.get(url)
+        elif how == 'reload': self.webdriver.refresh()
+        if how != 'skip' and self.settle and self.wait_between_sec: self.requests.navigated(self.webdriver)
+        self.navigation.loaded(url, how, reuse, lambda: self.webdriver.current_url)
+        return how
+
+    @action
     def click(self, locator_tuple: tuple,
               timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
         """
@@ -118,11 +369,11 @@ class Actions:
           actions.click(home_button, explicit_timeout=15)
           actions.click(home_button, sleep_after=False)
         """
-        logger.info(f'click {locator_tuple}')
+        logger.info('click %s', locator_tuple)
         self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout).click()
-        if sleep_after: self.sleep()
+        if sleep_after: self.__after_action()
 
-    @time_it
+    @action
     def type_text(self, locator_tuple: tuple, text: str,
                   timeout: str = None, explicit_timeout: int = None,
                   sleep_after: bool = True, text_mask: str = None) -> None:
@@ -137,11 +388,11 @@ class Actions:
           actions.type_text(email_input, text="jimmy@choo.io", sleep_after=False)
         """
         tekzt = text_mask or text
-        logger.info(f'type text {locator_tuple} : {tekzt}')
+        logger.info('type text %s : %s', locator_tuple, tekzt)
         self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout).send_keys(text)
-        if sleep_after: self.sleep()
+        if sleep_after: self.__after_action()
 
-    @time_it
+    @action
     def clear(self, locator_tuple: tuple,
               timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
         """
@@ -154,11 +405,11 @@ class Actions:
           actions.clear(email_input, explicit_timeout=15)
           actions.clear(email_input, sleep_after=False
         """
-        logger.info(f'clear field {locator_tuple}')
+        logger.info('clear field %s', locator_tuple)
         self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout).clear()
-        if sleep_after: self.sleep()
+        if sleep_after: self.__after_action()
 
-    @time_it
+    @action
     def submit(self, locator_tuple: tuple = None,
                timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
         """
@@ -173,33 +424,41 @@ class Actions:
           actions.submit(account_form, sleep_after=False)
         """
         lt = locator_tuple if locator_tuple else ('xpath', '//form')
-        logger.info(f'submit {lt}')
+        logger.info('submit %s', lt)
         self.finder.find_element(lt, timeout=timeout, explicit_timeout=explicit_timeout).submit()
-        if sleep_after: self.sleep()
+        if sleep_after: self.__after_action()
 
-    @time_it
+    @action
     def wait_for(self, condition: object, timeout: str = None,
-                 explicit_timeout: int = None) -> None:
+                 explicit_timeout: int = None, polling: PollingStrategy = None, fail_on: List = None) -> None:
         """
         Wait for expected condition to be met.
+        Delays between checks come from finder polling strategy, unless overriden with polling kwarg.
+        Failure conditions (fail_on, plus finder.fail_on) are checked in the same poll,
+        first one met aborts the wait with FailureConditionMet (TimeoutException subclass).
 
         Examples:
           condition = LocatorExists(("id", "home"))
           actions.wait_for(condition)
           actions.wait_for(condition, explicit_timeout=50)
+          actions.wait_for(condition, polling=BackoffPolling(cap=1))
+          actions.wait_for(condition, fail_on=[LocatorExists(("css selector", ".error-toast"))])
+          actions.wait_for(absent(SPINNER) & count(ROWS, at_least=10))  # timeout lists unmet sub-conditions
         """
-        t = self.wait_for_condition_timeout
-        if timeout is not None:
-            try:
-                t = self.finder.timeouts[timeout.lower()]
-            except KeyError:
-                valid_options = list(self.finder.timeouts.keys())
-                raise ValueError(f'Invalid timeout variant: "{timeout}", use {valid_options}')
-        if explicit_timeout is not None: t = explicit_timeout
-        logger.info(f'wait for {condition}, timeout: {t} sec')
-        WebDriverWait(self.webdriver, t).until(condition)
-
-    @time_it
+        t = self.finder.resolve_timeout(timeout, explicit_timeout, self.wait_for_condition_timeout)
+        logger.info('wait for %s, timeout: %s sec', condition, t)
+        if isinstance(condition, Condition): condition = condition.bind(self.finder.root_element, self.finder.contexts)
+        self.finder.contexts.top()  # plain callables (and fail_on ones) check driver in top document
+        try:
+            self.finder.wait(t, polling, fail_on).until(condition)
+        except FailureConditionMet:
+            raise
+        except TimeoutException as e:
+            if not getattr(condition, 'unmet', None): raise
+            raise TimeoutException(f'{condition} not met in {t} sec, unmet: {condition.unmet}',
+                                   e.screen, e.stacktrace) from e
+
+    @action
     def get_attribute(self, locator_tuple: tuple, attr: str,
                       timeout: str = None, explicit_timeout: int = None) -> str:
         """
@@ -211,26 +470,96 @@ class Actions:
           actions.get_attribute(loc, attr="innerHTML", timeout="medium")
           actions.get_attribute(loc, attr="innerHTML", explicit_timeout=3)
         """
-        logger.info(f'get attribute {locator_tuple} [{attr}]')
-        return self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)\
-            .get_attribute(attr)
+        return self.__get_attribute(locator_tuple, attr, timeout, explicit_timeout)
 
-    @time_it
+    @action
     def get_text(self, locator_tuple: tuple, timeout: str = None, explicit_timeout: int = None) -> str:
         """
         Shortcut for getting element text.
         """
-        return self.get_attribute(locator_tuple, 'innerText', timeout=timeout, explicit_timeout=explicit_timeout)
+        return self.__get_attribute(locator_tuple, 'innerText', timeout, explicit_timeout)
+
+    def __get_attribute(self, locator_tuple: tuple, attr: str, timeout: str, explicit_timeout: int) -> str:
+        logger.info('get attribute %s [%s]', locator_tuple, attr)
+        return self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)\
+            .get_attribute(attr)
+
+    @action
+    def get_texts(self, locators: Union[List[tuple], Dict[str, tuple]],
+                  timeout: str = None, explicit_timeout: int = None) -> Union[List[str], Dict[str, str]]:
+        """
+        Get texts of elements for many locators in one WebDriver round-trip (one wait for whole batch).
+        Returns list for list of locators, dict for dict of locators.
+        LocatorPath locators are read in their frame / shadow root - one round-trip per context.
+
+        Examples:
+          actions.get_texts([("id", "name"), ("id", "email")])  # -> ["Jimmy", "jimmy@choo.io"]
+          actions.get_texts({"name": ("id", "name"), "email": ("id", "email")}, timeout="short")
+        """
+        return self.__batch_read(locators, None, False, timeout, explicit_timeout)
 
-    @time_it
+    @action
+    def get_attributes(self, locators: Union[List[tuple], Dict[str, tuple]], attr: str,
+                       timeout: str = None, explicit_timeout: int = None) -> Union[List[str], Dict[str, str]]:
+        """
+        Get attribute values of elements for many locators in one WebDriver round-trip.
+        Returns list for list of locators, dict for dict of locators.
+
+        Examples:
+          actions.get_attributes([("id", "name"), ("id", "email")], attr="value")
+          actions.get_attributes({"name": ("id", "name")}, attr="value", explicit_timeout=3)
+        """
+        return self.__batch_read(locators, attr, False, timeout, explicit_timeout)
+
+    @action
+    def get_all_texts(self, locator_tuple: tuple, timeout: str = None, explicit_timeout: int = None) -> List[str]:
+        """
+        Get texts of all elements matching locator in one WebDriver round-trip.
+
+        Examples:
+          actions.get_all_texts(("xpath", "//table//tr/td[1]"))
+        """
+        return self.__batch_read([locator_tuple], None, True, timeout, explicit_timeout)[0]
+
+    @action
+    def get_all_attributes(self, locator_tuple: tuple, attr: str,
+                           timeout: str = None, explicit_timeout: int = None) -> List[str]:
+        """
+        Get attribute values of all elements matching locator in one WebDriver round-trip.
+
+        Examples:
+          actions.get_all_attributes(("xpath", "//table//a"), attr="href")
+        """
+        return self.__batch_read([locator_tuple], attr, True, timeout, explicit_timeout)[0]
+
+    def __batch_read(self, locators, attr: str, all: bool, timeout: str, explicit_timeout: int):
+        keys = list(locators.keys()) if isinstance(locators, dict) else None
+        locator_tuples = [lt.get_by() if isinstance(lt, Locator) else lt
+                          for lt in (locators.values() if keys is not None else locators)]
+        if not locator_tuples: return {} if keys is not None else []
+        t = self.finder.resolve_timeout(timeout, explicit_timeout,
+                                        getattr(self.finder, 'default_timeout', self.wait_for_condition_timeout))
+        condition = BatchRead(locator_tuples, attr, all, root=self.finder.root_element, contexts=self.finder.contexts)
+        logger.info('%s, timeout: %s sec', condition, t)
+        try:
+            values = self.finder.wait(t).until(condition)
+        except FailureConditionMet:
+            raise
+        except TimeoutException as e:
+            raise TimeoutException(f'{condition.missing} not found in {t} sec', e.screen, e.stacktrace)
+        return dict(zip(keys, values)) if keys is not None else values
+
+    @action
     def execute_js(self, js_script: str) -> str:
         """
         Execute JavaScript
         """
-        logger.info(f'execute js\n{js_script}')
+        if logger.isEnabledFor(logging.DEBUG): logger.debug('execute js\n%s', js_script)
+        else: logger.info('execute js %.80r', js_script)
+        self.finder.contexts.top()
         return str(self.webdriver.execute_script(js_script))
 
-    @time_it
+    @action
     def hover(self, locator_tuple: tuple,
               timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
         """
@@ -243,10 +572,108 @@ class Actions:
           actions.hover(loc, explicit_timeout=3)
           actions.hover(loc, sleep_after=False)
         """
-        logger.info(f'hover element {locator_tuple}')
+        logger.info('hover element %s', locator_tuple)
         element = self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
         ActionChains(self.webdriver).move_to_element(element).perform()
-        if sleep_after: self.sleep()
+        if sleep_after: self.__after_action()
+
+    def pipeline(self) -> Pipeline:
+        """
+        New compound action pipeline, steps run with single injected script where possible.
+
+        Examples:
+          result = actions.pipeline().clear(email).set_value(email, "jimmy@choo.io").click(submit).run()
+          result.ok, result.failed_at, result.values
+        """
+        return Pipeline(self)
+
+    @action
+    def run_pipeline(self, pipeline: Pipeline,
+                     timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> PipelineResult:
+        """
+        Run pipeline steps in order, stops at first failed step. Element timeout applies to each script run
+        (group of consecutive scriptable steps) and each native step, sleep / settle happens once at the end.
+
+        Examples:
+          actions.run_pipeline(pipeline, timeout="short")
+          pipeline.run(explicit_timeout=5, sleep_after=False)  # same thing
+        """
+        result = PipelineResult(list(pipeline.steps))
+        logger.info('pipeline of %s steps', len(pipeline))
+        t = self.finder.resolve_timeout(timeout, explicit_timeout,
+                                        getattr(self.finder, 'default_timeout', self.wait_for_condition_timeout))
+        for first, steps in pipeline.segments():
+            if steps[0].native:
+                self.__native_step(first, steps[0], result, timeout, explicit_timeout)
+            else:
+                self.__script_steps(first, steps, result, t)
+            if not result.ok: break
+        if sleep_after: self.__after_action()
+        return result
+
+    def __script_steps(self, first: int, steps: List[Step], result: PipelineResult, t: float) -> None:
+        logger.info('run %s, timeout: %s sec', steps, t)
+        condition = RunSteps([(step.op, step.locator_tuple, step.arg) for step in steps],
+                             root=self.finder.root_element, contexts=self.finder.contexts)
+        try:
+            self.finder.wait(t).until(condition)
+        except FailureConditionMet:
+            raise
+        except TimeoutException:
+            result.fail(first + condition.position, f'TimeoutException: {condition.missing} not found in {t} sec')
+        except WebDriverException as e:
+            result.fail(first + condition.position, f'{type(e).__name__}: {e.msg}')
+        result.round_trips += condition.calls
+        result.values[first:first + len(condition.results)] = condition.results
+        if condition.error is not None: result.fail(first + condition.position, condition.error)
+
+    def __native_step(self, index: int, step: Step, result: PipelineResult,
+                      timeout: str, explicit_timeout: int) -> None:
+        logger.info('run %s', step)
+        result.round_trips += 1
+        try:
+            element = self.finder.find_element(step.locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+            if step.op == 'click': element.click()
+            elif step.op == 'type_text': element.send_keys(step.arg)
+            elif step.op == 'hover': ActionChains(self.webdriver).move_to_element(element).perform()
+            else: raise ValueError(f'unknown native pipeline step: {step.op}')
+        except FailureConditionMet:
+            raise
+        except WebDriverException as e:
+            result.fail(index, f'{type(e).__name__}: {e.msg}')
+
+    def settle_page(self, max_sec: float = None) -> float:
+        """
+        Wait until page is quiet, at most max_sec (defaults to wait_between). Returns seconds spent.
+        Falls back to fixed sleep when settle script can't be executed.
+
+        Examples:
+          actions.settle_page()
+          actions.settle_page(2)
+        """
+        budget = max_sec if max_sec is not None else self.wait_between_sec
+        if not budget: return 0.0
+        begin = perf_counter()
+        with waiting('sleep'):
+            try:
+                self.finder.contexts.top()
+                result = self.webdriver.execute_async_script(
+                    scripts.SETTLE, int(budget * 1000), self.settle_quiet_frames)
+            except WebDriverException as e:
+                logger.info('settle failed (%s), sleep %s sec', e.__class__.__name__, budget)
+                sleep(budget)
+                result = None
+        spent = perf_counter() - begin
+        self.settle_stats.add(spent, budget, result)
+        self.requests.settled(result)
+        logger.info('settle took %s sec (max %s sec)', round(spent, 3), budget)
+        return spent
+
+    def __after_action(self) -> None:
+        if self.settle:
+            self.settle_page()
+        else:
+            self.sleep()
 
     def sleep(self, sec: int = None):
         """
@@ -256,5 +683,6 @@ class Actions:
           actions.sleep(3.5)
         """
         seconds = sec if sec else self.wait_between_sec
-        logger.info(f'sleep {seconds} sec')
-        sleep(seconds)
+        logger.info('sleep %s sec', seconds)
+        with waiting('sleep'):
+            sleep(seconds)
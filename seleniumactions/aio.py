@@ -0,0 +1,405 @@
+"""
+Asyncio Actions API:
+
+AsyncFinder / AsyncActions / AsyncPage - same surface as Finder / Actions / Page, but coroutines
+(scoped finders / actions and pages with root included).
+Waits and sleeps are awaitable (asyncio.sleep between polls), blocking WebDriver HTTP calls run
+in a thread pool executor, so one event loop can drive many browser sessions concurrently
+and no thread is parked in time.sleep.
+
+Example usage:
+    import asyncio
+    from seleniumactions.aio import AsyncActions, AsyncFinder
+
+    async def scenario(driver):
+        finder = AsyncFinder(driver, timeouts=timeouts, default_timeout=3, polling=BackoffPolling())
+        actions = AsyncActions(finder, wait_for_condition_timeout=15, wait_between=0.5)
+        await actions.goto('https://some.site.io')
+        await actions.click(('id', 'menu'))
+        return await actions.get_text(('id', 'header'))
+
+    results = await asyncio.gather(*[scenario(driver) for driver in drivers])
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+from time import perf_counter
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Union
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from seleniumactions import scripts
+from seleniumactions.actions import RequestTracking, SettleStats, action, logger
+from seleniumactions.capture import Capture
+from seleniumactions.commands import CommandCounter
+from seleniumactions.conditions import BatchRead, Condition
+from seleniumactions.elements import Finder, Locator, ScopedFinder, flogger
+from seleniumactions.instrumentation import waiting
+from seleniumactions.navigation import Navigation
+from seleniumactions.pages import Page
+from seleniumactions.retry import RetryPolicy
+from seleniumactions.waits import FailureConditionMet, PollingStrategy
+
+
+class AsyncRunner:
+    """ Runs blocking WebDriver calls in executor (keeping context vars for instrumentation / counting) """
+    def __init__(self, executor: Executor = None) -> None:
+        self.executor = executor
+
+    async def __call__(self, f: Callable, *args, **kwargs):
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, f, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+
+class AsyncPollingWait:
+    """ PollingWait counterpart, condition checks run in executor and delays are awaited """
+    def __init__(self, driver: WebDriver, timeout: float, polling: PollingStrategy, run: AsyncRunner,
+                 ignored_exceptions: tuple = None, fail_on: List[Callable] = None) -> None:
+        self.driver = driver
+        self.timeout = float(timeout)
+        self.polling = polling
+        self.run = run
+        self.ignored_exceptions = (NoSuchElementException,) + tuple(ignored_exceptions or ())
+        self.fail_on = list(fail_on or ())
+
+    async def until(self, method: Callable, message: str = ''):
+        with waiting():
+            return await self.__until(method, message)
+
+    async def __until(self, method: Callable, message: str):
+        loop = asyncio.get_running_loop()
+        screen, stacktrace = None, None
+        begin = loop.time()
+        end = begin + self.timeout
+        intervals = self.polling.intervals()
+        if not self.polling.immediate:
+            await asyncio.sleep(max(0.0, min(next(intervals), end - loop.time())))
+        while True:
+            try:
+                value = await self.run(method, self.driver)
+                if value: return value
+            except self.ignored_exceptions as e:
+                screen = getattr(e, 'screen', None)
+                stacktrace = getattr(e, 'stacktrace', None)
+            for condition in self.fail_on:
+                try:
+                    matched = await self.run(condition, self.driver)
+                except self.ignored_exceptions:
+                    matched = False
+                if matched: raise FailureConditionMet(condition, loop.time() - begin, matched, screen, stacktrace)
+            remaining = end - loop.time()
+            if remaining <= 0: break
+            await asyncio.sleep(min(next(intervals), remaining))
+        raise TimeoutException(message, screen, stacktrace)
+
+
+class AsyncFinder(Finder):
+    """
+    Async FluentFinder counterpart, find_element / find_elements are coroutines.
+
+    executor: concurrent.futures Executor for blocking WebDriver calls (loop default executor when None)
+    """
+    def __init__(self, webdriver: WebDriver, timeouts: dict,
+                 default_timeout: int, polling: PollingStrategy = None,
+                 command_counter: CommandCounter = None, executor: Executor = None) -> None:
+        super().__init__(webdriver, timeouts, polling, command_counter)
+        self.default_timeout = default_timeout
+        self.run = AsyncRunner(executor)
+
+    def wait(self, timeout: float, polling: PollingStrategy = None, fail_on: List = None) -> AsyncPollingWait:
+        return AsyncPollingWait(self.webdriver, timeout, polling or self.polling, self.run,
+                                fail_on=self.failure_conditions(fail_on))
+
+    async def find_element(self, locator_tuple: tuple,
+                           timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                           polling: PollingStrategy = None, fail_on: List = None) -> WebElement:
+        t = self.resolve_timeout(timeout, explicit_timeout or None, self.default_timeout)
+        if condition is not None: return await self.wait(t, polling, fail_on).until(
+            self.legacy_condition(condition, locator_tuple))
+        con = self.presence(locator_tuple)
+        flogger.debug('find_element: %s, timeout: %s sec, condition: %s', locator_tuple, t, con)
+        return await self.wait(t, polling, fail_on).until(con)
+
+    async def find_elements(self, locator_tuple: tuple,
+                            timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                            polling: PollingStrategy = None, fail_on: List = None) -> List[WebElement]:
+        t = self.resolve_timeout(timeout, explicit_timeout or None, self.default_timeout)
+        if condition is not None: return await self.wait(t, polling, fail_on).until(
+            self.legacy_condition(condition, locator_tuple))
+        con = self.presence(locator_tuple, all=True)
+        flogger.debug('find_elements: %s, timeout: %s sec, condition: %s', locator_tuple, t, con)
+        return await self.wait(t, polling, fail_on).until(con)
+
+    def _new_scope(self, root_locator: tuple) -> 'AsyncScopedFinder':
+        return AsyncScopedFinder(self, root_locator)
+
+
+class AsyncScopedFinder(ScopedFinder):
+    """
+    ScopedFinder counterpart of AsyncFinder (see AsyncFinder.scoped), find_element / find_elements are coroutines.
+    Root element is located in checks running in parent finder executor.
+    """
+    @property
+    def run(self) -> AsyncRunner:
+        return self.parent.run
+
+    async def find_element(self, locator_tuple: tuple,
+                           timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                           polling: PollingStrategy = None, fail_on: List = None) -> WebElement:
+        return await super().find_element(locator_tuple, timeout, explicit_timeout, condition, polling, fail_on)
+
+    async def find_elements(self, locator_tuple: tuple,
+                            timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                            polling: PollingStrategy = None, fail_on: List = None) -> List[WebElement]:
+        return await super().find_elements(locator_tuple, timeout, explicit_timeout, condition, polling, fail_on)
+
+    def _new_scope(self, root_locator: tuple) -> 'AsyncScopedFinder':
+        return AsyncScopedFinder(self, root_locator)
+
+
+class AsyncActions:
+    """
+    Async Actions counterpart - same methods and kwargs as seleniumactions.Actions, awaited.
+
+    Example:
+      await actions.click(home_button, timeout="medium")
+      text = await actions.get_text(header)
+    """
+    settle_quiet_frames = 2
+
+    def __init__(self, finder: AsyncFinder, wait_for_condition_timeout: int, wait_between: int = 0,
+                 settle: bool = False, capture: Capture = None, retry: RetryPolicy = None) -> None:
+        self.wait_between_sec = wait_between
+        self.wait_for_condition_timeout = wait_for_condition_timeout
+        self.settle = settle
+        self.settle_stats = SettleStats()
+        self.requests = RequestTracking()
+        self.capture = capture
+        self.retry = retry
+        if retry is not None: retry.check(finder)
+        self.navigation = Navigation()
+        self.__finder = finder
+
+    @property
+    def webdriver(self) -> WebDriver:
+        return self.finder.webdriver
+
+    @property
+    def finder(self) -> AsyncFinder:
+        return self.__finder
+
+    async def run(self, f: Callable, *args, **kwargs):
+        """ run blocking call in finder executor """
+        return await self.finder.run(f, *args, **kwargs)
+
+    def scoped(self, root_locator: tuple) -> 'AsyncActions':
+        """ see Actions.scoped """
+        scoped = type(self)(self.finder.scoped(root_locator), self.wait_for_condition_timeout,
+                            self.wait_between_sec, self.settle, self.capture, self.retry)
+        scoped.settle_stats = self.settle_stats
+        scoped.requests = self.requests
+        scoped.navigation = self.navigation
+        return scoped
+
+    @action
+    async def goto(self, url: str, reuse: str = None) -> str:
+        current_url = functools.partial(getattr, self.webdriver, 'current_url')
+        how = await self.run(self.navigation.plan, url, reuse, current_url)
+        logger.info('goto %s (%s)', url, how)
+        if how != 'skip': self.finder.navigated()
+        if how == 'get': await self.run(self.webdriver.get, url)
+        elif how == 'reload': await self.run(self.webdriver.refresh)
+        if how != 'skip' and self.settle and self.wait_between_sec:
+            await self.run(self.requests.navigated, self.webdriver)
+        await self.run(self.navigation.loaded, url, how, reuse, current_url)
+        return how
+
+    @action
+    async def click(self, locator_tuple: tuple,
+                    timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
+        logger.info('click %s', locator_tuple)
+        element = await self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+        await self.run(element.click)
+        if sleep_after: await self.__after_action()
+
+    @action
+    async def type_text(self, locator_tuple: tuple, text: str,
+                        timeout: str = None, explicit_timeout: int = None,
+                        sleep_after: bool = True, text_mask: str = None) -> None:
+        logger.info('type text %s : %s', locator_tuple, text_mask or text)
+        element = await self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+        await self.run(element.send_keys, text)
+        if sleep_after: await self.__after_action()
+
+    @action
+    async def clear(self, locator_tuple: tuple,
+                    timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
+        logger.info('clear field %s', locator_tuple)
+        element = await self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+        await self.run(element.clear)
+        if sleep_after: await self.__after_action()
+
+    @action
+    async def submit(self, locator_tuple: tuple = None,
+                     timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
+        lt = locator_tuple if locator_tuple else ('xpath', '//form')
+        logger.info('submit %s', lt)
+        element = await self.finder.find_element(lt, timeout=timeout, explicit_timeout=explicit_timeout)
+        await self.run(element.submit)
+        if sleep_after: await self.__after_action()
+
+    @action
+    async def wait_for(self, condition: object, timeout: str = None,
+                       explicit_timeout: int = None, polling: PollingStrategy = None, fail_on: List = None) -> None:
+        t = self.finder.resolve_timeout(timeout, explicit_timeout, self.wait_for_condition_timeout)
+        logger.info('wait for %s, timeout: %s sec', condition, t)
+        if isinstance(condition, Condition): condition = condition.bind(self.finder.root_element, self.finder.contexts)
+        await self.run(self.finder.contexts.top)  # plain callables (and fail_on ones) check driver in top document
+        try:
+            await self.finder.wait(t, polling, fail_on).until(condition)
+        except FailureConditionMet:
+            raise
+        except TimeoutException as e:
+            if not getattr(condition, 'unmet', None): raise
+            raise TimeoutException(f'{condition} not met in {t} sec, unmet: {condition.unmet}',
+                                   e.screen, e.stacktrace) from e
+
+    @action
+    async def get_attribute(self, locator_tuple: tuple, attr: str,
+                            timeout: str = None, explicit_timeout: int = None) -> str:
+        return await self.__get_attribute(locator_tuple, attr, timeout, explicit_timeout)
+
+    @action
+    async def get_text(self, locator_tuple: tuple, timeout: str = None, explicit_timeout: int = None) -> str:
+        return await self.__get_attribute(locator_tuple, 'innerText', timeout, explicit_timeout)
+
+    async def __get_attribute(self, locator_tuple: tuple, attr: str, timeout: str, explicit_timeout: int) -> str:
+        logger.info('get attribute %s [%s]', locator_tuple, attr)
+        element = await self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+        return await self.run(element.get_attribute, attr)
+
+    @action
+    async def get_texts(self, locators: Union[List[tuple], Dict[str, tuple]],
+                        timeout: str = None, explicit_timeout: int = None) -> Union[List[str], Dict[str, str]]:
+        return await self.__batch_read(locators, None, False, timeout, explicit_timeout)
+
+    @action
+    async def get_attributes(self, locators: Union[List[tuple], Dict[str, tuple]], attr: str,
+                             timeout: str = None, explicit_timeout: int = None) -> Union[List[str], Dict[str, str]]:
+        return await self.__batch_read(locators, attr, False, timeout, explicit_timeout)
+
+    @action
+    async def get_all_texts(self, locator_tuple: tuple,
+                            timeout: str = None, explicit_timeout: int = None) -> List[str]:
+        return (await self.__batch_read([locator_tuple], None, True, timeout, explicit_timeout))[0]
+
+    @action
+    async def get_all_attributes(self, locator_tuple: tuple, attr: str,
+                                 timeout: str = None, explicit_timeout: int = None) -> List[str]:
+        return (await self.__batch_read([locator_tuple], attr, True, timeout, explicit_timeout))[0]
+
+    async def __batch_read(self, locators, attr: str, all: bool, timeout: str, explicit_timeout: int):
+        keys = list(locators.keys()) if isinstance(locators, dict) else None
+        locator_tuples = [lt.get_by() if isinstance(lt, Locator) else lt
+                          for lt in (locators.values() if keys is not None else locators)]
+        if not locator_tuples: return {} if keys is not None else []
+        t = self.finder.resolve_timeout(timeout, explicit_timeout, self.finder.default_timeout)
+        condition = BatchRead(locator_tuples, attr, all, root=self.finder.root_element, contexts=self.finder.contexts)
+        logger.info('%s, timeout: %s sec', condition, t)
+        try:
+            values = await self.finder.wait(t).until(condition)
+        except FailureConditionMet:
+            raise
+        except TimeoutException as e:
+            raise TimeoutException(f'{condition.missing} not found in {t} sec', e.screen, e.stacktrace)
+        return dict(zip(keys, values)) if keys is not None else values
+
+    @action
+    async def execute_js(self, js_script: str) -> str:
+        if logger.isEnabledFor(logging.DEBUG): logger.debug('execute js\n%s', js_script)
+        else: logger.info('execute js %.80r', js_script)
+        await self.run(self.finder.contexts.top)
+        return str(await self.run(self.webdriver.execute_script, js_script))
+
+    @action
+    async def hover(self, locator_tuple: tuple,
+                    timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> None:
+        logger.info('hover element %s', locator_tuple)
+        element = await self.finder.find_element(locator_tuple, timeout=timeout, explicit_timeout=explicit_timeout)
+        await self.run(lambda: ActionChains(self.webdriver).move_to_element(element).perform())
+        if sleep_after: await self.__after_action()
+
+    async def settle_page(self, max_sec: float = None) -> float:
+        """ see Actions.settle_page """
+        budget = max_sec if max_sec is not None else self.wait_between_sec
+        if not budget: return 0.0
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+        with waiting('sleep'):
+            try:
+                await self.run(self.finder.contexts.top)
+                result = await self.run(self.webdriver.execute_async_script,
+                                        scripts.SETTLE, int(budget * 1000), self.settle_quiet_frames)
+            except WebDriverException as e:
+                logger.info('settle failed (%s), sleep %s sec', e.__class__.__name__, budget)
+                await asyncio.sleep(budget)
+                result = None
+        spent = loop.time() - begin
+        self.settle_stats.add(spent, budget, result)
+        self.requests.settled(result)
+        logger.info('settle took %s sec (max %s sec)', round(spent, 3), budget)
+        return spent
+
+    async def __after_action(self) -> None:
+        if self.settle:
+            await self.settle_page()
+        else:
+            await self.sleep()
+
+    async def sleep(self, sec: int = None):
+        """ awaitable delay in sec, see Actions.sleep """
+        seconds = sec if sec else self.wait_between_sec
+        logger.info('sleep %s sec', seconds)
+        with waiting('sleep'):
+            await asyncio.sleep(seconds)
+
+
+class AsyncPage(Page):
+    """
+    Page counterpart for AsyncActions, public coroutine methods of subclasses are Page steps too.
+
+    Example usage:
+        class SasKodzi(AsyncPage):
+            url = 'https://saskodzi.pl'
+
+            async def goto_posts(self) -> None:
+                await self.actions.click(self.BLOG_BUTTON)
+
+        page = SasKodzi(actions)
+        await page.open()
+        title = await page.title
+    """
+    def __init__(self, actions: AsyncActions):
+        super().__init__(actions)
+
+    @property
+    def title(self):
+        """ awaitable page title """
+        return self.actions.run(lambda: self.actions.webdriver.title)
+
+    async def open(self, url: str = None, reuse: str = None):
+        uri = url or self.url
+        actions, navigation = self.actions, self.actions.navigation
+        begin = perf_counter()
+        await actions.run(navigation.block, actions.webdriver, self.blocking)
+        how = await actions.goto(uri, reuse=reuse or self.reuse)
+        wall = perf_counter() - begin
+        timing = await actions.run(navigation.timing, actions.webdriver) \
+            if navigation.measure and how != 'skip' else None
+        self._opened(navigation.record(type(self).__name__, uri, how, wall, timing))
@@ -0,0 +1,270 @@
+"""
+Benchmark harness:
+
+Runs Actions / FluentFinder / Page scenarios against FakeWebDriver (configurable command latency
+and element appearance delays) and produces machine-readable report with per-action (and per Page method) p50/p95/p99,
+time lost to waits and sleeps and WebDriver command counts.
+Report can be compared against stored baseline, regressions fail the run.
+
+Example usage:
+    from seleniumactions.benchmark import Benchmark
+
+    benchmark = Benchmark(latency=0.002, runs=10)
+
+    @benchmark.scenario('login', setup=lambda browser: browser.add_element(('id', 'login'), appear_after=0.1))
+    def login(actions):
+        actions.click(('id', 'login'))
+
+    report = benchmark.run()
+    regressions = compare(report, load_report('baseline.json'))
+
+Command line (built-in scenarios, plus import time of the package measured in fresh interpreters):
+    python -m seleniumactions.benchmark --output report.json
+    python -m seleniumactions.benchmark --baseline baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from collections import Counter
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from seleniumactions.actions import Actions
+from seleniumactions.elements import FluentFinder
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.pages import Page
+from seleniumactions.stats import summary
+from seleniumactions.testing.fakes import FakeBrowser, FakeWebDriver
+
+
+TIMEOUTS = {"short": 1, "medium": 2, "long": 5, "absurd": 10}
+
+
+def import_time(statement: str = 'import seleniumactions', runs: int = 5) -> dict:
+    """ summary of seconds statement takes in fresh interpreter (interpreter startup excluded) """
+    code = f'from time import perf_counter; begin = perf_counter(); {statement}; print(perf_counter() - begin)'
+    values = [float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+              for _ in range(runs)]
+    return summary(values)
+
+
+class Scenario:
+    """ Benchmarked flow: run(actions) called on fresh fake browser prepared by setup(browser) """
+    def __init__(self, name: str, run: Callable[[Actions], None],
+                 setup: Callable[[FakeBrowser], None] = None) -> None:
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+class Benchmark:
+    """
+    Runs scenarios and builds report
+
+    latency: simulated WebDriver command round-trip in seconds
+    runs: runs per scenario
+    finder_factory: callable(driver) -> Finder, FluentFinder with default_timeout 2 sec by default
+    actions_options: extra Actions kwargs (wait_between, settle ...)
+    """
+    def __init__(self, latency: float = 0.001, runs: int = 5,
+                 finder_factory: Callable = None, actions_options: dict = None) -> None:
+        self.latency = latency
+        self.runs = runs
+        self.finder_factory = finder_factory or (
+            lambda driver: FluentFinder(driver, timeouts=TIMEOUTS, default_timeout=TIMEOUTS['medium']))
+        self.actions_options = actions_options or {}
+        self.scenarios: List[Scenario] = []
+
+    def scenario(self, name: str, setup: Callable[[FakeBrowser], None] = None) -> Callable:
+        """ decorator registering scenario function run(actions) """
+        def register(run: Callable[[Actions], None]):
+            self.add(Scenario(name, run, setup))
+            return run
+        return register
+
+    def add(self, scenario: Scenario) -> None:
+        self.scenarios.append(scenario)
+
+    def run(self) -> dict:
+        sink = instrumentation.add_sink(MemorySink())
+        commands = Counter()
+        durations: Dict[str, List[float]] = {}
+        try:
+            for scenario in self.scenarios:
+                for _ in range(self.runs):
+                    driver = FakeWebDriver(latency=self.latency)
+                    if scenario.setup: scenario.setup(driver.browser)
+                    actions = Actions(self.finder_factory(driver), wait_for_condition_timeout=TIMEOUTS['long'],
+                                      **self.actions_options)
+                    before = Counter(driver.command_executor.commands)
+                    begin = perf_counter()
+                    with instrumentation.span(scenario.name):
+                        scenario.run(actions)
+                    durations.setdefault(scenario.name, []).append(perf_counter() - begin)
+                    commands.update(driver.command_executor.commands - before)
+        finally:
+            instrumentation.remove_sink(sink)
+        return self.__report(sink.spans, durations, commands)
+
+    def __report(self, spans: list, durations: Dict[str, List[float]], commands: Counter) -> dict:
+        names = {scenario.name for scenario in self.scenarios}
+        scenario_spans = {span.id for span in spans if span.parent is None and span.method in names}
+
+        def is_page_step(span) -> bool:
+            return '.' in span.method
+
+        def in_scenario(span) -> bool:
+            while span.parent is not None: span = span.parent
+            return span.id in scenario_spans
+
+        def is_step(span) -> bool:
+            return span.parent.id in scenario_spans or is_page_step(span.parent)
+
+        pages = [span for span in spans if span.parent is not None and is_page_step(span) and in_scenario(span)]
+        steps = [span for span in spans
+                 if span.parent is not None and not is_page_step(span) and is_step(span) and in_scenario(span)]
+        by_method: Dict[str, list] = {}
+        for span in steps:
+            by_method.setdefault(span.method, []).append(span)
+        by_page: Dict[str, list] = {}
+        for span in pages:
+            by_page.setdefault(span.method, []).append(span.duration)
+        return {
+            'meta': {
+                'latency': self.latency,
+                'runs': self.runs,
+                'python': platform.python_version()
+            },
+            'scenarios': {name: summary(values) for name, values in durations.items()},
+            'actions': {
+                method: dict(summary([s.duration for s in group]),
+                             wait=sum(s.wait for s in group), sleep=sum(s.sleep for s in group),
+                             errors=sum(1 for s in group if not s.ok))
+                for method, group in sorted(by_method.items())
+            },
+            'pages': {method: summary(values) for method, values in sorted(by_page.items())},
+            'wait_seconds': sum(span.wait for span in steps),
+            'sleep_seconds': sum(span.sleep for span in steps),
+            'commands': dict(sorted(commands.items())),
+            'command_count': sum(commands.values())
+        }
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.2, min_delta: float = 0.005) -> List[str]:
+    """
+    Regressions of report against baseline (empty list when there are none):
+    - scenario / action p95 slower than baseline by more than tolerance (fraction) and min_delta (seconds)
+    - more WebDriver commands than baseline by more than tolerance
+    - package import p95 slower than baseline (when both reports have it)
+    """
+    regressions = []
+
+    def check(kind: str, name: str, current: float, previous: float, delta: float) -> None:
+        if current > previous * (1 + tolerance) and current - previous > delta:
+            regressions.append(f'{kind} {name}: {round(current, 4)} > baseline {round(previous, 4)}')
+
+    for kind in ('scenarios', 'actions', 'pages'):
+        for name, stats in report.get(kind, {}).items():
+            if name in baseline.get(kind, {}):
+                check(f'{kind[:-1]} p95', name, stats['p95'], baseline[kind][name]['p95'], min_delta)
+    if 'import' in report and 'import' in baseline:
+        check('import p95', 'seleniumactions', report['import']['p95'], baseline['import']['p95'], min_delta)
+    if 'command_count' in baseline:
+        check('commands', 'total', report['command_count'], baseline['command_count'], 0)
+    return regressions
+
+
+class _BenchmarkPage(Page):
+    url = 'https://bench.local/form'
+
+    EMAIL = ('name', 'email')
+    PASSWORD = ('name', 'password')
+    SUBMIT = ('xpath', '//button[@type="submit"]')
+    WELCOME = ('id', 'welcome')
+
+    def login(self, email: str, password: str) -> str:
+        self.actions.type_text(self.EMAIL, email)
+        self.actions.type_text(self.PASSWORD, password, text_mask='***')
+        self.actions.click(self.SUBMIT)
+        return self.actions.get_text(self.WELCOME)
+
+
+def default_benchmark(latency: float = 0.001, runs: int = 5, actions_options: dict = None) -> Benchmark:
+    """ built-in scenarios covering Actions, FluentFinder and Page flows """
+    benchmark = Benchmark(latency=latency, runs=runs, actions_options=actions_options)
+
+    def page_setup(browser: FakeBrowser) -> None:
+        browser.add_element(_BenchmarkPage.EMAIL, url=_BenchmarkPage.url)
+        browser.add_element(_BenchmarkPage.PASSWORD, url=_BenchmarkPage.url)
+        browser.add_element(_BenchmarkPage.SUBMIT, url=_BenchmarkPage.url, appear_after=0.05)
+        browser.add_element(_BenchmarkPage.WELCOME, text='Welcome', url=_BenchmarkPage.url, appear_after=0.1)
+
+    @benchmark.scenario('page_login', setup=page_setup)
+    def page_login(actions: Actions) -> None:
+        page = _BenchmarkPage(actions)
+        page.open()
+        page.login('jimmy@choo.io', 'secret')
+
+    def late_elements(browser: FakeBrowser) -> None:
+        for i, delay in enumerate((0, 0.02, 0.2)):
+            browser.add_element(('id', f'late-{i}'), appear_after=delay)
+
+    @benchmark.scenario('finder_late_elements', setup=late_elements)
+    def finder_late_elements(actions: Actions) -> None:
+        for i in range(3):
+            actions.finder.find_element(('id', f'late-{i}'))
+
+    def table(browser: FakeBrowser) -> None:
+        for i in range(50):
+            browser.add_element(('css selector', 'td'), text=f'cell {i}')
+
+    @benchmark.scenario('table_reads', setup=table)
+    def table_reads(actions: Actions) -> None:
+        actions.get_all_texts(('css selector', 'td'))
+        for element in actions.finder.find_elements(('css selector', 'td'))[:10]:
+            element.text
+
+    return benchmark
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='seleniumactions benchmark against fake WebDriver')
+    parser.add_argument('--latency', type=float, default=0.001, help='command round-trip in seconds')
+    parser.add_argument('--runs', type=int, default=5, help='runs per scenario')
+    parser.add_argument('--wait-between', type=float, default=0, help='Actions wait_between in seconds')
+    parser.add_argument('--settle', action='store_true', help='Actions settle mode')
+    parser.add_argument('--output', help='write report to file (stdout by default)')
+    parser.add_argument('--baseline', help='baseline report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown fraction')
+    parser.add_argument('--import-runs', type=int, default=5, help='fresh interpreter imports measured (0 - skip)')
+    args = parser.parse_args(argv)
+
+    options = {'wait_between': args.wait_between, 'settle': args.settle}
+    report = default_benchmark(args.latency, args.runs, options).run()
+    if args.import_runs: report['import'] = import_time(runs=args.import_runs)
+    if args.output:
+        save_report(report, args.output)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
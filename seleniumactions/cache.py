@@ -0,0 +1,115 @@
+"""
+Element handle cache:
+
+Opt-in cache of found WebElements for FluentFinder, keyed by locator tuple.
+Handles are kept across clicks and typing - only single elements are cached, lists can change without
+their elements going stale, they are always queried.
+Cached element is returned after a cheap liveness check (one tag name command instead of a find under wait,
+catches nodes detached by a click or typing), entries are evicted on StaleElementReferenceException,
+navigation (Actions.goto), size and TTL limits.
+
+Example usage:
+    from seleniumactions import FluentFinder
+    from seleniumactions.cache import ElementCache
+
+    cache = ElementCache(max_size=256, ttl=30)
+    finder = FluentFinder(driver, timeouts=timeouts, default_timeout=3, element_cache=cache)
+    ...
+    cache.stats()  # -> {'hits': 120, 'misses': 40, 'stale': 3, 'expired': 0, 'evicted': 0, 'size': 37}
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from selenium.common.exceptions import WebDriverException
+
+from seleniumactions.locators import locator_key
+
+
+class ElementCache:
+    """
+    LRU cache of WebElements per locator key
+
+    max_size: max cached locators
+    ttl: seconds after which entry expires (None - no expiry)
+    verify: check cached element is alive before returning it (one WebDriver command),
+            without it hits cost no commands but stale elements are detected only when used
+    """
+    def __init__(self, max_size: int = 128, ttl: float = 30, verify: bool = True) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.verify = verify
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.expired = 0
+        self.evicted = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """ cached value or None """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                    del self.__entries[key]
+                    self.expired += 1
+                    entry = None
+                else:
+                    self.__entries.move_to_end(key)
+            if entry is None:
+                self.misses += 1
+                return None
+        if self.verify and not self.__alive(value):
+            self.evict(key)
+            with self.__lock:
+                self.stale += 1
+                self.misses += 1
+            return None
+        with self.__lock:
+            self.hits += 1
+        return value
+
+    def put(self, key: tuple, value) -> None:
+        with self.__lock:
+            self.__entries[key] = (value, time.monotonic())
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evicted += 1
+
+    def evict(self, key: tuple) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def evict_locator(self, locator_tuple: tuple) -> None:
+        """ evict entry of locator tuple """
+        self.evict(locator_key(locator_tuple))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {'hits': self.hits, 'misses': self.misses, 'stale': self.stale,
+                    'expired': self.expired, 'evicted': self.evicted, 'size': len(self.__entries)}
+
+    @staticmethod
+    def __alive(element) -> bool:
+        try:
+            element.tag_name
+            return True
+        except WebDriverException:
+            return False
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __str__(self):
+        return f'element cache -> {self.stats()}'
+
+    def __repr__(self):
+        return self.__str__()
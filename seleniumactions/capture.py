@@ -0,0 +1,239 @@
+"""
+Diagnostic capture:
+
+Capture grabs screenshot and DOM snapshot when Actions step fails (and optionally on every N-th step).
+Session is blocked only for fetching raw payload (base64 screenshot, page source) - decoding, compression,
+hashing and disk writes run on background worker pool.
+Files are content addressed (sha1), identical snapshots are written once, and directory is kept
+under max_bytes by evicting oldest files. index.jsonl has one line per capture (step, error, files),
+lines of captures whose files were all evicted are dropped from it on eviction.
+Capture never fails a step nor masks its error - fetch / capture failures are only counted (fetch_errors).
+With finder contexts given driver is switched to top document first, so the whole page is captured
+after steps inside iframes.
+
+Example usage:
+    from seleniumactions.capture import Capture
+
+    capture = Capture('artifacts/captures', every=20, max_bytes=200 * 2 ** 20)
+    actions = Actions(finder, wait_for_condition_timeout=15, capture=capture)
+    ...
+    capture.close()  # waits for pending writes
+    capture.stats  # -> {'captured': 3, 'written': 4, 'deduped': 2, 'evicted': 0, 'fetch_seconds': 0.41, ...}
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions.contexts import Contexts
+
+
+class Snapshot:
+    """ Raw payload fetched from browser, files are set by worker once written """
+    __slots__ = ('step', 'reason', 'error', 'url', 'timestamp', 'screenshot', 'dom', 'files')
+
+    def __init__(self, step: str, reason: str, error: str = None) -> None:
+        self.step = step
+        self.reason = reason
+        self.error = error
+        self.url = None
+        self.timestamp = time.time()
+        self.screenshot: str = None
+        self.dom: str = None
+        self.files: List[str] = []
+
+    def to_dict(self) -> dict:
+        return {'step': self.step, 'reason': self.reason, 'error': self.error, 'url': self.url,
+                'timestamp': self.timestamp, 'files': self.files}
+
+    def __str__(self):
+        return f'snapshot of {self.step} ({self.reason})'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Capture:
+    """
+    Failure / diagnostic capture for Actions (see module docs)
+
+    directory: where files and index.jsonl are written
+    every: capture also every N-th successful step (0 - failures only)
+    screenshot / dom: what to fetch
+    workers: background writer threads
+    max_bytes: retention limit of files in directory, oldest are evicted first
+    compress: gzip DOM snapshots
+    """
+    index_name = 'index.jsonl'
+
+    def __init__(self, directory: str, every: int = 0, screenshot: bool = True, dom: bool = True,
+                 workers: int = 2, max_bytes: int = 100 * 2 ** 20, compress: bool = True) -> None:
+        if every < 0: raise ValueError(f'every has to be >= 0, got: {every}')
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.every = every
+        self.screenshot = screenshot
+        self.dom = dom
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.stats = {'captured': 0, 'written': 0, 'deduped': 0, 'evicted': 0, 'fetch_errors': 0,
+                      'fetch_seconds': 0.0, 'bytes': 0}
+        self.__steps = 0
+        self.__files = self.__existing()
+        self.stats['bytes'] = sum(self.__files.values())
+        self.__lock = threading.Lock()
+        self.__pending: List[Future] = []
+        self.__pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='seleniumactions-capture')
+
+    def failure(self, driver: WebDriver, step: str, error: BaseException, contexts: Contexts = None) -> Snapshot:
+        """ capture failed step (once per exception - outer steps re-raising it are skipped) """
+        if getattr(error, '_seleniumactions_captured', False): return None
+        try:
+            error._seleniumactions_captured = True
+        except AttributeError:
+            pass
+        return self.__safe_take(driver, step, 'failure', f'{type(error).__name__}: {error}', contexts)
+
+    def step(self, driver: WebDriver, step: str, contexts: Contexts = None) -> Snapshot:
+        """ count successful step, capture every N-th one """
+        if not self.every: return None
+        with self.__lock:
+            self.__steps += 1
+            due = self.__steps % self.every == 0
+        return self.__safe_take(driver, step, 'step', contexts=contexts) if due else None
+
+    def take(self, driver: WebDriver, step: str, reason: str = 'manual', error: str = None,
+             contexts: Contexts = None) -> Snapshot:
+        """ fetch raw payload (blocks session), hand the rest to worker pool (contexts - switch to top document) """
+        snapshot = Snapshot(step, reason, error)
+        begin = perf_counter()
+        try:
+            if contexts is not None: contexts.top()
+            snapshot.url = driver.current_url
+            if self.screenshot: snapshot.screenshot = driver.get_screenshot_as_base64()
+            if self.dom: snapshot.dom = driver.page_source
+        except Exception:  # dead session can fail in the HTTP layer too, capture must not mask step error
+            with self.__lock:
+                self.stats['fetch_errors'] += 1
+        with self.__lock:
+            self.stats['fetch_seconds'] += perf_counter() - begin
+            self.__pending = [future for future in self.__pending if not future.done()]
+            self.__pending.append(self.__pool.submit(self.__write, snapshot))
+            self.stats['captured'] += 1
+        return snapshot
+
+    def __safe_take(self, driver: WebDriver, step: str, reason: str, error: str = None,
+                    contexts: Contexts = None) -> Snapshot:
+        """ take called from Actions steps - never raises (closed capture, ...), failures are counted """
+        try:
+            return self.take(driver, step, reason, error, contexts)
+        except Exception:
+            with self.__lock:
+                self.stats['fetch_errors'] += 1
+            return None
+
+    def flush(self) -> None:
+        """ wait for pending writes """
+        with self.__lock:
+            pending, self.__pending = self.__pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        self.flush()
+        self.__pool.shutdown(wait=True)
+
+    def __write(self, snapshot: Snapshot) -> Snapshot:
+        if snapshot.screenshot is not None:
+            snapshot.files.append(self.__store(base64.b64decode(snapshot.screenshot), '.png'))
+            snapshot.screenshot = None
+        if snapshot.dom is not None:
+            content = snapshot.dom.encode('utf-8')
+            snapshot.files.append(self.__store(content, '.html.gz' if self.compress else '.html'))
+            snapshot.dom = None
+        line = json.dumps(snapshot.to_dict(), default=str)
+        with self.__lock:
+            with open(os.path.join(self.directory, self.index_name), 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        return snapshot
+
+    def __store(self, content: bytes, suffix: str) -> str:
+        """ write content under its hash (once), returns file name """
+        name = hashlib.sha1(content).hexdigest() + suffix
+        with self.__lock:
+            if name in self.__files:
+                self.__files.move_to_end(name)
+                self.stats['deduped'] += 1
+                return name
+            self.__files[name] = 0  # reserved, other worker with the same content dedupes
+        if suffix.endswith('.gz'): content = gzip.compress(content, compresslevel=6)
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(content)
+        with self.__lock:
+            self.stats['written'] += 1
+            if name not in self.__files:  # evicted while being written
+                self.__remove(name)
+                return name
+            self.__files[name] = len(content)
+            self.stats['bytes'] += len(content)
+            self.__evict()
+        return name
+
+    def __evict(self) -> None:
+        evicted = self.stats['evicted']
+        while self.stats['bytes'] > self.max_bytes and len(self.__files) > 1:
+            name, size = self.__files.popitem(last=False)
+            self.__remove(name)
+            self.stats['bytes'] -= size
+            self.stats['evicted'] += 1
+        if self.stats['evicted'] != evicted: self.__trim_index()
+
+    def __trim_index(self) -> None:
+        """ rewrite index without captures whose files are all gone (called with lock held) """
+        path = os.path.join(self.directory, self.index_name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        kept = [line for line in lines if any(name in self.__files for name in self.__index_files(line))]
+        if len(kept) == len(lines): return
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.writelines(kept)
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def __index_files(line: str) -> List[str]:
+        try:
+            return json.loads(line).get('files') or []
+        except ValueError:
+            return []
+
+    def __remove(self, name: str) -> None:
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def __existing(self) -> 'OrderedDict[str, int]':
+        """ files left by previous runs, oldest first (they count into retention limit) """
+        paths = [entry for entry in os.scandir(self.directory)
+                 if entry.is_file() if not entry.name.startswith(self.index_name)]
+        paths.sort(key=lambda entry: entry.stat().st_mtime)
+        return OrderedDict((entry.name, entry.stat().st_size) for entry in paths)
+
+    def __enter__(self) -> 'Capture':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,172 @@
+"""
+WebDriver command counting:
+
+CommandCounter wraps driver command executor and counts WebDriver commands (HTTP round-trips)
+per Actions method and per Page method, request / response bytes are measured with count_bytes=True
+(one JSON serialization of every request and response, off by default).
+Optional CommandBudget warns or fails when a step makes more round-trips than allowed.
+
+Example usage:
+    from seleniumactions import FluentFinder, Actions
+    from seleniumactions.commands import CommandCounter, CommandBudget
+
+    counter = CommandCounter(budget=CommandBudget(limit=5, fail=False, limits={"LoginPage.login": 30}),
+                             count_bytes=True)
+    finder = FluentFinder(driver, timeouts=timeouts, default_timeout=3, command_counter=counter)
+    actions = Actions(finder, wait_for_condition_timeout=15)
+    ...
+    counter.stats["click"]  # -> {'calls': 10, 'commands': 24, 'bytes_sent': ..., 'bytes_received': ..., 'max': 4}
+    counter.worst()  # steps with most commands per call
+"""
+import json
+import threading
+import warnings
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CommandBudgetWarning(UserWarning):
+    """ Step made more WebDriver commands than budget allows """
+
+
+class CommandBudgetExceeded(Exception):
+    """ Step made more WebDriver commands than budget allows (fail mode) """
+
+
+class CommandBudget:
+    """
+    Max WebDriver commands per step
+
+    limit: default limit for Actions methods (None - no default limit)
+    fail: raise CommandBudgetExceeded (True) or emit CommandBudgetWarning (False)
+    limits: per step name limits, ex: {"click": 3, "LoginPage.login": 30} (Page methods are checked only when listed)
+    """
+    def __init__(self, limit: int = None, fail: bool = False, limits: Dict[str, int] = None) -> None:
+        self.limit = limit
+        self.fail = fail
+        self.limits = dict(limits or {})
+
+    def limit_for(self, scope: 'CommandScope'):
+        if scope.name in self.limits: return self.limits[scope.name]
+        return self.limit if scope.kind == 'action' else None
+
+    def check(self, scope: 'CommandScope') -> None:
+        limit = self.limit_for(scope)
+        if limit is None or scope.commands <= limit: return
+        message = f'{scope.name} made {scope.commands} WebDriver commands, budget is {limit}: ' \
+                  f'{dict(scope.by_command)}'
+        if self.fail: raise CommandBudgetExceeded(message)
+        warnings.warn(message, CommandBudgetWarning, stacklevel=4)
+
+
+class CommandScope:
+    """ Commands counted during single step (Actions or Page method call) """
+    __slots__ = ('name', 'kind', 'commands', 'bytes_sent', 'bytes_received', 'by_command')
+
+    def __init__(self, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.commands = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.by_command = Counter()
+
+
+_scopes: ContextVar = ContextVar('seleniumactions_command_scopes', default=())
+
+
+class _ScopeContext:
+    __slots__ = ('counter', 'scope', 'token')
+
+    def __init__(self, counter: 'CommandCounter', scope: CommandScope) -> None:
+        self.counter = counter
+        self.scope = scope
+
+    def __enter__(self) -> CommandScope:
+        self.token = _scopes.set(_scopes.get() + (self.scope,))
+        return self.scope
+
+    def __exit__(self, exc_type, exc, tb):
+        _scopes.reset(self.token)
+        self.counter.finish(self.scope)
+        if exc_type is None and self.counter.budget is not None: self.counter.budget.check(self.scope)
+        return False
+
+
+class CountingExecutor:
+    """ Command executor proxy counting commands of wrapped executor """
+    def __init__(self, executor, counter: 'CommandCounter') -> None:
+        self.executor = executor
+        self.counter = counter
+
+    def execute(self, command: str, params: dict):
+        sent = len(json.dumps(params, default=str)) if self.counter.count_bytes else 0
+        response = self.executor.execute(command, params)
+        received = len(json.dumps(response, default=str)) if self.counter.count_bytes and response else 0
+        self.counter.record(command, sent, received)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.executor, name)
+
+
+class CommandCounter:
+    """
+    Counts WebDriver commands per step (Actions / Page method name)
+
+    budget: optional CommandBudget checked after each step
+    count_bytes: measure JSON size of requests and responses (serializes each of them, bytes are 0 without it)
+    """
+    def __init__(self, budget: CommandBudget = None, count_bytes: bool = False) -> None:
+        self.budget = budget
+        self.count_bytes = count_bytes
+        self.total = Counter()
+        self.stats: Dict[str, dict] = {}
+        self.__lock = threading.Lock()
+
+    def install(self, driver: WebDriver) -> WebDriver:
+        """ wrap driver command executor (once) """
+        executor = driver.command_executor
+        if isinstance(executor, CountingExecutor):
+            executor.counter = self
+        else:
+            driver.command_executor = CountingExecutor(executor, self)
+        return driver
+
+    def scope(self, name: str, kind: str = 'action') -> _ScopeContext:
+        """ context manager counting commands of a step """
+        return _ScopeContext(self, CommandScope(name, kind))
+
+    def record(self, command: str, sent: int, received: int) -> None:
+        with self.__lock:
+            self.total[command] += 1
+        for scope in _scopes.get():
+            scope.commands += 1
+            scope.bytes_sent += sent
+            scope.bytes_received += received
+            scope.by_command[command] += 1
+
+    def finish(self, scope: CommandScope) -> None:
+        with self.__lock:
+            stats = self.stats.setdefault(scope.name, {
+                'kind': scope.kind, 'calls': 0, 'commands': 0, 'bytes_sent': 0, 'bytes_received': 0, 'max': 0
+            })
+            stats['calls'] += 1
+            stats['commands'] += scope.commands
+            stats['bytes_sent'] += scope.bytes_sent
+            stats['bytes_received'] += scope.bytes_received
+            stats['max'] = max(stats['max'], scope.commands)
+
+    def worst(self, n: int = 10) -> List[tuple]:
+        """ [(step name, commands per call)] sorted by commands per call, chattiest first """
+        with self.__lock:
+            per_call = [(name, s['commands'] / s['calls']) for name, s in self.stats.items() if s['calls']]
+        return sorted(per_call, key=lambda item: item[1], reverse=True)[:n]
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.total = Counter()
+            self.stats = {}
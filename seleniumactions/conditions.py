@@ -3,15 +3,62 @@ Expected conditions:
 
 To implement your own expected condition, selenium expects from you object with a __call__ implementation.
 Its good to remembet that selenium allways pasess WebDriver instance into __call__ method :)
+
+Composable conditions (Condition subclasses) are compiled into single browser-side evaluation
+(scripts.EVALUATE), so whole expression costs one WebDriver call per poll:
+    condition = all_of(absent(SPINNER), present(TABLE), count(ROWS, at_least=10))
+    condition = ~present(SPINNER) & (text_is(STATUS, 'Done') | attribute_is(BAR, 'aria-valuenow', '100'))
+    actions.wait_for(condition)  # on timeout message lists sub-conditions which are still unmet
+Text / attribute 'matches' mode uses JavaScript RegExp syntax.
+Condition on LocatorPath locators is evaluated in their frame / shadow root (finder contexts, see Actions.wait_for),
+all locators of one expression have to share the context.
 """
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, List
+
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from seleniumactions import scripts
+from seleniumactions.contexts import Contexts
+from seleniumactions.locators import LocatorPath, context_of
+
+_SHADOW_ROOT_KEY = 'shadow-6066-11e4-a52e-4f735466cecf'
+
+
+def _locator(locator_tuple: tuple) -> tuple:
+    """ plain tuple of locator, LocatorPath is kept with its context """
+    return locator_tuple if isinstance(locator_tuple, LocatorPath) else tuple(locator_tuple)
+
+
+def _shared_context(contexts: Iterable[tuple]) -> tuple:
+    """ context shared by all locators (single script runs in one document), ValueError when they differ """
+    contexts = set(contexts)
+    if len(contexts) > 1: raise ValueError(f'Locators have to share frame / shadow root context, got: {contexts}')
+    return contexts.pop() if contexts else ()
+
+
+def _script_root(context: tuple, root: Callable[[], WebElement] = None, contexts: Contexts = None):
+    """
+    root argument of page scripts for locators in context: root() in top document (None - whole document),
+    frame document (None) / shadow root entered with finder contexts for LocatorPath context
+    """
+    if not context:
+        if root is not None: return root()
+        if contexts is not None: contexts.top()
+        return None
+    if contexts is None: raise ValueError(f'Locator context {context} is resolved with finder contexts, use Actions')
+    search = contexts.enter(context)
+    if search is contexts.webdriver: return None
+    # selenium 4.2 ShadowRoot has no .id (script argument wrapping fails), W3C shadow root reference is passed
+    return {_SHADOW_ROOT_KEY: getattr(search, 'id', None) or search._id}
 
 
 class LocatorExists:
     """
-    Wait for Locator to exist
+    Wait for Locator to exist (in top document - use present(locator) for LocatorPath with context)
     """
     def __init__(self, locator_tuple: tuple):
+        if context_of(locator_tuple): raise ValueError(f'{locator_tuple!r} has context, use present(locator)')
         self.locator_tuple = locator_tuple
 
     # noinspection PyBroadException
@@ -27,3 +74,311 @@ class LocatorExists:
 
     def __repr__(self):
         return self.__str__()
+
+
+class BatchRead:
+    """
+    Read text (attr=None) or attribute of elements for list of locators in single execute_script call.
+    Met when every locator matched an element, returns list of values
+    (list of lists with values of all matched elements when all=True).
+    root: callable returning element to search within (None - whole document), see Finder.root_element
+    contexts: finder contexts resolving LocatorPath context - locators are read with one script per context
+    (frame / shadow root), in top document within root
+    """
+    def __init__(self, locator_tuples: List[tuple], attr: str = None, all: bool = False,
+                 root: Callable[[], WebElement] = None, contexts: Contexts = None):
+        self.locator_tuples = [_locator(locator_tuple) for locator_tuple in locator_tuples]
+        self.attr = attr
+        self.all = all
+        self.root = root
+        self.contexts = contexts
+        self.missing = list(self.locator_tuples)
+        self.__groups = {}
+        for i, locator_tuple in enumerate(self.locator_tuples):
+            self.__groups.setdefault(context_of(locator_tuple), []).append(i)
+
+    def __call__(self, driver: WebDriver):
+        values, missing = [None] * len(self.locator_tuples), []
+        for context, indexes in self.__groups.items():
+            root = _script_root(context, self.root, self.contexts)
+            result = driver.execute_script(scripts.READ, [list(self.locator_tuples[i]) for i in indexes], self.attr,
+                                           self.all, root)
+            for i, value in zip(indexes, result['values']): values[i] = value
+            missing += [indexes[i] for i in result['missing']]
+        self.missing = [self.locator_tuples[i] for i in sorted(missing)]
+        if self.missing: return False
+        return values
+
+    def __str__(self):
+        return f'batch read [{self.attr or "text"}] -> {self.locator_tuples}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class RunSteps:
+    """
+    Run pipeline steps [(op, locator_tuple, arg)] in single execute_script call per check, starting at .position.
+    Steps are not repeated - a check continues where previous one stopped (missing element).
+    Met when all steps ran or one failed (.error), values of executed steps are collected in .results,
+    script executions are counted in .calls. root, contexts: see BatchRead, steps have to share the context
+    """
+    def __init__(self, steps: List[tuple], root: Callable[[], WebElement] = None, contexts: Contexts = None):
+        self.steps = [[op, locator_tuple[0], locator_tuple[1], arg] for op, locator_tuple, arg in steps]
+        self.context = _shared_context(context_of(locator_tuple) for _, locator_tuple, _ in steps)
+        self.root = root
+        self.contexts = contexts
+        self.position = 0
+        self.results = []
+        self.error = None
+        self.calls = 0
+
+    def __call__(self, driver: WebDriver):
+        self.calls += 1
+        root = _script_root(self.context, self.root, self.contexts)
+        result = driver.execute_script(scripts.PIPELINE, self.steps, self.position, root)
+        self.results += result['results']
+        self.position = result['next']
+        self.error = result['error']
+        return self.error is not None or self.position == len(self.steps)
+
+    @property
+    def missing(self) -> tuple:
+        return tuple(self.steps[self.position][1:3]) if self.position < len(self.steps) else None
+
+    def __str__(self):
+        return f'run steps [{", ".join(step[0] for step in self.steps)}]'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Condition(ABC):
+    """
+    Browser-side evaluated condition, compose with all_of / any_of / not_ (or &, |, ~).
+    Only the outermost condition is executed - one execute_script per check.
+    After a check .unmet holds sub-conditions which were not met.
+    root: see BatchRead
+    context: frame / shadow root context of locators (LocatorPath), shared by whole expression
+    bind(root, contexts) gives evaluator with its own root / unmet (Actions.wait_for binds finder root element
+    and contexts), so one condition can be shared by concurrent waits.
+    """
+    def __init__(self, context: tuple = ()) -> None:
+        self.unmet: List['Condition'] = []
+        self.root: Callable[[], WebElement] = None
+        self.context = context
+        self.__compiled = None
+
+    def compile(self, nodes: List['Condition']) -> dict:
+        """ JSON tree for scripts.EVALUATE, nodes get ids (index in nodes) """
+        node = dict(self._node(nodes), id=len(nodes))
+        nodes.append(self)
+        return node
+
+    @abstractmethod
+    def _node(self, nodes: List['Condition']) -> dict:
+        """ JSON node of the condition (children compiled with nodes) """
+
+    def evaluate(self, driver: WebDriver, root: Callable[[], WebElement] = None, contexts: Contexts = None) -> tuple:
+        """ single check -> (met, unmet sub-conditions) """
+        if self.__compiled is None:
+            nodes = []
+            self.__compiled = (self.compile(nodes), nodes)
+        tree, nodes = self.__compiled
+        result = driver.execute_script(scripts.EVALUATE, tree, _script_root(self.context, root, contexts))
+        return result['met'], [nodes[i] for i in result['unmet']]
+
+    def bind(self, root: Callable[[], WebElement] = None, contexts: Contexts = None) -> 'BoundCondition':
+        return BoundCondition(self, root, contexts)
+
+    def __call__(self, driver: WebDriver):
+        met, self.unmet = self.evaluate(driver, self.root)
+        return met
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return all_of(self, other)
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return any_of(self, other)
+
+    def __invert__(self) -> 'Condition':
+        return not_(self)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class BoundCondition:
+    """ Condition evaluated within root (see BatchRead), .unmet of its last check - condition itself is untouched """
+    def __init__(self, condition: Condition, root: Callable[[], WebElement] = None, contexts: Contexts = None) -> None:
+        self.condition = condition
+        self.root = root
+        self.contexts = contexts
+        self.unmet: List[Condition] = []
+
+    def __call__(self, driver: WebDriver):
+        met, self.unmet = self.condition.evaluate(driver, self.root, self.contexts)
+        return met
+
+    def __str__(self):
+        return str(self.condition)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class AllOf(Condition):
+    def __init__(self, conditions: List[Condition]) -> None:
+        super().__init__(_shared_context(c.context for c in conditions))
+        self.conditions = list(conditions)
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        return {'op': 'all', 'args': [c.compile(nodes) for c in self.conditions]}
+
+    def __str__(self):
+        return f'all of ({", ".join(str(c) for c in self.conditions)})'
+
+
+class AnyOf(Condition):
+    def __init__(self, conditions: List[Condition]) -> None:
+        super().__init__(_shared_context(c.context for c in conditions))
+        self.conditions = list(conditions)
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        return {'op': 'any', 'args': [c.compile(nodes) for c in self.conditions]}
+
+    def __str__(self):
+        return f'any of ({", ".join(str(c) for c in self.conditions)})'
+
+
+class Not(Condition):
+    def __init__(self, condition: Condition) -> None:
+        super().__init__(condition.context)
+        self.condition = condition
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        return {'op': 'not', 'arg': self.condition.compile(nodes)}
+
+    def __str__(self):
+        return f'not ({self.condition})'
+
+
+class LocatorCount(Condition):
+    """ number of elements matched by locator in [at_least, at_most] (at_most None - no upper bound) """
+    def __init__(self, locator_tuple: tuple, at_least: int = 1, at_most: int = None) -> None:
+        super().__init__(context_of(locator_tuple))
+        self.locator_tuple = _locator(locator_tuple)
+        self.at_least = at_least
+        self.at_most = at_most
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        using, value = self.locator_tuple
+        return {'op': 'count', 'using': using, 'value': value, 'min': self.at_least, 'max': self.at_most}
+
+    def __str__(self):
+        if self.at_least == 1 and self.at_most is None: return f'present {self.locator_tuple}'
+        if self.at_least == 0 and self.at_most == 0: return f'absent {self.locator_tuple}'
+        if self.at_least == self.at_most: return f'count {self.locator_tuple} == {self.at_least}'
+        upper = f' <= {self.at_most}' if self.at_most is not None else ''
+        return f'count {self.locator_tuple} >= {self.at_least}{upper}'
+
+
+class Matches(Condition):
+    """
+    Text (attr None) or attribute of first element matched by locator
+    mode: is | contains | matches (JavaScript RegExp) | present (attribute is set)
+    """
+    modes = ('is', 'contains', 'matches', 'present')
+
+    def __init__(self, locator_tuple: tuple, expected: str = None, mode: str = 'is', attr: str = None) -> None:
+        super().__init__(context_of(locator_tuple))
+        if mode not in self.modes: raise ValueError(f'Invalid match mode: "{mode}", use {list(self.modes)}')
+        self.locator_tuple = _locator(locator_tuple)
+        self.expected = expected
+        self.mode = mode
+        self.attr = attr
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        using, value = self.locator_tuple
+        node = {'op': 'text', 'using': using, 'value': value, 'mode': self.mode, 'expected': self.expected}
+        if self.attr is not None: node.update(op='attribute', name=self.attr)
+        return node
+
+    def __str__(self):
+        subject = 'text' if self.attr is None else f'[{self.attr}]'
+        expected = f' {self.expected!r}' if self.mode != 'present' else ''
+        return f'{subject} of {self.locator_tuple} {self.mode}{expected}'
+
+
+class Visible(Condition):
+    """ first element matched by locator is displayed (not display:none / visibility:hidden, has layout box) """
+    def __init__(self, locator_tuple: tuple) -> None:
+        super().__init__(context_of(locator_tuple))
+        self.locator_tuple = _locator(locator_tuple)
+
+    def _node(self, nodes: List[Condition]) -> dict:
+        using, value = self.locator_tuple
+        return {'op': 'visible', 'using': using, 'value': value}
+
+    def __str__(self):
+        return f'visible {self.locator_tuple}'
+
+
+def all_of(*conditions: Condition) -> Condition:
+    return AllOf(conditions)
+
+
+def any_of(*conditions: Condition) -> Condition:
+    return AnyOf(conditions)
+
+
+def not_(condition: Condition) -> Condition:
+    return Not(condition)
+
+
+def present(locator_tuple: tuple) -> Condition:
+    return LocatorCount(locator_tuple, 1)
+
+
+def absent(locator_tuple: tuple) -> Condition:
+    return LocatorCount(locator_tuple, 0, 0)
+
+
+def count(locator_tuple: tuple, at_least: int = None, at_most: int = None, exactly: int = None) -> Condition:
+    """ count(ROWS, at_least=10), count(ROWS, exactly=3), count(ERRORS, at_most=0) """
+    if exactly is not None: return LocatorCount(locator_tuple, exactly, exactly)
+    if at_least is None and at_most is None: raise ValueError('count needs at_least, at_most or exactly')
+    return LocatorCount(locator_tuple, at_least or 0, at_most)
+
+
+def visible(locator_tuple: tuple) -> Condition:
+    return Visible(locator_tuple)
+
+
+def text_is(locator_tuple: tuple, text: str) -> Condition:
+    """ trimmed text equals """
+    return Matches(locator_tuple, text, 'is')
+
+
+def text_contains(locator_tuple: tuple, text: str) -> Condition:
+    return Matches(locator_tuple, text, 'contains')
+
+
+def text_matches(locator_tuple: tuple, pattern: str) -> Condition:
+    return Matches(locator_tuple, pattern, 'matches')
+
+
+def attribute_is(locator_tuple: tuple, attr: str, value: str) -> Condition:
+    return Matches(locator_tuple, value, 'is', attr)
+
+
+def attribute_contains(locator_tuple: tuple, attr: str, value: str) -> Condition:
+    return Matches(locator_tuple, value, 'contains', attr)
+
+
+def attribute_matches(locator_tuple: tuple, attr: str, pattern: str) -> Condition:
+    return Matches(locator_tuple, pattern, 'matches', attr)
+
+
+def has_attribute(locator_tuple: tuple, attr: str) -> Condition:
+    return Matches(locator_tuple, None, 'present', attr)
@@ -0,0 +1,164 @@
+"""
+Browsing contexts:
+
+Finder side of LocatorPath (seleniumactions.locators) - elements inside iframes and shadow roots.
+Frame elements and shadow roots located on the way are cached (dropped on navigation or when they go stale),
+frame switch is sent only when lookup targets other frame than the current one - lookups of plain locator
+tuples (and page scripts: batch reads, conditions, pipelines) switch back to top document lazily.
+Driver use outside of Finder (wait_for callables, execute_js, settle, capture, session reset) starts in top document.
+Frame switches done outside of Finder (driver.switch_to ...) are not tracked, call finder.contexts.reset() after them.
+
+stats: switches - frame switch commands sent, skipped - context lookups already in target frame,
+       frame_lookups / shadow_lookups - handles located, hits - handles reused from cache, stale - cache drops
+Switches are also added to active instrumentation span (context_switches attribute).
+
+Example usage:
+    from seleniumactions.locators import LocatorPath, frame, shadow
+
+    EDITOR = frame(('id', 'editor'))
+    SAVE = LocatorPath('css selector', 'button.save', [EDITOR, shadow(('css selector', 'x-toolbar'))])
+    BODY = LocatorPath('css selector', 'body', [EDITOR])
+
+    actions.click(SAVE)  # switch into #editor, toolbar shadow root located and cached
+    actions.type_text(BODY, 'hello')  # same frame - no switch
+    actions.click(('id', 'publish'))  # top document - one switch back
+    finder.contexts.stats  # -> {'switches': 2, 'skipped': 1, 'frame_lookups': 1, 'shadow_lookups': 1, ...}
+"""
+from typing import Callable, Dict, Optional
+
+from selenium.common.exceptions import NoSuchFrameException, StaleElementReferenceException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions.instrumentation import current_span
+from seleniumactions.locators import FRAME, SHADOW, context_of
+
+
+def _gone(error: WebDriverException) -> bool:
+    """ cached frame / shadow root handle is no longer usable """
+    if isinstance(error, (StaleElementReferenceException, NoSuchFrameException)): return True
+    return 'detached shadow root' in str(error)
+
+
+class Contexts:
+    """
+    Current frame and cached frame / shadow root handles of a WebDriver session (shared by finder and its scopes)
+
+    current: frame hops driver is switched to (() - top document, None - unknown)
+    """
+    def __init__(self, webdriver: WebDriver) -> None:
+        self.webdriver = webdriver
+        self.current: Optional[tuple] = ()
+        self.stats = {'switches': 0, 'skipped': 0, 'frame_lookups': 0, 'shadow_lookups': 0, 'hits': 0, 'stale': 0}
+        self.__handles: Dict[tuple, object] = {}
+
+    def find(self, locator_tuple: tuple, all: bool = False):
+        """ element (all - list of elements) located in context of locator tuple, without waiting """
+        using, value = locator_tuple
+        context = context_of(locator_tuple)
+
+        def lookup():
+            search = self.__enter(context)
+            return search.find_elements(using, value) if all else search.find_element(using, value)
+        return self.__retrying(lookup)
+
+    def enter(self, context: tuple):
+        """ switch to frame of context (when not there already), returns search context - WebDriver or shadow root """
+        return self.__retrying(lambda: self.__enter(context))
+
+    def top(self) -> None:
+        """ make sure driver is in top document """
+        if self.current != (): self.__retrying(lambda: self.__switch(()))
+
+    def drop(self) -> None:
+        """ forget cached handles, next lookup starts from top document """
+        self.__handles.clear()
+        self.current = None
+        self.stats['stale'] += 1
+
+    def navigated(self) -> None:
+        """ new document - navigation always lands in top document """
+        self.__handles.clear()
+        self.current = ()
+
+    def reset(self) -> None:
+        """ frame was switched outside of finder """
+        self.__handles.clear()
+        self.current = None
+
+    def __retrying(self, f: Callable):
+        try:
+            return f()
+        except WebDriverException as e:
+            if not _gone(e): raise
+        self.drop()
+        return f()
+
+    def __enter(self, context: tuple):
+        frames = max((i + 1 for i, (kind, _) in enumerate(context) if kind == FRAME), default=0)
+        self.__switch(context[:frames])
+        search = self.webdriver
+        for i in range(frames, len(context)):
+            search = self.__shadow_root(context[:i + 1], search)
+        return search
+
+    def __switch(self, target: tuple) -> None:
+        current = self.current
+        if current == target:
+            if target: self.stats['skipped'] += 1
+            return
+        if current is not None and current[:len(target)] == target:
+            up = self.__frames(current[len(target):])
+            if up < 1 + self.__frames(target):  # cheaper than default content + frames of target
+                for _ in range(up):
+                    self.webdriver.switch_to.parent_frame()
+                    self.__switched()
+                self.current = target
+                return
+        if current is None or target[:len(current)] != current:
+            self.webdriver.switch_to.default_content()
+            self.__switched()
+            self.current = current = ()
+        search = self.webdriver
+        for i in range(len(current), len(target)):
+            kind, locator_tuple = target[i]
+            if kind == SHADOW:
+                search = self.__shadow_root(target[:i + 1], search)
+                continue
+            element = self.__handle(target[:i + 1], 'frame_lookups', lambda: search.find_element(*locator_tuple))
+            self.webdriver.switch_to.frame(element)
+            self.__switched()
+            self.current = target[:i + 1]
+            search = self.webdriver
+
+    @staticmethod
+    def __frames(hops: tuple) -> int:
+        return sum(1 for kind, _ in hops if kind == FRAME)
+
+    def __shadow_root(self, path: tuple, search):
+        def locate():
+            host = search.find_element(*path[-1][1])
+            # WebElement.shadow_root asserts Chromium in selenium 4.2, command itself is W3C
+            return self.webdriver.execute(Command.GET_SHADOW_ROOT, {'id': host.id})['value']
+        return self.__handle(path, 'shadow_lookups', locate)
+
+    def __handle(self, path: tuple, counter: str, locate: Callable):
+        handle = self.__handles.get(path)
+        if handle is not None:
+            self.stats['hits'] += 1
+            return handle
+        handle = locate()
+        self.stats[counter] += 1
+        self.__handles[path] = handle
+        return handle
+
+    def __switched(self) -> None:
+        self.stats['switches'] += 1
+        span = current_span()
+        if span is not None: span.attributes['context_switches'] = span.attributes.get('context_switches', 0) + 1
+
+    def __str__(self):
+        return f'contexts -> current: {self.current}, {self.stats}'
+
+    def __repr__(self):
+        return self.__str__()
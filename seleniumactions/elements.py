@@ -1,131 +1,54 @@
-import logging, sys
-import re
+import logging
+import warnings
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
+from seleniumactions.cache import ElementCache
+from seleniumactions.commands import CommandCounter
+from seleniumactions.conditions import Condition
+from seleniumactions.contexts import Contexts
+from seleniumactions.instrumentation import record_timeout
+from seleniumactions.locators import Locator, LocatorTemplate, ParameterExtractor, Using  # noqa: F401 (re-exported)
+from seleniumactions.locators import LocatorPath, context_of, locator_key
+from seleniumactions.waits import PollingStrategy, FixedPolling, PollingWait
 
 
 flogger = logging.getLogger('FINDER')
-stream_handler = logging.StreamHandler(sys.stdout)
-flogger.addHandler(stream_handler)
-
-
-class Using(object):
-    """ locator types, same as selenium By """
-    ID = "id"
-    NAME = "name"
-    XPATH = "xpath"
-    CLASS = "class name"
-    CSS = "css selector"
-    TAG_NAME = "tag name"
-    LINK_TEXT = "link text"
-    PARTIAL_LINK_TEXT = "partial link text"
-
-
-class ParameterExtractor:
-    """ Extract {param} parameters from str """
-    def __init__(self, text: str) -> None:
-        self.__text = text
-
-    def get_parameters(self) -> List[str]:
-        pattern = r'{\w+}'
-
-        if params := re.findall(pattern, self.__text):
-            return self.__extract_params(params)
-
-        return []
-
-    @staticmethod
-    def __extract_params(params: List[str]) -> List[str]:
-        return [re.sub(r'[{}]', '', param) for param in params]
-
-
-class Locator:
-    """
-    Represents WebElement Locator with some extra goodies
-
-    Example usage:
-    Traditional static locator tuple:
-
-    button = Locator(Using.XPATH, '//button')
-    # get locator tuple:
-    button.get_by()
-
-
-    Goodies:
-    Parameterized locator tuple:
-
-    parameterized_button = Locator(Using.XPATH, '//button[@name="{button_name}"]')
-    foo_by = parameterized_button.get_by(button_name='foo')  # -> ('xpath', '//button[@name="foo"]'
-    bar_by = parameterized_button.get_by(button_name='bar')  # -> ('xpath', '//button[@name="bar"]'
-    # ! parameters in curly brackets must be passed as keyword arguments into get_by method !
-    When forgoten to pass parameters you will get an error:
-    parameterized_button.get_by()
-    >>> ValueError: get_by method is missing keyword arguments: ['button_name']'
-    or
-    >>> ValueError: get_by method is missing keyword argument: button_name
-
-    For more examples head to README.md
-
-    """
-    def __init__(self, using: Using, value: str,
-                 parameter_extractor: ParameterExtractor = None) -> None:
-        self.__using = using
-        self.__value = value
-        self.__parameter_extractor = parameter_extractor or ParameterExtractor(self.__value)
-
-    @property
-    def using(self) -> Using:
-        return self.__using
-
-    @property
-    def value(self) -> str:
-        return self.__value
-
-    @property
-    def parameters(self) -> List[str]:
-        return self.__parameter_extractor.get_parameters()
-
-    @property
-    def is_parameterized(self) -> bool:
-        return len(self.parameters) > 0
-
-    def get_by(self, **kwargs) -> Tuple[str, str]:
-        """ get (by, value) tuple for finding selenium WebElement object """
-        return (self.using, self.__get_value(**kwargs))
-
-    def __get_value(self, **kwargs) -> str:
-        if self.is_parameterized:
-            return self.__parameterize_value(**kwargs)
-        return self.value
-
-    def __parameterize_value(self, **kwargs) -> str:
-        if len(kwargs.keys()) == 0: raise ValueError(f'get_by method is missing keyword arguments: {self.parameters}')
-        self.__validate_parameters(**kwargs)
-        return self.value.format(**kwargs)
-
-    def __validate_parameters(self, **kwargs):
-        for param in self.parameters:
-            if param not in kwargs.keys():
-                raise ValueError(f'get_by method is missing keyword argument: {param}')
 
 
 class Finder(ABC):
     """
     Abstraction for finding WebElements
     Basic implementation in FluentFinder
+
+    polling: PollingStrategy used for waits (seleniumactions.waits), defaults to FixedPolling (0.5 sec)
+    command_counter: CommandCounter (seleniumactions.commands) wrapping webdriver command executor,
+                     counts WebDriver commands per Actions / Page method
+    fail_on: failure conditions added to every wait of the finder (fail-fast waits, see seleniumactions.waits),
+             ex: finder.fail_on = [LocatorExists(("css selector", ".error-toast"))]
+
+    .contexts (seleniumactions.contexts.Contexts) - current frame and cached frame / shadow root handles
+    used for LocatorPath lookups (elements inside iframes / shadow roots), with switch counts in .contexts.stats
+    .generation - document generation, bumped by navigation and by steps that may have changed the document
     """
-    def __init__(self, webdriver: WebDriver, timeouts: dict) -> None:
+    def __init__(self, webdriver: WebDriver, timeouts: dict, polling: PollingStrategy = None,
+                 command_counter: CommandCounter = None) -> None:
+        if command_counter is not None: command_counter.install(webdriver)
         self.__webdriver = webdriver
+        self.__command_counter = command_counter
         for k in timeouts.keys():
             valid_variants = ["short", "medium", "long", "absurd"]
             if k not in valid_variants:
                 raise ValueError(f'Invalid timeout variant {k}, use {valid_variants}')
         self.__timeouts = timeouts
+        self.__scopes = {}
+        self.polling = polling or FixedPolling()
+        self.fail_on = []
+        self.contexts = Contexts(webdriver)
+        self.generation = 0
 
     @property
     def webdriver(self) -> WebDriver:
@@ -135,16 +58,93 @@ class Finder(ABC):
     def timeouts(self) -> dict:
         return self.__timeouts
 
+    @property
+    def command_counter(self) -> CommandCounter:
+        return self.__command_counter
+
+    def resolve_timeout(self, timeout: str = None, explicit_timeout: float = None, default: float = None) -> float:
+        """ timeout in seconds (see timeout_seconds), recorded in current instrumentation span """
+        t = self.timeout_seconds(timeout, explicit_timeout, default)
+        record_timeout(t)
+        return t
+
+    def timeout_seconds(self, timeout: str = None, explicit_timeout: float = None, default: float = None) -> float:
+        """ timeout in seconds: explicit_timeout, else timeouts[timeout] variant, else default """
+        t = default
+        if timeout is not None:
+            try:
+                t = self.timeouts[timeout.lower()]
+            except KeyError:
+                valid_options = list(self.timeouts.keys())
+                raise ValueError(f'Invalid timeout variant: "{timeout}", use {valid_options}')
+        if explicit_timeout is not None: t = explicit_timeout
+        return t
+
+    def navigated(self) -> None:
+        """ called after browser navigation (Actions.goto), drops state bound to previous document """
+        self.contexts.navigated()
+        self.document_changed()
+
+    def document_changed(self) -> None:
+        """ called after step that may have changed the document (mutating Actions steps) """
+        self.generation += 1
+
+    def element_stale(self, locator_tuple: tuple) -> None:
+        """ called when element found by locator turned out to be stale """
+        pass
+
+    def wait(self, timeout: float, polling: PollingStrategy = None, fail_on: List = None) -> PollingWait:
+        """ wait object for given timeout, polling overrides finder polling strategy, fail_on extends finder one """
+        return PollingWait(self.webdriver, timeout, polling or self.polling, fail_on=self.failure_conditions(fail_on))
+
+    def failure_conditions(self, fail_on: List = None) -> List:
+        """ finder failure conditions + per call ones, Conditions on LocatorPath are bound to finder contexts """
+        return [c.bind(c.root, self.contexts) if isinstance(c, Condition) and c.context else c
+                for c in self.fail_on + list(fail_on or ())]
+
+    def root_element(self) -> WebElement:
+        """ element lookups are scoped to (None - whole top document), see ScopedFinder """
+        self.contexts.top()
+        return None
+
+    def presence(self, locator_tuple: tuple, all: bool = False) -> 'Presence':
+        """ wait condition locating element (all - non-empty list of elements) in its frame / shadow root """
+        return Presence(self.contexts, locator_tuple, all)
+
+    def search_context(self):
+        """ WebDriver or root element to run lookups on """
+        root = self.root_element()
+        return self.webdriver if root is None else root
+
+    def scoped(self, root_locator: tuple) -> 'ScopedFinder':
+        """ finder searching within component root element (one ScopedFinder per root locator) """
+        key = locator_key(root_locator)
+        if key not in self.__scopes: self.__scopes[key] = self._new_scope(root_locator)
+        return self.__scopes[key]
+
+    def _new_scope(self, root_locator: tuple) -> 'ScopedFinder':
+        return ScopedFinder(self, root_locator)
+
+    def legacy_condition(self, condition, locator_tuple: tuple):
+        """
+        wait condition for deprecated find_element / find_elements condition argument - expected condition
+        factory (ex: EC.visibility_of_element_located) called with locator tuple, checked in finder search context
+        """
+        warnings.warn('condition argument is deprecated, use polling / fail_on', DeprecationWarning, stacklevel=3)
+        context = context_of(locator_tuple)
+        predicate = condition(tuple(locator_tuple))
+        return lambda driver: predicate(self.contexts.enter(context) if context else self.search_context())
+
     @abstractmethod
     def find_element(self, locator_tuple: tuple,
-                     timeout: str = None, explicit_timeout: int = None,
-                     condition: object = None) -> WebElement:
+                     timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                     polling: PollingStrategy = None, fail_on: List = None) -> WebElement:
         pass
 
     @abstractmethod
     def find_elements(self, locator_tuple: tuple,
-                      timeout: str = None, explicit_timeout: int = None,
-                      condition: object = None) -> List[WebElement]:
+                      timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                      polling: PollingStrategy = None, fail_on: List = None) -> List[WebElement]:
         pass
 
 
@@ -160,32 +160,195 @@ class FluentFinder(Finder):
         "absurd": 20
     }
     finder = FluentFinder(webdriver, timeouts=timeouts)
+
+    Polling strategy (delays between find attempts) can be set per finder or per call:
+    finder = FluentFinder(webdriver, timeouts=timeouts, default_timeout=5, polling=BackoffPolling())
+    finder.find_element(loc, timeout="short", polling=BackoffPolling(immediate=False))
+
+    Failure conditions end the wait early (FailureConditionMet) - per finder (finder.fail_on) or per call:
+    finder.find_element(loc, fail_on=[LocatorExists(("id", "error-500"))])
+
+    Found elements (find_element only) can be cached across steps until navigation (opt-in, see seleniumactions.cache):
+    finder = FluentFinder(webdriver, timeouts=timeouts, default_timeout=5, element_cache=ElementCache())
     """
 
     def __init__(self, webdriver: WebDriver, timeouts: dict,
-                 default_timeout: int) -> None:
-        super().__init__(webdriver, timeouts)
+                 default_timeout: int, polling: PollingStrategy = None,
+                 command_counter: CommandCounter = None, element_cache: ElementCache = None) -> None:
+        super().__init__(webdriver, timeouts, polling, command_counter)
         self.default_timeout = default_timeout
+        self.element_cache = element_cache
+
+    def navigated(self) -> None:
+        super().navigated()
+        if self.element_cache is not None: self.element_cache.clear()
+
+    def element_stale(self, locator_tuple: tuple) -> None:
+        if context_of(locator_tuple): self.contexts.drop()
+        if self.element_cache is not None: self.element_cache.evict_locator(locator_tuple)
 
     def find_element(self, locator_tuple: tuple,
-                     timeout: str = None, explicit_timeout: int = None) -> WebElement:
-        t = self.__get_timeout(timeout, explicit_timeout)
-        con = EC.presence_of_element_located(locator_tuple)
-        flogger.debug(f'find_element: {locator_tuple}, timeout: {t} sec, condition: {con}')
-        return WebDriverWait(self.webdriver, t).until(con)
+                     timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                     polling: PollingStrategy = None, fail_on: List = None) -> WebElement:
+        if condition is not None:
+            con = self.legacy_condition(condition, locator_tuple)
+            return self.wait(self._get_timeout(timeout, explicit_timeout), polling, fail_on).until(con)
+        return self._cached(locator_tuple, lambda: self._find_element(
+            locator_tuple, timeout, explicit_timeout, polling, fail_on))
 
     def find_elements(self, locator_tuple: tuple,
-                      timeout: str = None, explicit_timeout: int = None) -> List[WebElement]:
-        t = self.__get_timeout(timeout, explicit_timeout)
-        con = EC.presence_of_all_elements_located(locator_tuple)
-        flogger.debug(f'find_elements: {locator_tuple}, timeout: {t} sec, condition: {con}')
-        return WebDriverWait(self.webdriver, t).until(con)
-
-    def __get_timeout(self, timeout: str = None, explicit_timeout: int = None):
-        try:
-            t = self.timeouts[timeout.lower()] if timeout is not None else self.default_timeout
-        except KeyError:
-            valid_options = list(self.timeouts.keys())
-            raise ValueError(f'Invalid timeout variant: "{timeout}", use {valid_options}')
-        if explicit_timeout: t = explicit_timeout
-        return t
+                      timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                      polling: PollingStrategy = None, fail_on: List = None) -> List[WebElement]:
+        if condition is not None:
+            con = self.legacy_condition(condition, locator_tuple)
+            return self.wait(self._get_timeout(timeout, explicit_timeout), polling, fail_on).until(con)
+        return self._find_elements(locator_tuple, timeout, explicit_timeout, polling, fail_on)
+
+    def _find_element(self, locator_tuple: tuple, timeout: str, explicit_timeout: int,
+                      polling: PollingStrategy, fail_on: List = None) -> WebElement:
+        t = self._get_timeout(timeout, explicit_timeout)
+        con = self.presence(locator_tuple)
+        flogger.debug('find_element: %s, timeout: %s sec, condition: %s', locator_tuple, t, con)
+        return self.wait(t, polling, fail_on).until(con)
+
+    def _find_elements(self, locator_tuple: tuple, timeout: str, explicit_timeout: int,
+                       polling: PollingStrategy, fail_on: List = None) -> List[WebElement]:
+        t = self._get_timeout(timeout, explicit_timeout)
+        con = self.presence(locator_tuple, all=True)
+        flogger.debug('find_elements: %s, timeout: %s sec, condition: %s', locator_tuple, t, con)
+        return self.wait(t, polling, fail_on).until(con)
+
+    def _cached(self, locator_tuple: tuple, find):
+        if self.element_cache is None: return find()
+        key = locator_key(locator_tuple)
+        self.contexts.enter(context_of(locator_tuple))  # cached element is verified / used in its frame
+        found = self.element_cache.get(key)
+        if found is not None:
+            flogger.debug('cache hit: %s', locator_tuple)
+            return found
+        found = find()
+        self.element_cache.put(key, found)
+        return found
+
+    def _get_timeout(self, timeout: str = None, explicit_timeout: int = None):
+        return self.resolve_timeout(timeout, explicit_timeout or None, self.default_timeout)
+
+
+class ScopedFinder(Finder):
+    """
+    Finder searching relative to component root element, lookups don't scan whole document.
+    Root is located once (with parent finder search context) and cached, it is located again
+    after navigation or when it went stale. XPath locators starting with // are made relative (.//).
+    Scopes nest - finder.scoped(grid).scoped(row).
+    Root can be LocatorPath (component inside iframe / shadow root), its context is resolved from top document.
+
+    Example:
+    dashboard = finder.scoped(("id", "dashboard"))
+    dashboard.find_element(("xpath", "//table//td"))  # -> td within #dashboard
+    """
+    def __init__(self, parent: Finder, root_locator: tuple) -> None:
+        super().__init__(parent.webdriver, parent.timeouts, parent.polling, parent.command_counter)
+        self.parent = parent
+        self.root_locator = root_locator if isinstance(root_locator, LocatorPath) else tuple(root_locator)
+        self.default_timeout = getattr(parent, 'default_timeout', None)
+        self.contexts = parent.contexts
+        self.__root = None
+
+    @staticmethod
+    def relative(locator_tuple: tuple) -> tuple:
+        using, value = locator_tuple
+        if using == Using.XPATH and value.startswith('//'): return (using, '.' + value)
+        return (using, value)
+
+    def root_element(self) -> WebElement:
+        """ cached root element, located without waiting when missing (raises NoSuchElementException) """
+        context = context_of(self.root_locator)
+        search = self.contexts.enter(context) if context else self.parent.search_context()
+        if self.__root is None:
+            self.__root = search.find_element(*self.relative(self.root_locator))
+            flogger.debug('scope root located: %s', self.root_locator)
+        return self.__root
+
+    def child(self, locator_tuple: tuple) -> tuple:
+        """ locator relative to root, LocatorPath with own context can't be scoped """
+        if context_of(locator_tuple): raise ValueError(f'{locator_tuple!r} has own context, use unscoped finder')
+        return self.relative(locator_tuple)
+
+    def drop_root(self) -> None:
+        """ forget root element (and roots of parent scopes) """
+        self.__root = None
+        if isinstance(self.parent, ScopedFinder): self.parent.drop_root()
+
+    def navigated(self) -> None:
+        self.__root = None
+        self.parent.navigated()
+
+    def document_changed(self) -> None:
+        self.parent.document_changed()
+
+    def element_stale(self, locator_tuple: tuple) -> None:
+        if context_of(self.root_locator): self.contexts.drop()
+        self.drop_root()
+
+    def wait(self, timeout: float, polling: PollingStrategy = None, fail_on: List = None):
+        return ScopedWait(self.parent.wait(timeout, polling, self.fail_on + list(fail_on or ())), self)
+
+    def find_element(self, locator_tuple: tuple,
+                     timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                     polling: PollingStrategy = None, fail_on: List = None) -> WebElement:
+        t = self.resolve_timeout(timeout, explicit_timeout or None, self.default_timeout)
+        relative = self.child(locator_tuple)
+        flogger.debug('find_element: %s in %s, timeout: %s sec', locator_tuple, self.root_locator, t)
+        if condition is not None:
+            return self.wait(t, polling, fail_on).until(self.legacy_condition(condition, relative))
+        return self.wait(t, polling, fail_on).until(lambda driver: self.root_element().find_element(*relative))
+
+    def find_elements(self, locator_tuple: tuple,
+                      timeout: str = None, explicit_timeout: int = None, condition: object = None,
+                      polling: PollingStrategy = None, fail_on: List = None) -> List[WebElement]:
+        t = self.resolve_timeout(timeout, explicit_timeout or None, self.default_timeout)
+        relative = self.child(locator_tuple)
+        flogger.debug('find_elements: %s in %s, timeout: %s sec', locator_tuple, self.root_locator, t)
+        if condition is not None:
+            return self.wait(t, polling, fail_on).until(self.legacy_condition(condition, relative))
+        return self.wait(t, polling, fail_on).until(
+            lambda driver: self.root_element().find_elements(*relative) or False)
+
+    def __str__(self):
+        return f'scoped finder -> {self.root_locator}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class ScopedWait:
+    """ Wait of ScopedFinder - stale root (or element found in it) drops cached root and check is repeated """
+    def __init__(self, wait: PollingWait, finder: ScopedFinder) -> None:
+        self.wait = wait
+        self.finder = finder
+
+    def until(self, method, message: str = ''):
+        def scoped(driver):
+            try:
+                return method(driver)
+            except StaleElementReferenceException:
+                self.finder.drop_root()
+                return False
+        return self.wait.until(scoped, message)
+
+
+class Presence:
+    """ Wait condition - element (all: non-empty list of elements) located in frame / shadow root of locator """
+    def __init__(self, contexts: Contexts, locator_tuple: tuple, all: bool = False) -> None:
+        self.contexts = contexts
+        self.locator_tuple = locator_tuple
+        self.all = all
+
+    def __call__(self, driver: WebDriver):
+        return self.contexts.find(self.locator_tuple, self.all) or False
+
+    def __str__(self):
+        return f'presence of {"all " if self.all else ""}{self.locator_tuple!r}'
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,330 @@
+"""
+Instrumentation:
+
+Actions methods emit structured span events (method, locator, resolved timeout, time spent waiting,
+sleeping and executing, outcome) to registered sinks. Spans nest (get_text inside a Page method etc.),
+use time.perf_counter and cost next to nothing when no sink is attached.
+
+Sinks:
+- MemorySink - keeps spans in memory (tests, reports)
+- JsonLinesSink - appends spans as JSON lines to a file
+- HistogramSink - Prometheus style histograms of action durations
+- LoggingSink - "(click) took 0.123 seconds." log lines
+
+Example usage:
+    from seleniumactions import instrumentation
+    from seleniumactions.instrumentation import MemorySink
+
+    sink = MemorySink()
+    instrumentation.add_sink(sink)
+    actions.click(button)
+    sink.spans[0].to_dict()
+    # -> {'method': 'click', 'locator': ('id', 'home'), 'timeout': 3, 'duration': 0.61, 'wait': 0.1, ...}
+
+    with instrumentation.span('login flow'):  # custom parent span
+        ...
+"""
+import inspect
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from functools import wraps
+from itertools import count
+from time import perf_counter
+from typing import Callable, Dict, List
+
+
+class Span:
+    """
+    Single instrumented call
+
+    wait: seconds spent waiting for conditions / elements
+    sleep: seconds spent in sleeps and page settling
+    execute: rest of the duration (WebDriver commands, framework overhead)
+    error: exception class name when call failed
+    attributes: extra data added by steps (context_switches, won ...), nested under 'attributes' in to_dict
+    """
+    __slots__ = ('id', 'parent', 'method', 'locator', 'timeout', 'begin', 'end',
+                 'wait', 'sleep', 'waiting', 'error', 'attributes')
+
+    __ids = count(1)
+
+    def __init__(self, method: str, locator=None, timeout: float = None, parent: 'Span' = None) -> None:
+        self.id = next(Span.__ids)
+        self.parent = parent
+        self.method = method
+        self.locator = locator
+        self.timeout = timeout
+        self.begin = perf_counter()
+        self.end = None
+        self.wait = 0.0
+        self.sleep = 0.0
+        self.waiting = False
+        self.error = None
+        self.attributes = {}
+
+    @property
+    def depth(self) -> int:
+        return 0 if self.parent is None else self.parent.depth + 1
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else perf_counter()) - self.begin
+
+    @property
+    def execute(self) -> float:
+        return max(0.0, self.duration - self.wait - self.sleep)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'parent': self.parent.id if self.parent else None,
+            'method': self.method,
+            'locator': self.locator,
+            'timeout': self.timeout,
+            'duration': self.duration,
+            'wait': self.wait,
+            'sleep': self.sleep,
+            'execute': self.execute,
+            'ok': self.ok,
+            'error': self.error,
+            'attributes': dict(self.attributes)
+        }
+
+    def __str__(self):
+        return f'span {self.method} {self.locator or ""} -> {round(self.duration, 3)} sec'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Sink(ABC):
+    """ Receives finished spans """
+    @abstractmethod
+    def emit(self, span: Span) -> None:
+        pass
+
+
+class MemorySink(Sink):
+    """ Keeps finished spans in memory, top_level_only skips nested spans """
+    def __init__(self, top_level_only: bool = False) -> None:
+        self.top_level_only = top_level_only
+        self.spans: List[Span] = []
+        self.__lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        if self.top_level_only and span.parent is not None: return
+        with self.__lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.spans = []
+
+
+class JsonLinesSink(Sink):
+    """ Appends spans as JSON lines to file """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__file = open(path, 'a', buffering=1, encoding='utf-8')
+        self.__lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self.__lock:
+            self.__file.write(line + '\n')
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__file.close()
+
+
+class HistogramSink(Sink):
+    """
+    Prometheus style histograms of action durations per method, render() gives text exposition format.
+    Nested spans are skipped, so time is not counted twice.
+    """
+    default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, buckets: tuple = None, prefix: str = 'seleniumactions_action') -> None:
+        self.buckets = tuple(sorted(buckets or self.default_buckets)) + (float('inf'),)
+        self.prefix = prefix
+        self.__series: Dict[str, dict] = {}
+        self.__lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        if span.parent is not None: return
+        duration = span.duration
+        with self.__lock:
+            series = self.__series.setdefault(span.method, {
+                'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0, 'wait': 0.0, 'errors': 0
+            })
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound: series['buckets'][i] += 1
+            series['sum'] += duration
+            series['count'] += 1
+            series['wait'] += span.wait + span.sleep
+            if not span.ok: series['errors'] += 1
+
+    def render(self) -> str:
+        p = self.prefix
+        lines = [f'# TYPE {p}_seconds histogram']
+        with self.__lock:
+            series = {method: dict(values, buckets=list(values['buckets']))
+                      for method, values in self.__series.items()}
+        for method, values in sorted(series.items()):
+            for bound, n in zip(self.buckets, values['buckets']):
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{p}_seconds_bucket{{method="{method}",le="{le}"}} {n}')
+            lines.append(f'{p}_seconds_sum{{method="{method}"}} {values["sum"]}')
+            lines.append(f'{p}_seconds_count{{method="{method}"}} {values["count"]}')
+        lines.append(f'# TYPE {p}_wait_seconds_total counter')
+        lines += [f'{p}_wait_seconds_total{{method="{m}"}} {v["wait"]}' for m, v in sorted(series.items())]
+        lines.append(f'# TYPE {p}_errors_total counter')
+        lines += [f'{p}_errors_total{{method="{m}"}} {v["errors"]}' for m, v in sorted(series.items())]
+        return '\n'.join(lines) + '\n'
+
+
+class LoggingSink(Sink):
+    """ Logs "(method) took N seconds." lines, same as former time_it decorator """
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger('ACTIONS')
+        self.level = level
+
+    def emit(self, span: Span) -> None:
+        self.logger.log(self.level, '(%s) took %s seconds.', span.method, round(span.duration, 3))
+
+
+class _NoOp:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoOp()
+_current: ContextVar = ContextVar('seleniumactions_span', default=None)
+
+
+class _Waiting:
+    __slots__ = ('span', 'kind', 'begin')
+
+    def __init__(self, span: Span, kind: str) -> None:
+        self.span = span
+        self.kind = kind
+
+    def __enter__(self):
+        self.span.waiting = True
+        self.begin = perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter() - self.begin
+        self.span.waiting = False
+        setattr(self.span, self.kind, getattr(self.span, self.kind) + elapsed)
+        return False
+
+
+class _SpanContext:
+    __slots__ = ('instrumentation', 'span', 'token')
+
+    def __init__(self, instrumentation: 'Instrumentation', span: Span) -> None:
+        self.instrumentation = instrumentation
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.end = perf_counter()
+        if exc_type is not None: span.error = exc_type.__name__
+        _current.reset(self.token)
+        if span.parent is not None and not span.parent.waiting:  # waiting parent counts the whole child span
+            span.parent.wait += span.wait
+            span.parent.sleep += span.sleep
+        self.instrumentation.emit(span)
+        return False
+
+
+class Instrumentation:
+    """ Registry of sinks, creates spans """
+    def __init__(self) -> None:
+        self.sinks: List[Sink] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink: Sink) -> Sink:
+        self.sinks = self.sinks + [sink]
+        return sink
+
+    def remove_sink(self, sink: Sink) -> None:
+        self.sinks = [s for s in self.sinks if s is not sink]
+
+    def span(self, method: str, locator=None, timeout: float = None):
+        """ context manager with new span (child of current one), no-op when no sink is attached """
+        if not self.sinks: return _NOOP
+        return _SpanContext(self, Span(method, locator, timeout, _current.get()))
+
+    def emit(self, span: Span) -> None:
+        for sink in self.sinks:
+            sink.emit(span)
+
+
+instrumentation = Instrumentation()
+
+
+def current_span() -> Span:
+    return _current.get()
+
+
+def waiting(kind: str = 'wait'):
+    """ context manager adding elapsed time to current span wait (or sleep) time, nested waits count once """
+    span = _current.get()
+    if span is None or span.waiting: return _NOOP
+    return _Waiting(span, kind)
+
+
+def record_timeout(timeout: float) -> None:
+    """ store resolved timeout in current span (first one wins) """
+    span = _current.get()
+    if span is not None and span.timeout is None: span.timeout = timeout
+
+
+def _locator(args: tuple, kwargs: dict):
+    locator = args[1] if len(args) > 1 else kwargs.get('locator_tuple', kwargs.get('locators'))
+    return locator if isinstance(locator, (tuple, list, dict)) else None
+
+
+def instrumented(f: Callable) -> Callable:
+    """
+    Emit span for each call of decorated Actions method (sync or async).
+    Locator is taken from first positional argument (or locator_tuple / locators kwarg).
+    """
+    name = f.__name__
+
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_wrapper(*args, **kwargs):
+            if not instrumentation.sinks: return await f(*args, **kwargs)
+            with instrumentation.span(name, _locator(args, kwargs)):
+                return await f(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if not instrumentation.sinks: return f(*args, **kwargs)
+        with instrumentation.span(name, _locator(args, kwargs)):
+            return f(*args, **kwargs)
+    return wrapper
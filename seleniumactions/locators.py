@@ -0,0 +1,347 @@
+"""
+Locators:
+
+Using (locator strategies, same as selenium By), Locator (parameterized locator with precompiled template),
+LocatorPath (locator tuple of element inside iframes / shadow roots) and ParameterExtractor.
+Module doesn't import selenium, so page object locators can be loaded by non-browser tooling
+(locator linting, reports) without WebDriver stack.
+"""
+import inspect
+import re
+from collections import OrderedDict
+from string import Formatter
+from typing import Dict, Iterable, List, Tuple, Union
+
+
+class Using(object):
+    """ locator types, same as selenium By """
+    ID = "id"
+    NAME = "name"
+    XPATH = "xpath"
+    CLASS = "class name"
+    CSS = "css selector"
+    TAG_NAME = "tag name"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+
+
+STRATEGIES = frozenset(getattr(Using, name) for name in vars(Using) if not name.startswith('_'))
+
+FRAME = 'frame'
+SHADOW = 'shadow'
+SHADOW_STRATEGIES = frozenset({Using.CSS, Using.ID, Using.NAME, Using.CLASS})
+
+PARAMETER_PATTERN = re.compile(r'{\w+}')
+BRACKETS_PATTERN = re.compile(r'[{}]')
+IDENTIFIER_PATTERN = re.compile(r'^\w+$')
+
+
+class ParameterExtractor:
+    """ Extract {param} parameters from str """
+    def __init__(self, text: str) -> None:
+        self.__text = text
+
+    def get_parameters(self) -> List[str]:
+        if params := PARAMETER_PATTERN.findall(self.__text):
+            return self.__extract_params(params)
+
+        return []
+
+    @staticmethod
+    def __extract_params(params: List[str]) -> List[str]:
+        return [BRACKETS_PATTERN.sub('', param) for param in params]
+
+
+def frame(locator_tuple: tuple) -> tuple:
+    """ LocatorPath hop - switch into iframe located by locator_tuple """
+    return (FRAME, tuple(locator_tuple))
+
+
+def shadow(locator_tuple: tuple) -> tuple:
+    """ LocatorPath hop - search within shadow root of host located by locator_tuple """
+    return (SHADOW, tuple(locator_tuple))
+
+
+class LocatorPath(tuple):
+    """
+    Locator tuple (using, value) of element inside iframes / shadow roots, usable wherever locator tuple is.
+    context: hops from top document - frame(locator) switches into iframe, shadow(locator) searches
+             in shadow root of the host, Finder resolves them with cached handles (see seleniumactions.contexts)
+    Within shadow roots only css selector (and id / name / class name, sent as css) locators work.
+
+    Example:
+    SAVE = LocatorPath('css selector', 'button.save', [frame(('id', 'editor')), shadow(('css selector', 'x-toolbar'))])
+    actions.click(SAVE)
+    """
+    def __new__(cls, using: str, value: str, context: Iterable[tuple] = ()) -> 'LocatorPath':
+        context = tuple((kind, tuple(locator_tuple)) for kind, locator_tuple in context)
+        in_shadow = False
+        for kind, locator_tuple in context + ((None, (using, value)),):
+            if kind not in (FRAME, SHADOW, None): raise ValueError(f'Unknown context hop {kind!r}, use frame / shadow')
+            if in_shadow and locator_tuple[0] not in SHADOW_STRATEGIES:
+                raise ValueError(f'{locator_tuple} is located in shadow root, use {sorted(SHADOW_STRATEGIES)}')
+            if kind == SHADOW: in_shadow = True
+            elif kind == FRAME: in_shadow = False
+        path = super().__new__(cls, (using, value))
+        path.context = context
+        return path
+
+    def __getnewargs__(self):
+        return (self[0], self[1], self.context)
+
+    @property
+    def key(self) -> tuple:
+        """ hashable identity including context (LocatorPath equals plain (using, value) tuple) """
+        return (self[0], self[1], self.context)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self[0]!r}, {self[1]!r}, {list(self.context)})'
+
+
+def context_of(locator_tuple: tuple) -> tuple:
+    """ context hops of LocatorPath, () for plain locator tuple (top document) """
+    return getattr(locator_tuple, 'context', ())
+
+
+def locator_key(locator_tuple: tuple) -> tuple:
+    """ hashable identity of locator tuple, LocatorPath ones include context """
+    return locator_tuple.key if isinstance(locator_tuple, LocatorPath) else tuple(locator_tuple)
+
+
+class LocatorTemplate:
+    """
+    Immutable, precompiled form of Locator value template.
+    Holds parameter names, literal segments and field names (in order of appearance)
+    and a formatter, so resolving the template is a single % operation.
+
+    Templates which can't be expressed as plain {name} fields (format specs, conversions,
+    attribute/index access, unbalanced brackets) fall back to str.format.
+    """
+    __slots__ = ('value', 'parameters', 'segments', 'fields', '_pattern')
+
+    def __init__(self, value: str, parameters: List[str]) -> None:
+        segments, fields, pattern = self.__compile(value)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'parameters', tuple(parameters))
+        object.__setattr__(self, 'segments', segments)
+        object.__setattr__(self, 'fields', fields)
+        object.__setattr__(self, '_pattern', pattern)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    @property
+    def is_parameterized(self) -> bool:
+        return len(self.parameters) > 0
+
+    def key(self, kwargs: dict) -> tuple:
+        """ cache key for resolved value - values of template fields with their types (1, 1.0 and True differ) """
+        if self._pattern is None:
+            return tuple(sorted((name, type(value), value) for name, value in kwargs.items()))
+        return tuple([(type(kwargs[field]), kwargs[field]) for field in self.fields])
+
+    def format(self, kwargs: dict) -> str:
+        if self._pattern is None:
+            return self.value.format(**kwargs)
+        return self._pattern % tuple([kwargs[field] for field in self.fields])
+
+    @property
+    def compiled(self) -> bool:
+        """ False when template falls back to str.format """
+        return self._pattern is not None
+
+    def to_dict(self) -> dict:
+        return {'value': self.value, 'parameters': list(self.parameters), 'segments': list(self.segments),
+                'fields': list(self.fields), 'pattern': self._pattern}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LocatorTemplate':
+        """ template restored from to_dict output, without parsing value again """
+        template = object.__new__(cls)
+        object.__setattr__(template, 'value', data['value'])
+        object.__setattr__(template, 'parameters', tuple(data['parameters']))
+        object.__setattr__(template, 'segments', tuple(data['segments']))
+        object.__setattr__(template, 'fields', tuple(data['fields']))
+        object.__setattr__(template, '_pattern', data['pattern'])
+        return template
+
+    @staticmethod
+    def __compile(value: str) -> tuple:
+        segments, fields, pattern = [], [], []
+        try:
+            for literal, field, spec, conversion in Formatter().parse(value):
+                segments.append(literal)
+                pattern.append(literal.replace('%', '%%'))
+                if field is None: continue
+                if spec or conversion or not IDENTIFIER_PATTERN.match(field):
+                    return (value,), (), None
+                fields.append(field)
+                pattern.append('%s')
+        except ValueError:
+            return (value,), (), None
+        return tuple(segments), tuple(fields), ''.join(pattern)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.value!r})'
+
+
+class Locator:
+    """
+    Represents WebElement Locator with some extra goodies
+
+    Example usage:
+    Traditional static locator tuple:
+
+    button = Locator(Using.XPATH, '//button')
+    # get locator tuple:
+    button.get_by()
+
+
+    Goodies:
+    Parameterized locator tuple:
+
+    parameterized_button = Locator(Using.XPATH, '//button[@name="{button_name}"]')
+    foo_by = parameterized_button.get_by(button_name='foo')  # -> ('xpath', '//button[@name="foo"]'
+    bar_by = parameterized_button.get_by(button_name='bar')  # -> ('xpath', '//button[@name="bar"]'
+    # ! parameters in curly brackets must be passed as keyword arguments into get_by method !
+    When forgoten to pass parameters you will get an error:
+    parameterized_button.get_by()
+    >>> ValueError: get_by method is missing keyword arguments: ['button_name']'
+    or
+    >>> ValueError: get_by method is missing keyword argument: button_name
+
+    Template is compiled once (LocatorTemplate) and resolved (using, value) tuples are kept
+    in a bounded LRU cache keyed by parameter values (cache_size per locator, 0 disables it).
+
+    Elements inside iframes / shadow roots - context hops (see LocatorPath), get_by returns LocatorPath:
+    save = Locator(Using.CSS, 'button.{kind}', context=[frame(('id', 'editor')), shadow((Using.CSS, 'x-toolbar'))])
+
+    Already compiled template (ex: loaded from seleniumactions.registry cache file) can be passed as template.
+
+    Optimized alternative (same parameters, cheaper strategy - see seleniumactions.optimizer)
+    can be attached with set_optimized, get_by returns it only when Locator.use_optimized is set (opt-in).
+
+    For more examples head to README.md
+
+    """
+    cache_size = 256
+    use_optimized = False
+
+    def __init__(self, using: Using, value: str,
+                 parameter_extractor: ParameterExtractor = None, template: LocatorTemplate = None,
+                 context: List[tuple] = None) -> None:
+        self.__using = using
+        self.__value = value
+        self.__context = LocatorPath(using, value, context).context if context else ()
+        self.__parameter_extractor = parameter_extractor or ParameterExtractor(self.__value)
+        self.__template = template or LocatorTemplate(value, self.__parameter_extractor.get_parameters())
+        self.__resolved = OrderedDict()
+        self.__optimized = None
+
+    @property
+    def using(self) -> Using:
+        return self.__using
+
+    @property
+    def value(self) -> str:
+        return self.__value
+
+    @property
+    def context(self) -> tuple:
+        return self.__context
+
+    @property
+    def template(self) -> LocatorTemplate:
+        return self.__template
+
+    @property
+    def parameters(self) -> List[str]:
+        return list(self.__template.parameters)
+
+    @property
+    def is_parameterized(self) -> bool:
+        return self.__template.is_parameterized
+
+    @property
+    def optimized(self) -> 'Locator':
+        return self.__optimized
+
+    def set_optimized(self, locator: 'Locator') -> None:
+        """ attach equivalent cheaper locator (None detaches it), it has to take the same parameters """
+        if locator is not None and set(locator.parameters) != set(self.parameters):
+            raise ValueError(f'optimized locator parameters {locator.parameters} differ from {self.parameters}')
+        self.__optimized = locator
+
+    def get_by(self, **kwargs) -> Tuple[str, str]:
+        """ get (by, value) tuple for finding selenium WebElement object """
+        if self.use_optimized and self.__optimized is not None: return self.__by(*self.__optimized.get_by(**kwargs))
+        if not self.__template.is_parameterized:
+            return self.__by(self.using, self.value)
+        self.__validate_parameters(kwargs)
+        try:
+            key = self.__template.key(kwargs)
+            hash(key)
+        except (KeyError, TypeError):
+            return self.__by(self.using, self.__template.format(kwargs))
+        return self.__get_cached(key, kwargs)
+
+    def __by(self, using: str, value: str) -> Tuple[str, str]:
+        return LocatorPath(using, value, self.__context) if self.__context else (using, value)
+
+    def __get_cached(self, key: tuple, kwargs: dict) -> Tuple[str, str]:
+        try:
+            by = self.__resolved[key]
+            self.__resolved.move_to_end(key)
+            return by
+        except KeyError:
+            pass
+        by = self.__by(self.using, self.__template.format(kwargs))
+        if self.cache_size > 0:
+            self.__resolved[key] = by
+            while len(self.__resolved) > self.cache_size:
+                try:
+                    self.__resolved.popitem(last=False)
+                except KeyError:
+                    break
+        return by
+
+    def __validate_parameters(self, kwargs: dict):
+        if len(kwargs) == 0: raise ValueError(f'get_by method is missing keyword arguments: {self.parameters}')
+        for param in self.__template.parameters:
+            if param not in kwargs:
+                raise ValueError(f'get_by method is missing keyword argument: {param}')
+
+
+LocatorLike = Union[Locator, Tuple[str, str]]
+
+
+def is_locator(value) -> bool:
+    if isinstance(value, Locator): return True
+    return isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES and isinstance(value[1], str)
+
+
+def collect_locators(targets: Iterable) -> Dict[str, LocatorLike]:
+    """
+    Locators and locator tuples of modules (module level ones and classes defined in module)
+    and classes (Page objects, Locators holders ...), {'LoginPage.EMAIL': ('name', 'email'), ...}
+    """
+    found: Dict[str, LocatorLike] = {}
+
+    def scan_class(cls) -> None:
+        for name, value in vars(cls).items():
+            if not name.startswith('_') and is_locator(value): found[f'{cls.__name__}.{name}'] = value
+
+    for target in targets:
+        if inspect.isclass(target):
+            scan_class(target)
+            continue
+        for name, value in vars(target).items():
+            if name.startswith('_'): continue
+            if is_locator(value):
+                found[name] = value
+            elif inspect.isclass(value) and value.__module__ == target.__name__:
+                scan_class(value)
+    return found
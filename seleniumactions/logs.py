@@ -0,0 +1,140 @@
+"""
+Logging setup:
+
+seleniumactions logs to 'ACTIONS' (Actions steps) and 'FINDER' (element lookups) loggers
+and doesn't attach handlers on import - output is configured by application, or opt-in with enable_logging.
+Messages use %-style arguments, so they are formatted only when record is actually emitted.
+
+Queued mode (queued=True) puts records into bounded in-memory buffer and background thread formats
+and writes them, so step timings don't include logging I/O (many sessions sharing stdout).
+When buffer is full new records are dropped and counted (logging_stats) instead of blocking the test.
+
+Example usage:
+    from seleniumactions import enable_logging
+
+    enable_logging()  # stdout, INFO
+    enable_logging(level=logging.DEBUG, stream=sys.stderr, fmt='%(asctime)s %(name)s %(message)s')
+    enable_logging(queued=True, buffer=10000)
+    logging_stats()  # -> {'queued': 1520, 'written': 1520, 'dropped': 0}
+    disable_logging()  # flushes queued records
+"""
+import atexit
+import copy
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO
+
+LOGGERS = ('ACTIONS', 'FINDER')
+
+
+class _Handler(logging.StreamHandler):
+    """ stream handler attached by enable_logging, counts written records """
+    def __init__(self, stream: IO = None) -> None:
+        super().__init__(stream)
+        self.written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self.written += 1
+
+
+class BufferedHandler(QueueHandler):
+    """
+    Puts records into bounded queue without formatting them (message is formatted by listener thread),
+    records which don't fit are dropped and counted in .dropped
+    """
+    def __init__(self, buffer: int = 10000) -> None:
+        if buffer < 1: raise ValueError(f'buffer has to be at least 1, got: {buffer}')
+        super().__init__(queue.Queue(maxsize=buffer))
+        self.queued = 0
+        self.dropped = 0
+        self.__lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info:
+            # traceback is rendered now, exception frames should not outlive the call
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.__lock:
+                self.dropped += 1
+            return
+        with self.__lock:
+            self.queued += 1
+
+
+class _Listener(QueueListener):
+    """ listener which waits for room in full buffer for its stop sentinel (put_nowait raises queue.Full) """
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _State:
+    """ what enable_logging attached: handler on loggers, stream writer, listener of queued mode, replaced levels """
+    handler: logging.Handler = None
+    writer: _Handler = None
+    listener: QueueListener = None
+    levels: dict = None
+
+
+_state = _State()
+
+
+def enable_logging(level: int = logging.INFO, stream: IO = None, fmt: str = None,
+                   queued: bool = False, buffer: int = 10000) -> logging.Handler:
+    """
+    Attach stream handler (stdout by default) to seleniumactions loggers, replaces previously enabled one.
+    queued: write from background thread through bounded buffer of given size (see module docs)
+    """
+    disable_logging()
+    writer = _Handler(stream or sys.stdout)
+    if fmt: writer.setFormatter(logging.Formatter(fmt))
+    handler = writer
+    if queued:
+        handler = BufferedHandler(buffer)
+        _state.listener = _Listener(handler.queue, writer)
+        _state.listener.start()
+    _state.handler, _state.writer = handler, writer
+    _state.levels = {name: logging.getLogger(name).level for name in LOGGERS}
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.addHandler(handler)
+        logger.setLevel(level)
+    return handler
+
+
+def disable_logging() -> None:
+    """ detach handler attached by enable_logging (and restore level it replaced), queued records are written first """
+    if _state.handler is None: return
+    try:
+        for name in LOGGERS:
+            logger = logging.getLogger(name)
+            logger.removeHandler(_state.handler)
+            logger.setLevel(_state.levels[name])
+        if _state.listener is not None: _state.listener.stop()
+        _state.writer.flush()
+    finally:
+        _state.handler = _state.writer = _state.listener = _state.levels = None
+
+
+def logging_stats() -> dict:
+    """ records queued / written / dropped by handler attached with enable_logging """
+    handler, writer = _state.handler, _state.writer
+    if handler is None: return {'queued': 0, 'written': 0, 'dropped': 0}
+    return {
+        'queued': getattr(handler, 'queued', 0),
+        'written': writer.written,
+        'dropped': getattr(handler, 'dropped', 0)
+    }
+
+
+atexit.register(disable_logging)
@@ -0,0 +1,195 @@
+"""
+Navigation:
+
+Navigation state of Actions session - which url goto loaded, whether page was changed since (dirty),
+resource blocking rules in effect and time to interactive of Page.open calls.
+
+Reuse modes of Actions.goto / Page.open:
+- 'never' - always webdriver.get (default)
+- 'skip' - nothing to do when url is already loaded and page is not dirty (no click / type / js ... since),
+           otherwise webdriver.get
+- 'reload' - same as skip, but dirty page on the same url is refreshed instead of loaded again
+Mutating Actions steps (click, type_text, clear, submit, hover, execute_js, run_pipeline) make page dirty.
+
+Resource blocking is applied with Chrome DevTools Protocol (Network.setBlockedURLs) when driver supports it
+(Chrome / Edge execute_cdp_cmd), on other drivers it is skipped. Resource types are blocked by their
+file extensions - URL patterns is all CDP blocking without request interception supports.
+
+Example usage:
+    from seleniumactions.navigation import ResourceBlocking
+
+    class Dashboard(Page):
+        url = 'https://some.site.io/dashboard'
+        reuse = 'reload'
+        blocking = ResourceBlocking(urls=['*googletagmanager.com*', '*hotjar*'], types=['image', 'font'])
+
+    actions.navigation.measure = True  # time to interactive of Page.open (one script call per load)
+    Dashboard(actions).open()
+    actions.navigation.opens[-1]  # -> PageOpen(page='Dashboard', how='get', wall=1.2, interactive=0.81, ...)
+    actions.navigation.report()  # -> {'Dashboard': {'opens': 3, 'skipped': 2, 'interactive': {...p50, p95...}}}
+"""
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions import scripts
+from seleniumactions.stats import summary
+
+logger = logging.getLogger('ACTIONS')
+
+MUTATING_STEPS = frozenset({'click', 'type_text', 'clear', 'submit', 'hover', 'execute_js', 'run_pipeline'})
+
+RESOURCE_TYPES: Dict[str, Tuple[str, ...]] = {
+    'image': ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp'),
+    'font': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'),
+    'media': ('*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m4a', '*.mov'),
+    'stylesheet': ('*.css',),
+}
+
+
+class ResourceBlocking:
+    """
+    Requests to block on page load
+
+    urls: URL patterns with * wildcards, ex: '*googletagmanager.com*'
+    types: resource types - image, font, media, stylesheet (see RESOURCE_TYPES)
+    """
+    def __init__(self, urls: List[str] = (), types: List[str] = ()) -> None:
+        unknown = [t for t in types if t not in RESOURCE_TYPES]
+        if unknown: raise ValueError(f'Unknown resource types: {unknown}, use {sorted(RESOURCE_TYPES)}')
+        self.urls = tuple(urls)
+        self.types = tuple(types)
+
+    @property
+    def patterns(self) -> Tuple[str, ...]:
+        patterns = list(self.urls)
+        for resource_type in self.types:
+            patterns += [p for p in RESOURCE_TYPES[resource_type] if p not in patterns]
+        return tuple(patterns)
+
+    def __str__(self):
+        return f'block {list(self.urls)} {list(self.types)}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class PageOpen:
+    """
+    Single Page.open / goto: how - get | reload | skip, wall - seconds spent by goto,
+    interactive / content_loaded / loaded - seconds from navigation start (Navigation Timing), None when not measured
+    """
+    __slots__ = ('page', 'url', 'how', 'wall', 'interactive', 'content_loaded', 'loaded')
+
+    def __init__(self, page: str, url: str, how: str, wall: float, timing: dict = None) -> None:
+        self.page = page
+        self.url = url
+        self.how = how
+        self.wall = wall
+        timing = timing or {}
+        self.interactive = timing.get('interactive')
+        self.content_loaded = timing.get('content_loaded')
+        self.loaded = timing.get('loaded')
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __str__(self):
+        return f'PageOpen(page={self.page!r}, how={self.how!r}, wall={round(self.wall, 3)}, ' \
+               f'interactive={self.interactive})'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Navigation:
+    """
+    Navigation state shared by Actions (and its scoped copies), see module docs
+
+    reuse: default reuse mode of goto
+    measure: read Navigation Timing after each load (time to interactive in .opens)
+    """
+    modes = ('never', 'skip', 'reload')
+
+    def __init__(self, reuse: str = 'never', measure: bool = False) -> None:
+        self.reuse = self.check_mode(reuse)
+        self.measure = measure
+        self.url: Optional[str] = None
+        self.landed: Optional[str] = None
+        self.dirty = True
+        self.blocked: Tuple[str, ...] = ()
+        self.opens: List[PageOpen] = []
+
+    def check_mode(self, reuse: str) -> str:
+        if reuse not in self.modes: raise ValueError(f'reuse has to be one of {self.modes}, got: {reuse}')
+        return reuse
+
+    def plan(self, url: str, reuse: str, current_url: Callable[[], str]) -> str:
+        """ how to get to url: get | reload | skip """
+        reuse = self.check_mode(reuse or self.reuse)
+        if reuse == 'never' or self.url != url: return 'get'
+        try:
+            if current_url() != self.landed: return 'get'
+        except WebDriverException:
+            return 'get'
+        if not self.dirty: return 'skip'
+        return 'reload' if reuse == 'reload' else 'get'
+
+    def loaded(self, url: str, how: str, reuse: str, current_url: Callable[[], str]) -> None:
+        """ goto finished - remember url (and where it landed after redirects, only when reuse is on) """
+        self.url = url
+        self.dirty = False
+        if how == 'skip': return
+        self.landed = None
+        if (reuse or self.reuse) == 'never': return
+        try:
+            self.landed = current_url()
+        except WebDriverException:
+            self.url = None
+
+    def block(self, driver: WebDriver, blocking: Optional[ResourceBlocking]) -> bool:
+        """ apply blocking rules (None - unblock) when they differ from ones in effect, False when not supported """
+        patterns = blocking.patterns if blocking is not None else ()
+        if patterns == self.blocked: return True
+        execute_cdp = getattr(driver, 'execute_cdp_cmd', None)
+        if execute_cdp is None:
+            logger.info('resource blocking not supported by %s, skipped', type(driver).__name__)
+            return False
+        try:
+            execute_cdp('Network.enable', {})
+            execute_cdp('Network.setBlockedURLs', {'urls': list(patterns)})
+        except WebDriverException as e:
+            logger.info('resource blocking failed (%s), skipped', e.__class__.__name__)
+            return False
+        self.blocked = patterns
+        return True
+
+    def timing(self, driver: WebDriver) -> dict:
+        """ Navigation Timing of current document in seconds (empty when not available) """
+        try:
+            return driver.execute_script(scripts.NAVIGATION_TIMING) or {}
+        except WebDriverException:
+            return {}
+
+    def record(self, page: str, url: str, how: str, wall: float, timing: dict = None) -> PageOpen:
+        opened = PageOpen(page, url, how, wall, timing)
+        self.opens.append(opened)
+        return opened
+
+    def report(self) -> Dict[str, dict]:
+        """ per page: opens, skipped / reloaded count, summaries of wall and interactive seconds """
+        pages: Dict[str, List[PageOpen]] = {}
+        for opened in self.opens:
+            pages.setdefault(opened.page, []).append(opened)
+        return {
+            page: {
+                'opens': len(opens),
+                'skipped': sum(1 for o in opens if o.how == 'skip'),
+                'reloaded': sum(1 for o in opens if o.how == 'reload'),
+                'wall': summary([o.wall for o in opens]),
+                'interactive': summary([o.interactive for o in opens if o.interactive is not None])
+            }
+            for page, opens in sorted(pages.items())
+        }
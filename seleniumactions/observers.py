@@ -0,0 +1,128 @@
+"""
+Event driven finding:
+
+ObserverFinder injects a MutationObserver into the page (execute_async_script) which resolves as soon
+as the locator matches, so each wait costs a single WebDriver round-trip instead of a find per poll.
+When injection fails (unsupported locator strategy, navigation during wait, script errors)
+it falls back to regular FluentFinder polling for the rest of the timeout.
+
+Example usage:
+    from seleniumactions import ObserverFinder, Actions
+
+    finder = ObserverFinder(driver, timeouts=timeouts, default_timeout=timeouts["medium"])
+    actions = Actions(finder, wait_for_condition_timeout=15)
+"""
+import time
+from typing import List
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from seleniumactions import scripts
+from seleniumactions.cache import ElementCache
+from seleniumactions.commands import CommandCounter
+from seleniumactions.conditions import LocatorExists
+from seleniumactions.elements import FluentFinder, flogger
+from seleniumactions.instrumentation import waiting
+from seleniumactions.locators import context_of
+from seleniumactions.waits import PollingStrategy, PollingWait
+
+
+class ObserverWait(PollingWait):
+    """
+    PollingWait which resolves LocatorExists conditions with in-page MutationObserver
+    Other conditions (and waits with failure conditions, which have to be checked in every poll) are polled as usual.
+    """
+    def __init__(self, finder: 'ObserverFinder', timeout: float, polling: PollingStrategy = None,
+                 fail_on: List = None) -> None:
+        super().__init__(finder.webdriver, timeout, polling or finder.polling, fail_on=fail_on)
+        self.finder = finder
+
+    def until(self, method, message: str = ''):
+        if not isinstance(method, LocatorExists) or not self.finder.can_observe(method.locator_tuple) \
+                or self.fail_on:
+            return super().until(method, message)
+        with waiting():
+            return self.__observe(method, message)
+
+    def __observe(self, method: LocatorExists, message: str):
+        begin = time.monotonic()
+        try:
+            found = self.finder.observe(method.locator_tuple, self.timeout)
+        except WebDriverException as e:
+            flogger.debug('observer failed for %s, falling back to polling: %s', method, e.__class__.__name__)
+            remaining = max(0.0, self.timeout - (time.monotonic() - begin))
+            return PollingWait(self.driver, remaining, self.polling).until(method, message)
+        if found is None: raise TimeoutException(message)
+        return True
+
+
+class ObserverFinder(FluentFinder):
+    """
+    Finder waiting for elements with in-page MutationObserver, selectable per Finder instance.
+    Supported strategies are in seleniumactions.scripts.SUPPORTED_STRATEGIES, others are polled.
+
+    script_timeout_margin: extra seconds added to driver script timeout over wait timeout
+    Session script timeout is read for every observe call (one command, it can be changed by the test any time),
+    when wait needs a longer one it is raised for the observe call only and restored afterwards
+    (other execute_async_script calls keep the session value).
+    """
+    script_timeout_margin = 5
+
+    def __init__(self, webdriver: WebDriver, timeouts: dict,
+                 default_timeout: int, polling: PollingStrategy = None,
+                 command_counter: CommandCounter = None, element_cache: ElementCache = None) -> None:
+        super().__init__(webdriver, timeouts, default_timeout, polling, command_counter, element_cache)
+
+    def can_observe(self, locator_tuple: tuple) -> bool:
+        """ observer works in top document, LocatorPath lookups (frames / shadow roots) are polled """
+        return locator_tuple[0] in scripts.SUPPORTED_STRATEGIES and not context_of(locator_tuple)
+
+    def observe(self, locator_tuple: tuple, timeout: float, all: bool = False):
+        """
+        Wait for locator with MutationObserver in single round-trip.
+        Returns WebElement (list of WebElements when all=True) or None when not found within timeout.
+        Raises WebDriverException when script injection fails.
+        """
+        self.contexts.top()
+        using, value = locator_tuple
+        session_timeout = self.webdriver.timeouts.script
+        required = timeout + self.script_timeout_margin
+        if required <= session_timeout:
+            return self.webdriver.execute_async_script(scripts.OBSERVE, using, value, all, int(timeout * 1000))
+        self.webdriver.set_script_timeout(required)
+        try:
+            return self.webdriver.execute_async_script(scripts.OBSERVE, using, value, all, int(timeout * 1000))
+        finally:
+            self.webdriver.set_script_timeout(session_timeout)
+
+    def wait(self, timeout: float, polling: PollingStrategy = None, fail_on: List = None) -> PollingWait:
+        return ObserverWait(self, timeout, polling, self.failure_conditions(fail_on))
+
+    def _find_element(self, locator_tuple: tuple, timeout: str, explicit_timeout: int,
+                      polling: PollingStrategy, fail_on: List = None) -> WebElement:
+        return self.__find(locator_tuple, False, timeout, explicit_timeout, polling, fail_on)
+
+    def _find_elements(self, locator_tuple: tuple, timeout: str, explicit_timeout: int,
+                       polling: PollingStrategy, fail_on: List = None) -> List[WebElement]:
+        return self.__find(locator_tuple, True, timeout, explicit_timeout, polling, fail_on)
+
+    def __find(self, locator_tuple: tuple, all: bool, timeout: str, explicit_timeout: int,
+               polling: PollingStrategy, fail_on: List):
+        if not self.can_observe(locator_tuple) or self.failure_conditions(fail_on):
+            find = super()._find_elements if all else super()._find_element
+            return find(locator_tuple, timeout, explicit_timeout, polling, fail_on)
+        t = self._get_timeout(timeout, explicit_timeout)
+        flogger.debug('observe: %s, all: %s, timeout: %s sec', locator_tuple, all, t)
+        begin = time.monotonic()
+        try:
+            with waiting():
+                found = self.observe(locator_tuple, t, all)
+        except WebDriverException as e:
+            flogger.debug('observer failed for %s, falling back to polling: %s', locator_tuple, e.__class__.__name__)
+            remaining = max(0.0, t - (time.monotonic() - begin))
+            presence = self.presence(locator_tuple, all)
+            return PollingWait(self.webdriver, remaining, polling or self.polling).until(presence)
+        if not found: raise TimeoutException(f'{locator_tuple} not found in {t} sec')
+        return found
@@ -0,0 +1,325 @@
+"""
+Locator strategy optimizer and selector cost profiler:
+
+- xpath_to_css / optimize_locator - rewrite XPath (templates) to equivalent ID / name / CSS strategies
+  where it is safe, {param} placeholders are kept
+- LocatorProfiler - times every Locator (and locator tuple) of page-object modules / classes in-browser
+  against a captured page (any URL, file:// too), reports slow ones and verifies rewrites match the same elements
+- ProfileReport.apply - attaches verified rewrites to Locators, used by get_by when Locator.use_optimized is set
+
+Rewrites cover XPath built from / and // steps with tag (or *) node tests and predicates joined with "and":
+@attr, @attr='value', contains(@attr, 'value'), starts-with(@attr, 'value').
+Text, position, axes, unions and other functions are never rewritten.
+CSS matches some HTML attribute values (type, lang ...) case-insensitively, so rewrites are applied only
+when profiler verified them on a captured page (or explicitly with verified_only=False) - verified rewrite
+matched the same, non-empty set of elements. Parameterized locators are profiled only with sample values.
+Rewrites of step chains ('//form//button' -> 'form button') are equivalent in document lookups only:
+ScopedFinder searches './/form//button' within root, but CSS 'form button' run on root element matches through
+ancestors outside of it, so apply attaches them only with scoped=False (see is_scope_safe).
+
+Example usage:
+    from seleniumactions import Locator
+    from seleniumactions.optimizer import LocatorProfiler
+    import pages
+
+    profiler = LocatorProfiler(driver, repeat=20, slow_ms=1.0)
+    report = profiler.profile_all([pages], url='file:///tmp/captured/login.html',
+                                  samples={'Locators.button': {'label': 'Next'}})
+    print(report)  # slowest first, with suggested rewrites
+    report.apply()  # report.apply(scoped=False) when no locator is used in scoped lookups
+    Locator.use_optimized = True  # opt-in runtime swap
+
+Command line:
+    python -m seleniumactions.optimizer pages.locators  # static rewrite suggestions
+    python -m seleniumactions.optimizer pages.locators --url https://some.site.io --browser Chrome
+"""
+import argparse
+import importlib
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions import scripts
+from seleniumactions.locators import Locator, LocatorLike, Using, collect_locators  # noqa: F401 (re-exported)
+
+
+STEP_PATTERN = re.compile(r'(//|/)(\*|[A-Za-z_][\w-]*)((?:\[[^\[\]]*\])*)')
+PREDICATE_PATTERN = re.compile(r'\[([^\[\]]*)\]')
+CONDITION_PATTERN = re.compile(r"""\s*(?:
+      (?P<function>contains|starts-with)\(\s*@(?P<function_attr>[A-Za-z_][\w-]*)\s*,\s*
+          (?P<function_quote>['"])(?P<function_value>[^'"]*)(?P=function_quote)\s*\)
+    | @(?P<attr>[A-Za-z_][\w-]*)(?:\s*=\s*(?P<quote>['"])(?P<value>[^'"]*)(?P=quote))?
+)\s*""", re.X)
+AND_PATTERN = re.compile(r'and\s+')
+
+
+def _safe_value(value: str) -> bool:
+    """ literal can be copied into CSS string as is (placeholders allowed, escapes / brackets are not) """
+    if '\\' in value or '\n' in value: return False
+    stripped = re.sub(r'{\w+}', '', value)
+    return '{' not in stripped and '}' not in stripped
+
+
+def _conditions(predicate: str) -> Optional[List[str]]:
+    """ CSS attribute selectors for 'and' joined predicate conditions, None when not convertible """
+    selectors, position = [], 0
+    while True:
+        match = CONDITION_PATTERN.match(predicate, position)
+        if not match: return None
+        if match.group('function'):
+            value, quote = match.group('function_value'), match.group('function_quote')
+            if not value or not _safe_value(value): return None
+            operator = '*=' if match.group('function') == 'contains' else '^='
+            selectors.append(f'[{match.group("function_attr")}{operator}{quote}{value}{quote}]')
+        elif match.group('quote'):
+            value, quote = match.group('value'), match.group('quote')
+            if not _safe_value(value): return None
+            selectors.append(f'[{match.group("attr")}={quote}{value}{quote}]')
+        else:
+            selectors.append(f'[{match.group("attr")}]')
+        position = match.end()
+        if position == len(predicate): return selectors
+        conjunction = AND_PATTERN.match(predicate, position)
+        if not conjunction: return None
+        position = conjunction.end()
+
+
+def xpath_to_css(xpath: str) -> Optional[Tuple[str, str]]:
+    """
+    Equivalent (using, value) tuple for XPath, None when it can't be rewritten safely.
+
+    Examples:
+      xpath_to_css("//*[@id='home']")  # -> ('id', 'home')
+      xpath_to_css("//form[@name='login']//button[@type='{kind}']")
+      # -> ('css selector', "form[name='login'] button[type='{kind}']")
+      xpath_to_css("//ul/li[contains(., '{label}')]")  # -> None
+    """
+    value = xpath.strip()
+    if not value.startswith('/'): return None
+    steps, position = [], 0
+    for match in STEP_PATTERN.finditer(value):
+        if match.start() != position: return None
+        position = match.end()
+        conditions = []
+        for predicate in PREDICATE_PATTERN.findall(match.group(3)):
+            converted = _conditions(predicate)
+            if converted is None: return None
+            conditions += converted
+        steps.append((match.group(1), match.group(2), conditions))
+    if not steps or position != len(value): return None
+
+    if len(steps) == 1 and steps[0][0] == '//' and steps[0][1] == '*' and len(steps[0][2]) == 1:
+        for strategy in ('id', 'name'):
+            single = re.fullmatch(rf'\[{strategy}=([\'"])([^\'"]*)\1\]', steps[0][2][0])
+            if single and single.group(2): return (strategy, single.group(2))
+
+    parts = []
+    for i, (axis, tag, conditions) in enumerate(steps):
+        compound = ('' if tag == '*' and conditions else tag) + ''.join(conditions)
+        if i == 0:
+            parts.append(f'{compound}:root' if axis == '/' else compound)
+        else:
+            parts.append((' > ' if axis == '/' else ' ') + compound)
+    return (Using.CSS, ''.join(parts))
+
+
+def is_scope_safe(xpath: str) -> bool:
+    """
+    Rewrite of XPath matches the same elements in scoped lookups (ScopedFinder) too - single // step,
+    CSS chains (descendant / child combinators) and :root steps are matched against ancestors outside of root.
+    """
+    steps = STEP_PATTERN.findall(xpath.strip())
+    return len(steps) == 1 and steps[0][0] == '//'
+
+
+def optimize_locator(locator: LocatorLike) -> Optional[Locator]:
+    """ equivalent Locator with cheaper strategy (same parameters), None when there is no safe rewrite """
+    using, value = (locator.using, locator.value) if isinstance(locator, Locator) else locator
+    if using != Using.XPATH: return None
+    rewritten = xpath_to_css(value)
+    return Locator(*rewritten) if rewritten else None
+
+
+class LocatorProfile:
+    """
+    In-browser cost of single locator
+
+    ms: average lookup time in milliseconds (None when lookup failed - error)
+    matches: number of matched elements
+    suggestion: rewritten Locator (or None), suggestion_ms its lookup time
+    verified: suggestion matched the same elements on profiled page
+    scope_safe: suggestion is equivalent in scoped lookups too (see is_scope_safe)
+    """
+    __slots__ = ('name', 'locator', 'by', 'ms', 'matches', 'error', 'suggestion', 'suggestion_ms', 'verified',
+                 'scope_safe')
+
+    def __init__(self, name: str, locator: LocatorLike, by: Tuple[str, str]) -> None:
+        self.name = name
+        self.locator = locator
+        self.by = by
+        self.ms = None
+        self.matches = 0
+        self.error = None
+        self.suggestion = None
+        self.suggestion_ms = None
+        self.verified = False
+        self.scope_safe = False
+
+    @property
+    def saved_ms(self) -> float:
+        if not self.verified or self.ms is None or self.suggestion_ms is None: return 0.0
+        return self.ms - self.suggestion_ms
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'locator': list(self.by),
+            'ms': self.ms,
+            'matches': self.matches,
+            'error': self.error,
+            'suggestion': [self.suggestion.using, self.suggestion.value] if self.suggestion else None,
+            'suggestion_ms': self.suggestion_ms,
+            'verified': self.verified,
+            'scope_safe': self.scope_safe
+        }
+
+    def __str__(self):
+        cost = 'error: ' + self.error if self.error else f'{round(self.ms, 4)} ms, {self.matches} matches'
+        line = f'{self.name} {self.by} -> {cost}'
+        if self.suggestion is not None:
+            state = ('verified' if self.verified else 'NOT verified') + ('' if self.scope_safe else ', document only')
+            ms = f', {round(self.suggestion_ms, 4)} ms' if self.suggestion_ms is not None else ''
+            line += f'\n    suggestion ({state}{ms}): ({self.suggestion.using!r}, {self.suggestion.value!r})'
+        return line
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class ProfileReport:
+    """ Profiles sorted by cost (slowest first), slow ones are at least slow_ms, skipped - names not profiled """
+    def __init__(self, profiles: List[LocatorProfile], slow_ms: float, skipped: List[str] = None) -> None:
+        self.profiles = sorted(profiles, key=lambda p: -1 if p.ms is None else p.ms, reverse=True)
+        self.slow_ms = slow_ms
+        self.skipped = list(skipped or [])
+
+    @property
+    def slow(self) -> List[LocatorProfile]:
+        return [p for p in self.profiles if p.ms is not None and p.ms >= self.slow_ms]
+
+    @property
+    def rewrites(self) -> List[LocatorProfile]:
+        return [p for p in self.profiles if p.suggestion is not None]
+
+    def apply(self, verified_only: bool = True, scoped: bool = True) -> int:
+        """
+        Attach rewrites to Locator objects (locator tuples can't be swapped),
+        they are used by get_by when Locator.use_optimized is set. Returns number of attached rewrites.
+        scoped: locators can be used in scoped lookups (ScopedFinder, Page with root) - only scope safe rewrites
+                are attached, pass False when all of them are used in document lookups
+        """
+        applied = 0
+        for profile in self.rewrites:
+            if not isinstance(profile.locator, Locator) or (verified_only and not profile.verified): continue
+            if scoped and not profile.scope_safe: continue
+            profile.locator.set_optimized(profile.suggestion)
+            applied += 1
+        return applied
+
+    def to_dict(self) -> dict:
+        return {'slow_ms': self.slow_ms, 'profiles': [p.to_dict() for p in self.profiles], 'skipped': self.skipped}
+
+    def __str__(self):
+        lines = [f'{len(self.profiles)} locators, {len(self.slow)} slow (>= {self.slow_ms} ms), '
+                 f'{len(self.rewrites)} rewrites, {len(self.skipped)} skipped (no samples)']
+        return '\n'.join(lines + [str(p) for p in self.profiles])
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class LocatorProfiler:
+    """
+    Times locators in-browser (scripts.PROFILE, one execute_script per locator)
+
+    repeat: lookups per locator (average is reported)
+    slow_ms: report threshold for slow locators
+    """
+    def __init__(self, driver: WebDriver, repeat: int = 20, slow_ms: float = 1.0) -> None:
+        self.driver = driver
+        self.repeat = repeat
+        self.slow_ms = slow_ms
+
+    def profile(self, name: str, locator: LocatorLike, params: dict = None) -> LocatorProfile:
+        """ profile locator on current page, parameterized locators need params (sample values, ValueError without) """
+        by = self.__resolve(locator, params)
+        profile = LocatorProfile(name, locator, by)
+        suggestion = optimize_locator(locator)
+        locators = [list(by)]
+        if suggestion is not None:
+            profile.suggestion = suggestion
+            profile.scope_safe = is_scope_safe(locator.value if isinstance(locator, Locator) else by[1])
+            locators.append(list(self.__resolve(suggestion, params)))
+        result = self.driver.execute_script(scripts.PROFILE, locators, self.repeat)
+        first = result['results'][0]
+        profile.ms, profile.matches, profile.error = first['ms'], first['count'], first['error']
+        if suggestion is not None:
+            profile.suggestion_ms = result['results'][1]['ms']
+            profile.verified = bool(result['same']) and first['error'] is None and profile.matches > 0
+        return profile
+
+    def profile_all(self, targets: Iterable, url: str = None,
+                    samples: Dict[str, dict] = None) -> ProfileReport:
+        """
+        Profile all locators of modules / classes (see collect_locators) on captured page (url)
+        or current page, samples are parameters of parameterized locators by name
+        (parameterized locators without samples are skipped - report.skipped).
+        """
+        if url: self.driver.get(url)
+        samples = samples or {}
+        profiles, skipped = [], []
+        for name, locator in collect_locators(targets).items():
+            if isinstance(locator, Locator) and locator.is_parameterized and name not in samples:
+                skipped.append(name)
+                continue
+            profiles.append(self.profile(name, locator, samples.get(name)))
+        return ProfileReport(profiles, self.slow_ms, skipped)
+
+    @staticmethod
+    def __resolve(locator: LocatorLike, params: dict = None) -> Tuple[str, str]:
+        if not isinstance(locator, Locator): return tuple(locator)
+        if not locator.is_parameterized: return locator.get_by()
+        missing = [param for param in locator.parameters if param not in (params or {})]
+        if missing: raise ValueError(f'{locator!r} needs sample values for parameters: {missing}')
+        return (locator.using, locator.template.format(params))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='seleniumactions locators profiler / optimizer')
+    parser.add_argument('modules', nargs='+', help='page-object modules (dotted import paths)')
+    parser.add_argument('--url', help='captured page to profile locators on (static rewrites only without it)')
+    parser.add_argument('--browser', default='Chrome', help='selenium.webdriver class name used with --url')
+    parser.add_argument('--repeat', type=int, default=20, help='lookups per locator')
+    parser.add_argument('--slow-ms', type=float, default=1.0, help='slow locator threshold in milliseconds')
+    args = parser.parse_args(argv)
+
+    modules = [importlib.import_module(name) for name in args.modules]
+    if not args.url:
+        for name, locator in collect_locators(modules).items():
+            suggestion = optimize_locator(locator)
+            if suggestion is not None: print(f'{name}: ({suggestion.using!r}, {suggestion.value!r})')
+        return 0
+
+    from selenium import webdriver
+    driver = getattr(webdriver, args.browser)()
+    try:
+        print(LocatorProfiler(driver, args.repeat, args.slow_ms).profile_all(modules, url=args.url))
+    finally:
+        driver.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
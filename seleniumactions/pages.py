@@ -1,5 +1,56 @@
+import inspect
 from abc import ABC
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
 from seleniumactions.actions import Actions
+from seleniumactions.instrumentation import current_span, instrumentation
+from seleniumactions.navigation import PageOpen, ResourceBlocking
+
+
+_step: ContextVar = ContextVar('seleniumactions_page_step', default=None)
+
+
+@contextmanager
+def _step_scope(page, name: str):
+    counter = page.actions.finder.command_counter
+    token = _step.set((id(page), name))
+    try:
+        with instrumentation.span(name):
+            if counter is None:
+                yield
+                return
+            with counter.scope(name, 'page'):
+                yield
+    finally:
+        _step.reset(token)
+
+
+def page_step(f):
+    """
+    Page method step (named PageClass.method): instrumentation span and WebDriver command counting.
+    Public methods of Page subclasses are wrapped automatically, override calling super() is the same step
+    (step of the same page with the same name already running - no nested span / command scope).
+    """
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_wrapper(self, *args, **kwargs):
+            name = f'{type(self).__name__}.{f.__name__}'
+            if _step.get() == (id(self), name): return await f(self, *args, **kwargs)
+            with _step_scope(self, name):
+                return await f(self, *args, **kwargs)
+        async_wrapper.page_step = True
+        return async_wrapper
+
+    @wraps(f)
+    def wrapper(self, *args, **kwargs):
+        name = f'{type(self).__name__}.{f.__name__}'
+        if _step.get() == (id(self), name): return f(self, *args, **kwargs)
+        with _step_scope(self, name):
+            return f(self, *args, **kwargs)
+    wrapper.page_step = True
+    return wrapper
 
 
 class Page(ABC):
@@ -19,12 +70,39 @@ class Page(ABC):
             def goto_posts(self) -> None:
                 self.actions.click(self.BLOG_BUTTON)
 
+    Public methods of subclasses are Page steps - they get instrumentation spans
+    and WebDriver command counts (see seleniumactions.commands) named SasKodzi.goto_posts
+
+    Components can declare root locator - all actions of the page are scoped to root element
+    (located once and cached, see Actions.scoped):
+
+        class Sidebar(Page):
+            root = (Using.ID, 'sidebar')
+
+    open can skip loading when url is already loaded and page wasn't touched since (reuse = 'skip' or 'reload'),
+    block resources on the page (blocking = ResourceBlocking(...), pages without it unblock)
+    and reports its time to interactive (see seleniumactions.navigation):
+
+        class Dashboard(Page):
+            url = 'https://some.site.io/dashboard'
+            reuse = 'reload'
+            blocking = ResourceBlocking(urls=['*googletagmanager.com*'], types=['image', 'font'])
     """
 
     url = None
+    root = None
+    reuse: str = None
+    blocking: ResourceBlocking = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(value) or getattr(value, 'page_step', False):
+                continue
+            setattr(cls, name, page_step(value))
 
     def __init__(self, actions: Actions):
-        self.__actions = actions
+        self.__actions = actions.scoped(self.root) if self.root is not None else actions
 
     @property
     def actions(self) -> Actions:
@@ -34,6 +112,18 @@ class Page(ABC):
     def title(self):
         return self.actions.finder.webdriver.title
 
-    def open(self, url: str = None):
+    @page_step
+    def open(self, url: str = None, reuse: str = None):
         uri = url or self.url
-        self.actions.goto(uri)
+        actions, navigation = self.actions, self.actions.navigation
+        begin = perf_counter()
+        navigation.block(actions.webdriver, self.blocking)
+        how = actions.goto(uri, reuse=reuse or self.reuse)
+        wall = perf_counter() - begin
+        timing = navigation.timing(actions.webdriver) if navigation.measure and how != 'skip' else None
+        self._opened(navigation.record(type(self).__name__, uri, how, wall, timing))
+
+    @staticmethod
+    def _opened(opened: PageOpen) -> None:
+        span = current_span()
+        if span is not None: span.attributes.update(how=opened.how, interactive=opened.interactive)
@@ -0,0 +1,156 @@
+"""
+Compound action pipelines:
+
+Pipeline queues steps (click, clear, set value, submit, read text / attribute) against locators
+and Actions.run_pipeline runs consecutive scriptable steps in one injected script (scripts.PIPELINE),
+instead of a find-wait, command and sleep per step.
+Steps which need trusted input events (type_text, hover, click with trusted=True) run as native WebDriver commands.
+Steps on LocatorPath locators run in their frame / shadow root, a script run does not span contexts.
+
+Example usage:
+    result = actions.pipeline()\\
+        .clear(EMAIL).set_value(EMAIL, 'jimmy@choo.io')\\
+        .type_text(PASSWORD, 'secret', text_mask='***')\\
+        .submit(LOGIN_FORM)\\
+        .run()
+    result.ok  # -> True
+    result.failed_at  # -> index of first failed step or None
+    result.values  # -> per step results (read steps give text / attribute value, other steps None)
+"""
+from typing import List
+
+from seleniumactions.elements import Locator
+from seleniumactions.locators import LocatorPath, context_of
+
+
+class Step:
+    """ Queued pipeline step, native steps run as WebDriver commands """
+    __slots__ = ('op', 'locator_tuple', 'arg', 'native', 'text_mask')
+
+    scriptable = ('click', 'clear', 'set_value', 'submit', 'text', 'attribute')
+
+    def __init__(self, op: str, locator_tuple, arg=None, native: bool = False, text_mask: str = None) -> None:
+        self.op = op
+        locator_tuple = locator_tuple.get_by() if isinstance(locator_tuple, Locator) else locator_tuple
+        self.locator_tuple = locator_tuple if isinstance(locator_tuple, LocatorPath) else tuple(locator_tuple)
+        self.arg = arg
+        self.native = native or op not in self.scriptable
+        self.text_mask = text_mask
+
+    def __str__(self):
+        arg = self.text_mask or self.arg
+        return f'{self.op} {self.locator_tuple}{f" : {arg}" if arg is not None else ""}' \
+               f'{" (native)" if self.native else ""}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class PipelineResult:
+    """
+    Outcome of pipeline run
+
+    values: per step results (None for steps which did not return anything or did not run)
+    failed_at: index of first failed step (None when all steps passed)
+    error: 'ExceptionClass: message' of first failure
+    round_trips: execute_script calls + native WebDriver steps
+    """
+    def __init__(self, steps: List[Step]) -> None:
+        self.steps = steps
+        self.values = [None] * len(steps)
+        self.failed_at = None
+        self.error = None
+        self.round_trips = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.failed_at is None
+
+    def fail(self, index: int, error: str) -> None:
+        self.failed_at = index
+        self.error = error
+
+    def __getitem__(self, index: int):
+        return self.values[index]
+
+    def __str__(self):
+        outcome = 'ok' if self.ok else f'step {self.failed_at} ({self.steps[self.failed_at]}) failed: {self.error}'
+        return f'pipeline of {len(self.steps)} steps -> {outcome}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Pipeline:
+    """
+    Builder of compound actions, steps run in order by Actions.run_pipeline (see module docs).
+    Steps methods return pipeline, so they can be chained.
+    """
+    def __init__(self, actions) -> None:
+        self.actions = actions
+        self.steps: List[Step] = []
+
+    def click(self, locator_tuple: tuple, trusted: bool = False) -> 'Pipeline':
+        """ click (trusted=True - native WebDriver click with trusted mouse events) """
+        return self.__add(Step('click', locator_tuple, native=trusted))
+
+    def clear(self, locator_tuple: tuple) -> 'Pipeline':
+        return self.__add(Step('clear', locator_tuple))
+
+    def set_value(self, locator_tuple: tuple, value: str) -> 'Pipeline':
+        """ set field value and fire input / change events (no key events, use type_text for those) """
+        return self.__add(Step('set_value', locator_tuple, value))
+
+    def type_text(self, locator_tuple: tuple, text: str, text_mask: str = None) -> 'Pipeline':
+        """ native send keys (trusted key events) """
+        return self.__add(Step('type_text', locator_tuple, text, text_mask=text_mask))
+
+    def hover(self, locator_tuple: tuple) -> 'Pipeline':
+        """ native ActionChains hover """
+        return self.__add(Step('hover', locator_tuple))
+
+    def submit(self, locator_tuple: tuple = None) -> 'Pipeline':
+        return self.__add(Step('submit', locator_tuple or ('xpath', '//form')))
+
+    def get_text(self, locator_tuple: tuple) -> 'Pipeline':
+        return self.__add(Step('text', locator_tuple))
+
+    def get_attribute(self, locator_tuple: tuple, attr: str) -> 'Pipeline':
+        return self.__add(Step('attribute', locator_tuple, attr))
+
+    def run(self, timeout: str = None, explicit_timeout: int = None, sleep_after: bool = True) -> PipelineResult:
+        return self.actions.run_pipeline(self, timeout=timeout, explicit_timeout=explicit_timeout,
+                                         sleep_after=sleep_after)
+
+    def segments(self) -> List[tuple]:
+        """
+        [(first step index, steps)] - runs of scriptable steps (in one context) and single native steps,
+        submit ends a run
+        """
+        segments, current = [], None
+        for i, step in enumerate(self.steps):
+            if step.native:
+                segments.append((i, [step]))
+                current = None
+                continue
+            if current is not None and context_of(current[1][0].locator_tuple) != context_of(step.locator_tuple):
+                current = None
+            if current is None:
+                current = (i, [])
+                segments.append(current)
+            current[1].append(step)
+            if step.op == 'submit': current = None
+        return segments
+
+    def __add(self, step: Step) -> 'Pipeline':
+        self.steps.append(step)
+        return self
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __str__(self):
+        return f'pipeline {self.steps}'
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,204 @@
+"""
+Session recording and offline replay:
+
+Recorder wraps driver command executor (underneath Finder / Actions) and captures every WebDriver command,
+its response and latency. Recording is saved into compact file (gzipped JSON lines when path ends with .gz).
+ReplayWebDriver serves recorded responses instead of a browser - with original latency, or with none,
+so the framework own overhead (waits, sleeps, logging, locator building) can be benchmarked in CI.
+
+Example usage:
+    from seleniumactions.recording import Recorder, Recording, ReplayWebDriver
+
+    recorder = Recorder().install(driver)  # before Finder is created
+    LoginPage(Actions(FluentFinder(driver, timeouts, default_timeout=3))).login('jimmy@choo.io', 'secret')
+    recorder.recording.save('login.jsonl.gz')
+
+    driver = ReplayWebDriver(Recording.load('login.jsonl.gz'), timing='none')
+    LoginPage(Actions(FluentFinder(driver, timeouts, default_timeout=3))).login('jimmy@choo.io', 'secret')
+    driver.command_executor.stats  # -> {'served': 42, 'repeated': 3, 'skipped': 0, 'latency': 0.0}
+
+Replay follows recorded order. Waits poll a different number of times when timing differs, so a command
+repeating last served one gets its response again, and recorded polls not asked for are skipped.
+Anything else raises ReplayMismatch.
+"""
+import gzip
+import json
+import threading
+import time
+from time import perf_counter
+from typing import List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class ReplayMismatch(Exception):
+    """ Replayed run sent command which is not in recording (flow differs from recorded one) """
+
+
+class Entry:
+    """ Recorded WebDriver command: response as returned by command executor, latency in seconds """
+    __slots__ = ('command', 'params', 'response', 'latency')
+
+    def __init__(self, command: str, params: dict, response: dict, latency: float) -> None:
+        self.command = command
+        self.params = params
+        self.response = response
+        self.latency = latency
+
+    @property
+    def key(self) -> str:
+        """ command and params without session id (replayed session has its own) """
+        params = {name: value for name, value in self.params.items() if name != 'sessionId'}
+        return f'{self.command} {json.dumps(params, sort_keys=True, default=str)}'
+
+    def to_list(self) -> list:
+        return [self.command, self.params, self.response, round(self.latency, 6)]
+
+    def __str__(self):
+        return f'{self.command} ({round(self.latency * 1000, 3)} ms)'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Recording:
+    """ Recorded commands in order of execution """
+    def __init__(self, entries: List[Entry] = None) -> None:
+        self.entries: List[Entry] = list(entries or [])
+
+    @property
+    def latency(self) -> float:
+        """ total seconds spent waiting for WebDriver responses """
+        return sum(entry.latency for entry in self.entries)
+
+    def save(self, path: str) -> None:
+        """ one JSON list per line [command, params, response, latency], gzipped when path ends with .gz """
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry.to_list(), separators=(',', ':'), default=str))
+                f.write('\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            return cls([Entry(*json.loads(line)) for line in f if line.strip()])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        return f'recording of {len(self.entries)} commands, latency: {round(self.latency, 3)} sec'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class RecordingExecutor:
+    """ Command executor proxy recording commands of wrapped executor """
+    def __init__(self, executor, recorder: 'Recorder') -> None:
+        self.executor = executor
+        self.recorder = recorder
+
+    def execute(self, command: str, params: dict):
+        begin = perf_counter()
+        response = self.executor.execute(command, params)
+        self.recorder.record(command, params, response, perf_counter() - begin)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.executor, name)
+
+
+class Recorder:
+    """ Records WebDriver commands of installed driver into .recording """
+    def __init__(self) -> None:
+        self.recording = Recording()
+        self.__lock = threading.Lock()
+
+    def install(self, driver: WebDriver) -> 'Recorder':
+        """ wrap driver command executor (once) """
+        executor = driver.command_executor
+        if isinstance(executor, RecordingExecutor):
+            executor.recorder = self
+        else:
+            driver.command_executor = RecordingExecutor(executor, self)
+        return self
+
+    def record(self, command: str, params: dict, response: dict, latency: float) -> None:
+        # params / response are copied - selenium mutates params dict after the call
+        entry = Entry(command, json.loads(json.dumps(params or {}, default=str)),
+                      json.loads(json.dumps(response, default=str)), latency)
+        with self.__lock:
+            self.recording.entries.append(entry)
+
+
+class ReplayExecutor:
+    """
+    Command executor serving recorded responses
+
+    timing: 'original' - sleep recorded latency before each response, 'none' - respond immediately
+    stats: served (recorded responses), repeated (extra polls answered with last response),
+           skipped (recorded polls not asked for), latency (seconds slept)
+    """
+    timings = ('original', 'none')
+    # answered when not recorded - recorder installed on running session, recording saved before quit
+    session_commands = {
+        'newSession': {'value': {'sessionId': 'replay-session', 'capabilities': {'browserName': 'replay'}}},
+        'quit': {'value': None}
+    }
+
+    def __init__(self, recording: Recording, timing: str = 'none') -> None:
+        if timing not in self.timings: raise ValueError(f'timing has to be one of {self.timings}, got: {timing}')
+        self.recording = recording
+        self.timing = timing
+        self.stats = {'served': 0, 'repeated': 0, 'skipped': 0, 'latency': 0.0}
+        self.__keys = [entry.key for entry in recording.entries]
+        self.__position = 0
+        self.__last: Entry = None
+        self.__lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        """ all recorded commands were served """
+        return self.__position >= len(self.__keys)
+
+    def execute(self, command: str, params: dict):
+        with self.__lock:
+            entry = self.__next(command, Entry(command, params or {}, None, 0).key)
+        if self.timing == 'original' and entry.latency:
+            time.sleep(entry.latency)
+            self.stats['latency'] += entry.latency
+        return entry.response
+
+    def close(self) -> None:
+        pass
+
+    def __next(self, command: str, key: str) -> Entry:
+        entries, position = self.recording.entries, self.__position
+        last = self.__last.key if self.__last is not None else None
+        if position < len(entries) and self.__keys[position] == key: return self.__serve(position)
+        if key == last:
+            self.stats['repeated'] += 1
+            return self.__last
+        skip = position
+        while skip < len(entries) and self.__keys[skip] == last: skip += 1
+        if skip < len(entries) and self.__keys[skip] == key:
+            self.stats['skipped'] += skip - position
+            return self.__serve(skip)
+        if command in self.session_commands: return Entry(command, {}, self.session_commands[command], 0)
+        expected = entries[position] if position < len(entries) else 'end of recording'
+        raise ReplayMismatch(f'command #{position} {key[:200]} not in recording, expected: {expected}')
+
+    def __serve(self, index: int) -> Entry:
+        self.__position = index + 1
+        self.__last = self.recording.entries[index]
+        self.stats['served'] += 1
+        return self.__last
+
+
+class ReplayWebDriver(WebDriver):
+    """ selenium WebDriver backed by ReplayExecutor (timing: see ReplayExecutor) """
+    def __init__(self, recording: Recording, timing: str = 'none') -> None:
+        super().__init__(command_executor=ReplayExecutor(recording, timing))
@@ -0,0 +1,335 @@
+"""
+Locator registry:
+
+Collects Locators and locator tuples of page-object modules (packages are walked), Page classes and Locators
+holders in one pass, validates them before any browser is started and keeps their compiled templates:
+- parameters - placeholders get_by can't fill ({}, {0}, {item.id}, {x:>3}), unbalanced braces
+- syntax - XPath / CSS structure (brackets, quotes, empty predicates, dangling combinators ...), compound class
+  names, unknown strategies and empty values, checked with placeholders filled in
+- duplicates - same (using, value) in the same frame / shadow root context registered under several names (warning)
+Frame / shadow root context of Locators and LocatorPaths is kept (and cached) with their templates.
+Syntax checks are structural, they catch typos, not every expression browser would reject.
+
+Compiled set can be saved to JSON cache file, workers load it without importing page modules and parsing
+templates again. Cache is stale when source file (or package directory) of any collected module changed.
+
+Example usage:
+    from seleniumactions.registry import LocatorRegistry
+
+    registry = LocatorRegistry.build(['pages', 'utils.locators'])  # raises LocatorError listing all errors
+    registry.warnings  # -> [pages.home.HomePage.EMAIL: duplicate - same as pages.login.LoginPage.EMAIL]
+    registry.save('.locators.json')
+
+    registry = LocatorRegistry.cached('.locators.json', ['pages', 'utils.locators'])  # built only when stale
+    registry.get_by('utils.locators.Locators.button', label='Next')  # -> ('xpath', "//button[.='Next']")
+
+Command line (exit code 1 on errors):
+    python -m seleniumactions.registry pages utils.locators --cache .locators.json
+"""
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import re
+import sys
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from seleniumactions.locators import (IDENTIFIER_PATTERN, STRATEGIES, Locator, LocatorLike, LocatorTemplate, Using,
+                                      collect_locators, context_of)
+
+TAG_PATTERN = re.compile(r'^[A-Za-z][\w-]*$')
+XPATH_NAME_WILDCARD = re.compile(r'(?:^|/)[A-Za-z_][\w.-]*\*')
+CSS_COMBINATORS = re.compile(r'[>+~]\s*[>+~,]|,\s*,')
+
+
+class Issue:
+    """ Problem of a registered locator, severity: error | warning """
+    __slots__ = ('name', 'kind', 'message', 'severity')
+
+    def __init__(self, name: str, kind: str, message: str, severity: str = 'error') -> None:
+        self.name = name
+        self.kind = kind
+        self.message = message
+        self.severity = severity
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __str__(self):
+        return f'{self.name}: {self.kind} - {self.message}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class LocatorError(ValueError):
+    """ registry validation failed, .issues are all errors found """
+    def __init__(self, issues: List[Issue]) -> None:
+        self.issues = issues
+        lines = ''.join(f'\n  {issue}' for issue in issues)
+        super().__init__(f'{len(issues)} invalid locators:{lines}')
+
+
+def _unquoted(value: str, escapes: bool) -> Optional[str]:
+    """ value with string literals emptied ('abc' -> ''), None when literal is not closed """
+    result, quote, chars = [], None, iter(value)
+    for char in chars:
+        if quote is None:
+            result.append(char)
+            if char in '\'"': quote = char
+        elif escapes and char == '\\':
+            next(chars, None)
+        elif char == quote:
+            result.append(char)
+            quote = None
+    return None if quote is not None else ''.join(result)
+
+
+def _balanced(text: str) -> bool:
+    stack, pairs = [], {']': '[', ')': '('}
+    for char in text:
+        if char in '[(': stack.append(char)
+        elif char in pairs:
+            if not stack or stack.pop() != pairs[char]: return False
+    return not stack
+
+
+def check_xpath(xpath: str) -> Optional[str]:
+    text = _unquoted(xpath, escapes=False)
+    if text is None: return 'unclosed string literal'
+    if not _balanced(text): return 'unbalanced brackets'
+    compact = re.sub(r'\s+', '', text)
+    if '[]' in compact: return 'empty predicate'
+    if '///' in compact: return 'empty step (///)'
+    if compact.endswith(('/', '|', '[', '(', '@', ',')): return 'unexpected end of expression'
+    if XPATH_NAME_WILDCARD.search(compact): return 'invalid name test (wildcard after element name)'
+    return None
+
+
+def check_css(css: str) -> Optional[str]:
+    if css.lstrip().startswith(('/', '(')): return 'XPath given as css selector'
+    text = _unquoted(css, escapes=True)
+    if text is None: return 'unclosed string'
+    if not _balanced(text): return 'unbalanced brackets'
+    compact = text.strip()
+    if re.search(r'\[\s*\]', compact): return 'empty attribute selector'
+    if compact.startswith(','): return 'empty selector in list'
+    if compact.endswith(('>', '+', '~', ',')): return 'dangling combinator'
+    if CSS_COMBINATORS.search(compact): return 'consecutive combinators'
+    return None
+
+
+def check_syntax(using: str, value: str) -> Optional[str]:
+    """ structural problem of resolved locator, None when it looks fine """
+    if using not in STRATEGIES: return f'unknown strategy {using!r}'
+    if not value.strip(): return 'empty value'
+    if using == Using.XPATH: return check_xpath(value)
+    if using == Using.CSS: return check_css(value)
+    if using == Using.CLASS and len(value.split()) > 1: return 'compound class name, use css selector'
+    if using == Using.TAG_NAME and not TAG_PATTERN.match(value): return f'invalid tag name {value!r}'
+    return None
+
+
+def check_parameters(value: str) -> Optional[str]:
+    """ placeholders which get_by can't fill, None when template is fine """
+    try:
+        parsed = list(Formatter().parse(value))
+    except ValueError as e:
+        return f'malformed template: {e}'
+    unsupported = [
+        '{' + field + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '') + '}'
+        for _, field, spec, conversion in parsed
+        if field is not None and (spec or conversion or not IDENTIFIER_PATTERN.match(field))
+    ]
+    if unsupported: return f'placeholders get_by can\'t fill: {unsupported}'
+    return None
+
+
+def import_modules(modules: Iterable) -> Iterator:
+    """ modules (objects or dotted names), packages with all their submodules """
+    for module in modules:
+        if isinstance(module, str): module = importlib.import_module(module)
+        yield module
+        if hasattr(module, '__path__'):
+            for info in pkgutil.walk_packages(module.__path__, module.__name__ + '.'):
+                yield importlib.import_module(info.name)
+
+
+class LocatorRegistry:
+    """
+    Validated, compiled locators by qualified name (module.Class.ATTRIBUTE), see module docs
+
+    issues: all problems found, errors / warnings - split by severity
+    sources: {path: [mtime_ns, size]} of collected modules, decides cache freshness
+    """
+    version = 2
+
+    def __init__(self) -> None:
+        self.issues: List[Issue] = []
+        self.sources: Dict[str, list] = {}
+        self.modules: List[str] = []
+        self.__entries: Dict[str, Tuple[str, LocatorTemplate, tuple]] = {}
+        self.__locators: Dict[str, Locator] = {}
+        self.__seen: Dict[tuple, str] = {}
+
+    @classmethod
+    def build(cls, modules: Iterable, strict: bool = True) -> 'LocatorRegistry':
+        """ import and collect modules / packages, strict - raise LocatorError when there are errors """
+        registry = cls()
+        for module in import_modules(modules):
+            registry.add_module(module)
+        if strict: registry.validate()
+        return registry
+
+    def add_module(self, module) -> None:
+        """ register locators of module (module level, Page classes, Locators holders ...) """
+        self.modules.append(module.__name__)
+        for path in [getattr(module, '__file__', None)] + list(getattr(module, '__path__', ())):
+            if path and os.path.exists(path): self.sources[path] = self.__stat(path)
+        for name, locator in collect_locators([module]).items():
+            self.add(f'{module.__name__}.{name}', locator)
+
+    def add_class(self, cls) -> None:
+        """ register locators of single class (Page object, Locators holder) """
+        for name, locator in collect_locators([cls]).items():
+            self.add(f'{cls.__module__}.{name}', locator)
+
+    def add(self, name: str, locator: LocatorLike) -> List[Issue]:
+        """ validate and register single locator, returns its issues """
+        if isinstance(locator, Locator):
+            using, template, context = locator.using, locator.template, locator.context
+            problem = check_parameters(template.value)
+            issues = [Issue(name, 'parameters', problem)] if problem else []
+            sample = template.value
+            if not problem and template.is_parameterized:
+                sample = template.format({parameter: 'x' for parameter in template.parameters})
+        else:
+            using, sample = locator
+            template, context, issues = LocatorTemplate(sample, []), context_of(locator), []
+        problem = check_syntax(using, sample)
+        if problem: issues.append(Issue(name, 'syntax', f'{problem}: ({using!r}, {template.value!r})'))
+        key = (using, template.value, context)
+        if key in self.__seen and self.__seen[key] != name:
+            issues.append(Issue(name, 'duplicate', f'same as {self.__seen[key]}', 'warning'))
+        self.__seen.setdefault(key, name)
+        self.__entries[name] = (using, template, context)
+        self.__locators.pop(name, None)
+        self.issues += issues
+        return issues
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == 'error']
+
+    @property
+    def warnings(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == 'warning']
+
+    def validate(self) -> 'LocatorRegistry':
+        if self.errors: raise LocatorError(self.errors)
+        return self
+
+    def names(self) -> List[str]:
+        return list(self.__entries)
+
+    def template(self, name: str) -> LocatorTemplate:
+        return self.__entries[name][1]
+
+    def locator(self, name: str) -> Locator:
+        """ Locator built from compiled template (template is not parsed again) """
+        if name not in self.__locators:
+            using, template, context = self.__entries[name]
+            self.__locators[name] = Locator(using, template.value, template=template, context=context or None)
+        return self.__locators[name]
+
+    def get_by(self, name: str, **kwargs) -> Tuple[str, str]:
+        return self.locator(name).get_by(**kwargs)
+
+    def fresh(self) -> bool:
+        """ no source file changed since registry was built """
+        return all(os.path.exists(path) and self.__stat(path) == stat for path, stat in self.sources.items())
+
+    def save(self, path: str) -> None:
+        """ write compiled set to JSON cache file (atomically, workers may be reading it) """
+        data = {
+            'version': self.version,
+            'modules': self.modules,
+            'sources': self.sources,
+            'locators': {name: dict(using=using, context=[[kind, list(hop)] for kind, hop in context],
+                                    **template.to_dict())
+                         for name, (using, template, context) in self.__entries.items()},
+            'issues': [issue.to_dict() for issue in self.issues]
+        }
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str, check: bool = True) -> Optional['LocatorRegistry']:
+        """ registry from cache file, None when file is missing, of other version or stale (check) """
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != cls.version: return None
+        registry = cls()
+        registry.modules = data['modules']
+        registry.sources = data['sources']
+        if check and not registry.fresh(): return None
+        registry.issues = [Issue(**issue) for issue in data['issues']]
+        for name, entry in data['locators'].items():
+            context = tuple((kind, tuple(hop)) for kind, hop in entry.pop('context'))
+            registry.__entries[name] = (entry.pop('using'), LocatorTemplate.from_dict(entry), context)
+        return registry
+
+    @classmethod
+    def cached(cls, path: str, modules: Iterable, strict: bool = True) -> 'LocatorRegistry':
+        """ load fresh cache of the same modules, otherwise build registry and save it """
+        modules = list(modules)
+        registry = cls.load(path)
+        names = [module if isinstance(module, str) else module.__name__ for module in modules]
+        if registry is not None and set(names) <= set(registry.modules):
+            return registry.validate() if strict else registry
+        registry = cls.build(modules, strict)
+        registry.save(path)
+        return registry
+
+    @staticmethod
+    def __stat(path: str) -> list:
+        stat = os.stat(path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__entries
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __str__(self):
+        return f'{len(self.__entries)} locators, {len(self.errors)} errors, {len(self.warnings)} warnings'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='seleniumactions locator registry - validate and precompile')
+    parser.add_argument('modules', nargs='+', help='page-object modules / packages (dotted import paths)')
+    parser.add_argument('--cache', help='write compiled locators to this file (when there are no errors)')
+    args = parser.parse_args(argv)
+
+    registry = LocatorRegistry.build(args.modules, strict=False)
+    for issue in registry.issues:
+        print(f'{issue.severity}: {issue}')
+    print(registry)
+    if registry.errors: return 1
+    if args.cache: registry.save(args.cache)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
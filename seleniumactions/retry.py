@@ -0,0 +1,200 @@
+"""
+Retries:
+
+Flaky interaction steps (element re-rendered under the handle, click landing on an overlay, transient Grid error)
+are retried by Actions when it has a RetryPolicy - only the failing step is repeated, its element is found again
+through Finder (stale cached handle is dropped first), the rest of the scenario is not affected.
+
+Policy:
+- rules: {exception type or predicate(error) -> bool: max retries}, first matching rule wins,
+  errors without a rule are raised right away (element not found / TimeoutException is never retried)
+- budget: timeouts bucket name (or seconds) - total time step may take before retries give up
+- backoff: delays between attempts (exponential BackoffPolling, 50 ms doubling up to 1 sec by default)
+Retried steps are RETRYABLE_STEPS (click, type_text, clear, submit, hover, get_text, get_attribute).
+Transient errors are ambiguous - command may have been executed before connection dropped, so they are retried
+only in IDEMPOTENT_STEPS (clear, hover, get_text, get_attribute), never in click / type_text / submit.
+Element lookup of a retried attempt waits at most for what is left of the budget.
+
+Time lost to retries (failed attempts + backoff) and retry counts are recorded per locator in RetryStats.
+
+Example usage:
+    from seleniumactions.retry import RetryPolicy
+
+    retry = RetryPolicy(budget='medium')
+    actions = Actions(finder, wait_for_condition_timeout=15, retry=retry)
+    ...
+    retry.stats.worst(3)  # -> [(('id', 'save'), {'retries': 7, 'lost': 2.1, 'gave_up': 1, 'errors': {...}}), ...]
+"""
+import threading
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from selenium.common.exceptions import (ElementClickInterceptedException, StaleElementReferenceException,
+                                        WebDriverException)
+from urllib3.exceptions import MaxRetryError, ProtocolError, ReadTimeoutError
+
+from seleniumactions.waits import BackoffPolling, PollingStrategy
+
+RETRYABLE_STEPS = frozenset({'click', 'type_text', 'clear', 'submit', 'hover', 'get_text', 'get_attribute'})
+IDEMPOTENT_STEPS = frozenset({'clear', 'hover', 'get_text', 'get_attribute'})
+
+TRANSIENT_MESSAGES = (
+    'Unable to execute request for an existing session', 'Could not proxy command', 'Error forwarding',
+    '502 Bad Gateway', '503 Service Unavailable', '504 Gateway Time', 'Connection reset', 'Read timed out'
+)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Grid / connection hiccup: dropped connection (urllib3 errors raised by remote connection included)
+    or generic WebDriverException with known proxy message
+    """
+    if isinstance(error, (ConnectionError, ProtocolError, MaxRetryError, ReadTimeoutError)): return True
+    if type(error) is not WebDriverException: return False
+    message = error.msg or ''
+    return any(part in message for part in TRANSIENT_MESSAGES)
+
+
+DEFAULT_RULES: Dict[Union[type, Callable], int] = {
+    StaleElementReferenceException: 3,
+    ElementClickInterceptedException: 3,
+    is_transient: 2
+}
+
+
+class RetryStats:
+    """
+    Retries per locator: retries, lost - seconds spent on failed attempts and backoff,
+    gave_up - steps which failed after retrying, errors - retries per exception name
+    """
+    def __init__(self) -> None:
+        self.locators: Dict[tuple, dict] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, locator_tuple: tuple, retries: int, lost: float, errors: List[str], gave_up: bool) -> None:
+        with self.__lock:
+            stats = self.locators.setdefault(locator_tuple, {'retries': 0, 'lost': 0.0, 'gave_up': 0, 'errors': {}})
+            stats['retries'] += retries
+            stats['lost'] += lost
+            stats['gave_up'] += gave_up
+            for error in errors:
+                stats['errors'][error] = stats['errors'].get(error, 0) + 1
+
+    @property
+    def retries(self) -> int:
+        return sum(stats['retries'] for stats in self.locators.values())
+
+    @property
+    def lost(self) -> float:
+        return sum(stats['lost'] for stats in self.locators.values())
+
+    def worst(self, n: int = 10) -> List[tuple]:
+        """ [(locator, stats)] sorted by time lost, worst offender first """
+        with self.__lock:
+            items = list(self.locators.items())
+        return sorted(items, key=lambda item: item[1]['lost'], reverse=True)[:n]
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.locators.clear()
+
+    def __str__(self):
+        return f'{self.retries} retries, {round(self.lost, 3)} sec lost on {len(self.locators)} locators'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Attempts:
+    """ Retry state of a single step call, created by RetryPolicy.attempts """
+    def __init__(self, policy: 'RetryPolicy', locator_tuple: tuple, budget: float, idempotent: bool = True) -> None:
+        self.policy = policy
+        self.locator_tuple = locator_tuple
+        self.budget = budget
+        self.idempotent = idempotent
+        self.retries = 0
+        self.errors: List[str] = []
+        self.__per_rule: Dict[object, int] = {}
+        self.__intervals: Iterator[float] = policy.backoff.intervals()
+        self.__begin = perf_counter()
+        self.__attempt_begin = self.__begin
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self.__begin
+
+    @property
+    def remaining(self) -> float:
+        return self.budget - self.elapsed
+
+    def failed(self, error: BaseException) -> Optional[float]:
+        """ seconds to wait before retrying, None when error should be raised """
+        rule = self.policy.rule(error) if self.idempotent or not is_transient(error) else None
+        retries = self.__per_rule.get(rule, 0)
+        delay = next(self.__intervals) if rule is not None else None
+        if rule is None or retries >= self.policy.rules[rule] or self.elapsed + delay > self.budget:
+            if self.retries: self.__record(self.elapsed, gave_up=True)
+            return None
+        self.__per_rule[rule] = retries + 1
+        self.retries += 1
+        self.errors.append(type(error).__name__)
+        return delay
+
+    def next(self) -> None:
+        """ next attempt starts (after backoff) """
+        self.__attempt_begin = perf_counter()
+
+    def succeeded(self) -> None:
+        if self.retries: self.__record(self.__attempt_begin - self.__begin, gave_up=False)
+
+    def __record(self, lost: float, gave_up: bool) -> None:
+        self.policy.stats.record(self.locator_tuple, self.retries, lost, self.errors, gave_up)
+
+
+class RetryPolicy:
+    """
+    Per exception retry policy of Actions steps (see module docs)
+
+    rules: {exception type or predicate: max retries}, DEFAULT_RULES when not given
+    budget: total time of a step with retries, timeouts bucket name ('short', 'medium' ...) or seconds
+    backoff: delays between attempts
+    """
+    def __init__(self, rules: Dict[Union[type, Callable], int] = None, budget: Union[str, float] = 'short',
+                 backoff: PollingStrategy = None) -> None:
+        self.rules = dict(DEFAULT_RULES if rules is None else rules)
+        bad = {rule: n for rule, n in self.rules.items() if n < 0}
+        if bad: raise ValueError(f'Max retries must be >= 0, got: {bad}')
+        if not isinstance(budget, str) and budget <= 0: raise ValueError(f'Budget must be positive, got: {budget}')
+        self.budget = budget
+        self.backoff = backoff or BackoffPolling(initial=0.05, factor=2, cap=1, jitter=0.1)
+        self.stats = RetryStats()
+
+    def rule(self, error: BaseException) -> Optional[object]:
+        """ first rule matching error (None - not retried) """
+        for rule in self.rules:
+            if isinstance(rule, type):
+                if isinstance(error, rule): return rule
+            elif rule(error):
+                return rule
+        return None
+
+    def check(self, finder) -> None:
+        """ budget bucket name has to be one of finder timeouts (checked once, when Actions get the policy) """
+        if isinstance(self.budget, str) and self.budget.lower() not in finder.timeouts:
+            raise ValueError(f'Invalid budget timeout variant: "{self.budget}", use {list(finder.timeouts.keys())}')
+
+    def budget_seconds(self, finder) -> float:
+        """ budget in seconds, bucket name is looked up in finder timeouts """
+        if isinstance(self.budget, str): return finder.timeouts[self.budget.lower()]
+        return self.budget
+
+    def attempts(self, locator_tuple: tuple, budget: float, idempotent: bool = True) -> Attempts:
+        """ idempotent: step may be repeated after transient error (it is unknown whether command was executed) """
+        return Attempts(self, locator_tuple, budget, idempotent)
+
+    def __str__(self):
+        rules = {getattr(rule, '__name__', str(rule)): n for rule, n in self.rules.items()}
+        return f'retry {rules} within {self.budget} budget'
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,375 @@
+"""
+Parallel scenario scheduler:
+
+Keeps a pool of pre-warmed WebDriver sessions (each wrapped in its own Finder / Actions) and hands
+scenarios to free sessions, in threads or in processes (one session per process).
+Session state is reset between scenarios (cookies, storage, blank page) instead of relaunching the browser,
+report gives per-worker utilization and queue wait to size the pool to the machine.
+Reset clears cookies of all origins only with Chrome DevTools Protocol (Chrome / Edge execute_cdp_cmd) -
+WebDriver deletes cookies of current domain only; local / session storage is cleared for current origin only.
+
+Example usage:
+    from seleniumactions import FluentFinder
+    from seleniumactions.scheduler import Scheduler
+
+    def login(actions):
+        page = LoginPage(actions)
+        page.open()
+        page.login('jimmy@choo.io', 'secret')
+
+    scheduler = Scheduler(driver_factory=webdriver.Chrome,
+                          finder_factory=lambda driver: FluentFinder(driver, timeouts, default_timeout=3),
+                          workers=4)
+    with scheduler:
+        report = scheduler.run([login, checkout, search])
+    report.failed  # -> [ScenarioResult ...]
+    report.to_dict()['workers']  # -> {'session-0': {'scenarios': 2, 'busy': 4.1, 'utilization': 0.93, ...}, ...}
+
+    In process mode factories, scenarios and their return values have to be picklable (module level functions).
+"""
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions import scripts
+from seleniumactions.actions import Actions
+from seleniumactions.elements import Finder
+from seleniumactions.instrumentation import instrumentation
+from seleniumactions.stats import summary
+
+
+class Session:
+    """ Pre-warmed WebDriver session with its own Finder and Actions """
+    blank_url = 'about:blank'
+
+    def __init__(self, name: str, driver: WebDriver, finder: Finder, actions: Actions) -> None:
+        self.name = name
+        self.driver = driver
+        self.finder = finder
+        self.actions = actions
+
+    def reset(self) -> None:
+        """
+        drop cookies (all origins with CDP, current domain otherwise), local / session storage of current origin
+        and open blank page (in top document - the last step may have left driver in a frame)
+        """
+        self.finder.contexts.top()
+        if not self.__clear_browser_cookies(): self.driver.delete_all_cookies()
+        try:
+            self.driver.execute_script(scripts.CLEAR_STORAGE)
+        except WebDriverException:
+            pass
+        self.finder.navigated()
+        self.driver.get(self.blank_url)
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+    def __clear_browser_cookies(self) -> bool:
+        execute_cdp = getattr(self.driver, 'execute_cdp_cmd', None)
+        if execute_cdp is None: return False
+        try:
+            execute_cdp('Network.clearBrowserCookies', {})
+            return True
+        except WebDriverException:
+            return False
+
+    def __str__(self):
+        return f'session {self.name}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class SessionPool:
+    """
+    Pool of pre-warmed sessions
+
+    driver_factory: callable() -> WebDriver
+    finder_factory: callable(driver) -> Finder
+    size: sessions in pool
+    actions_options: Actions kwargs (wait_for_condition_timeout defaults to 15)
+    reset: callable(session) run when session is released, Session.reset by default,
+           session is relaunched when reset fails
+    relaunched / relaunch_failed: relaunch counts, session which failed to relaunch goes back to pool
+                                  (its next release tries again), so the pool never shrinks
+    """
+    def __init__(self, driver_factory: Callable[[], WebDriver], finder_factory: Callable[[WebDriver], Finder],
+                 size: int = 2, actions_options: dict = None, reset: Callable[[Session], None] = None,
+                 name: str = 'session') -> None:
+        if size < 1: raise ValueError(f'pool size has to be at least 1, got: {size}')
+        self.driver_factory = driver_factory
+        self.finder_factory = finder_factory
+        self.size = size
+        self.actions_options = dict({'wait_for_condition_timeout': 15}, **(actions_options or {}))
+        self.reset = reset or Session.reset
+        self.name = name
+        self.warmup = 0.0
+        self.relaunched = 0
+        self.relaunch_failed = 0
+        self.__sessions: List[Session] = []
+        self.__free = queue.Queue()
+        self.__lock = threading.Lock()
+
+    @property
+    def sessions(self) -> List[Session]:
+        return list(self.__sessions)
+
+    def start(self) -> 'SessionPool':
+        """ launch all sessions in parallel (once) """
+        if self.__sessions: return self
+        begin = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            sessions = list(executor.map(self.__launch, range(self.size)))
+        self.warmup = perf_counter() - begin
+        for session in sessions:
+            self.__sessions.append(session)
+            self.__free.put(session)
+        return self
+
+    def acquire(self, timeout: float = None) -> Session:
+        """ free session, blocks until one is released """
+        if not self.__sessions: self.start()
+        return self.__free.get(timeout=timeout)
+
+    def release(self, session: Session) -> Optional[str]:
+        """ reset session and put it back, relaunch it when reset fails - returns relaunch error when that fails too """
+        error = None
+        try:
+            self.reset(session)
+        except Exception:
+            session.quit()
+            try:
+                session = self.__relaunch(session)
+            except Exception as e:
+                with self.__lock:
+                    self.relaunch_failed += 1
+                error = f'{type(e).__name__}: {e}'
+        self.__free.put(session)
+        return error
+
+    def close(self) -> None:
+        for session in self.__sessions:
+            session.quit()
+        self.__sessions = []
+        self.__free = queue.Queue()
+
+    def __launch(self, index: int) -> Session:
+        driver = self.driver_factory()
+        finder = self.finder_factory(driver)
+        return Session(f'{self.name}-{index}', driver, finder, Actions(finder, **self.actions_options))
+
+    def __relaunch(self, session: Session) -> Session:
+        fresh = self.__launch(self.__sessions.index(session))
+        with self.__lock:
+            self.__sessions[self.__sessions.index(session)] = fresh
+            self.relaunched += 1
+        return fresh
+
+    def __enter__(self) -> 'SessionPool':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ScenarioResult:
+    """
+    Outcome of single scenario run, error is 'ExceptionClass: message' when scenario failed,
+    reset_error - same for session relaunch after failed reset (scenario itself can still be ok)
+    """
+    __slots__ = ('name', 'worker', 'value', 'error', 'queue_wait', 'duration', 'reset', 'reset_error')
+
+    def __init__(self, name: str, worker: str, value=None, error: str = None,
+                 queue_wait: float = 0.0, duration: float = 0.0, reset: float = 0.0, reset_error: str = None) -> None:
+        self.name = name
+        self.worker = worker
+        self.value = value
+        self.error = error
+        self.queue_wait = queue_wait
+        self.duration = duration
+        self.reset = reset
+        self.reset_error = reset_error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __str__(self):
+        return f'scenario {self.name} on {self.worker} -> {"ok" if self.ok else self.error}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class RunReport:
+    """
+    Results of Scheduler.run
+
+    workers: per worker scenarios, busy seconds (scenarios + resets), reset seconds and utilization (busy / wall)
+    queue_wait: summary of seconds scenarios waited for a free session
+    """
+    def __init__(self, results: List[ScenarioResult], wall: float, warmup: float, mode: str) -> None:
+        self.results = results
+        self.wall = wall
+        self.warmup = warmup
+        self.mode = mode
+
+    @property
+    def failed(self) -> List[ScenarioResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def workers(self) -> Dict[str, dict]:
+        workers: Dict[str, dict] = {}
+        for result in self.results:
+            stats = workers.setdefault(result.worker, {'scenarios': 0, 'busy': 0.0, 'reset': 0.0})
+            stats['scenarios'] += 1
+            stats['busy'] += result.duration + result.reset
+            stats['reset'] += result.reset
+        for stats in workers.values():
+            stats['utilization'] = stats['busy'] / self.wall if self.wall else 0.0
+        return dict(sorted(workers.items()))
+
+    @property
+    def queue_wait(self) -> dict:
+        return summary([result.queue_wait for result in self.results])
+
+    def to_dict(self) -> dict:
+        return {
+            'mode': self.mode,
+            'wall': self.wall,
+            'warmup': self.warmup,
+            'scenarios': len(self.results),
+            'failed': len(self.failed),
+            'queue_wait': self.queue_wait,
+            'workers': self.workers,
+            'results': [result.to_dict() for result in self.results]
+        }
+
+    def __str__(self):
+        return f'run report: {len(self.results)} scenarios, {len(self.failed)} failed in {round(self.wall, 3)} sec'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def _scenario_name(scenario: Callable) -> str:
+    return getattr(scenario, '__name__', None) or repr(scenario)
+
+
+def _execute(pool: SessionPool, name: str, scenario: Callable[[Actions], object],
+             submitted: float, worker_prefix: str = '') -> ScenarioResult:
+    session = pool.acquire()
+    result = ScenarioResult(name, f'{worker_prefix}{session.name}', queue_wait=time.time() - submitted)
+    begin = perf_counter()
+    try:
+        with instrumentation.span(name) as span:
+            if span is not None: span.attributes['worker'] = result.worker
+            result.value = scenario(session.actions)
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+    finally:
+        result.duration = perf_counter() - begin
+        begin = perf_counter()
+        result.reset_error = pool.release(session)
+        result.reset = perf_counter() - begin
+    return result
+
+
+_process_pool: SessionPool = None
+
+
+def _init_process(driver_factory, finder_factory, actions_options, reset) -> None:
+    global _process_pool
+    _process_pool = SessionPool(driver_factory, finder_factory, 1, actions_options, reset).start()
+    multiprocessing.util.Finalize(_process_pool, _process_pool.close, exitpriority=10)
+
+
+def _execute_in_process(name: str, scenario: Callable[[Actions], object], submitted: float) -> ScenarioResult:
+    return _execute(_process_pool, name, scenario, submitted, f'{os.getpid()}/')
+
+
+class Scheduler:
+    """
+    Runs scenarios (callable(actions) -> value) on pool of pre-warmed sessions
+
+    driver_factory / finder_factory / actions_options / reset: see SessionPool
+    workers: parallel sessions
+    mode: 'thread' (sessions shared by worker threads) or 'process' (one session per worker process)
+    """
+    modes = ('thread', 'process')
+
+    def __init__(self, driver_factory: Callable[[], WebDriver], finder_factory: Callable[[WebDriver], Finder],
+                 workers: int = 2, mode: str = 'thread', actions_options: dict = None,
+                 reset: Callable[[Session], None] = None) -> None:
+        if mode not in self.modes: raise ValueError(f'mode has to be one of {self.modes}, got: {mode}')
+        self.workers = workers
+        self.mode = mode
+        self.pool = SessionPool(driver_factory, finder_factory, workers, actions_options, reset)
+        self.__executor = None
+
+    def start(self) -> 'Scheduler':
+        """ launch sessions (done by first run otherwise) """
+        if self.__executor is not None: return self
+        if self.mode == 'thread':
+            self.pool.start()
+            self.__executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='seleniumactions')
+        else:
+            pool = self.pool
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_process,
+                initargs=(pool.driver_factory, pool.finder_factory, pool.actions_options, pool.reset))
+        return self
+
+    def run(self, scenarios: Union[List[Callable], Dict[str, Callable]]) -> RunReport:
+        """ run scenarios (list or {name: scenario}) and wait for all of them """
+        named = list(scenarios.items()) if isinstance(scenarios, dict) else \
+            [(_scenario_name(scenario), scenario) for scenario in scenarios]
+        begin = perf_counter()
+        self.start()
+        warmup = perf_counter() - begin
+        submitted = time.time()
+        if self.mode == 'thread':
+            futures = [self.__executor.submit(_execute, self.pool, name, scenario, submitted)
+                       for name, scenario in named]
+        else:
+            futures = [self.__executor.submit(_execute_in_process, name, scenario, submitted)
+                       for name, scenario in named]
+        results = [future.result() for future in futures]
+        return RunReport(results, perf_counter() - begin - warmup, warmup, self.mode)
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        self.pool.close()
+
+    def __enter__(self) -> 'Scheduler':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
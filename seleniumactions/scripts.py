@@ -0,0 +1,289 @@
+"""
+JavaScript snippets executed in browser by seleniumactions.
+
+LOCATE - function(using, value, root, all) resolving selenium locator strategies in-page,
+returns element (or null) or array of elements when all is true. // XPath is made relative to root element.
+OBSERVE - async script waiting for locator with MutationObserver.
+HOOK_REQUESTS - function installing fetch/XHR hooks counting pending requests of current document
+(no-op when already installed), returns true when it installed them.
+TRACK_REQUESTS - runs HOOK_REQUESTS, settle mode runs it before mutating steps, so requests the step starts are counted.
+SETTLE - async script waiting until page is quiet (document ready, no pending fetch/XHR, animation frames idle),
+installs hooks when missing (tracked: false - requests started before were not counted).
+READ - reads text (attr null) or attribute of elements found by list of locators (within optional root element),
+in one round-trip.
+PIPELINE - runs queued steps (click, clear, set_value, submit, text, attribute) from given index,
+stops on first missing element (to be polled again) or error and returns results of executed steps.
+EVALUATE - evaluates condition tree (all / any / not, locator count, text, attribute, visibility)
+in one round-trip, returns {met, unmet: [ids of sub-conditions which are not met]}.
+PROFILE - times locators lookups in-browser (average of repeated runs), counts matches
+and tells if all locators matched the same (non-empty) set of elements.
+NAVIGATION_TIMING - seconds from navigation start to dom interactive, DOMContentLoaded end and load end
+of current document (Navigation Timing, null values for events which did not happen yet).
+CLEAR_STORAGE - clears localStorage and sessionStorage of current origin (session reset between scenarios).
+"""
+
+SUPPORTED_STRATEGIES = (
+    "id", "name", "xpath", "class name", "css selector", "tag name", "link text", "partial link text"
+)
+
+LOCATE = """function (using, value, root, all) {
+    root = root || document;
+    if (using === 'xpath' && root !== document && value.indexOf('//') === 0) value = '.' + value;
+    var found = [];
+    if (using === 'xpath') {
+        var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < result.snapshotLength; i++) {
+            if (result.snapshotItem(i).nodeType === 1) found.push(result.snapshotItem(i));
+            if (found.length && !all) break;
+        }
+    } else if (using === 'link text' || using === 'partial link text') {
+        var links = root.querySelectorAll('a');
+        for (var j = 0; j < links.length; j++) {
+            var text = (links[j].innerText || links[j].textContent || '').trim();
+            if (using === 'link text' ? text === value : text.indexOf(value) !== -1) found.push(links[j]);
+            if (found.length && !all) break;
+        }
+    } else {
+        var selector = value;
+        if (using === 'id') selector = '[id="' + value + '"]';
+        else if (using === 'name') selector = '[name="' + value + '"]';
+        else if (using === 'class name') selector = '.' + value;
+        if (all) found = Array.prototype.slice.call(root.querySelectorAll(selector));
+        else { var one = root.querySelector(selector); if (one) found.push(one); }
+    }
+    return all ? found : (found[0] || null);
+}"""
+
+OBSERVE = """var using = arguments[0], value = arguments[1], all = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var locate = %s;
+function match() {
+    var found = locate(using, value, document, all);
+    return all ? (found.length ? found : null) : found;
+}
+var found = match();
+if (found) { done(found); return; }
+var timer, observer = new MutationObserver(function () {
+    var result = match();
+    if (result) finish(result);
+});
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+""" % LOCATE
+
+HOOK_REQUESTS = """function () {
+    if (window.__seleniumActionsPending) return false;
+    var pending = window.__seleniumActionsPending = {count: 0};
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            pending.count++;
+            return fetch.apply(this, arguments).finally(function () { pending.count--; });
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        pending.count++;
+        this.addEventListener('loadend', function () { pending.count--; });
+        return send.apply(this, arguments);
+    };
+    return true;
+}"""
+
+TRACK_REQUESTS = "return (%s)();" % HOOK_REQUESTS
+
+SETTLE = """var budgetMs = arguments[0], quietFrames = arguments[1];
+var done = arguments[arguments.length - 1];
+var begin = Date.now();
+var tracked = !(%s)();
+var quiet = 0;
+function next() {
+    var called = false;
+    var go = function () { if (!called) { called = true; check(); } };
+    if (window.requestAnimationFrame) window.requestAnimationFrame(go);
+    setTimeout(go, 50);
+}
+function check() {
+    var elapsed = Date.now() - begin;
+    var idle = document.readyState === 'complete' && window.__seleniumActionsPending.count <= 0;
+    quiet = idle ? quiet + 1 : 0;
+    if (quiet >= quietFrames) done({settled: true, elapsed: elapsed, tracked: tracked});
+    else if (elapsed >= budgetMs) done({settled: false, elapsed: elapsed, tracked: tracked});
+    else next();
+}
+check();
+""" % HOOK_REQUESTS
+
+READ = """var locate = %s;
+var locators = arguments[0], attr = arguments[1], all = arguments[2], root = arguments[3] || document;
+function read(el) {
+    if (attr === null) return el.innerText;
+    var value = el[attr];
+    if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+        value = el.getAttribute(attr);
+    }
+    if (typeof value === 'boolean') return value ? 'true' : null;
+    return value === undefined || value === null ? null : String(value);
+}
+var values = [], missing = [];
+for (var i = 0; i < locators.length; i++) {
+    var found = locate(locators[i][0], locators[i][1], root, all);
+    if (all) {
+        if (!found.length) missing.push(i);
+        values.push(found.map(read));
+    } else {
+        if (!found) missing.push(i);
+        values.push(found ? read(found) : null);
+    }
+}
+return {values: values, missing: missing};
+""" % LOCATE
+
+
+PIPELINE = """var locate = %s;
+var steps = arguments[0], index = arguments[1], root = arguments[2] || document, results = [];
+function fire(el, type) { el.dispatchEvent(new Event(type, {bubbles: true})); }
+function setValue(el, value) {
+    var proto = Object.getPrototypeOf(el);
+    var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+    if (el.focus) el.focus();
+    if (descriptor && descriptor.set) descriptor.set.call(el, value); else el.value = value;
+    fire(el, 'input');
+    fire(el, 'change');
+}
+function read(el, attr) {
+    if (attr === null) return el.innerText;
+    var value = el[attr];
+    if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+        value = el.getAttribute(attr);
+    }
+    if (typeof value === 'boolean') return value ? 'true' : null;
+    return value === undefined || value === null ? null : String(value);
+}
+for (; index < steps.length; index++) {
+    var op = steps[index][0], el = locate(steps[index][1], steps[index][2], root, false), arg = steps[index][3];
+    if (!el) return {results: results, next: index, error: null};
+    try {
+        var value = null;
+        if (op === 'click') el.click();
+        else if (op === 'clear') setValue(el, '');
+        else if (op === 'set_value') setValue(el, arg);
+        else if (op === 'submit') {
+            var form = el.tagName === 'FORM' ? el : (el.form || el.closest('form'));
+            if (form.requestSubmit) form.requestSubmit(); else form.submit();
+        }
+        else if (op === 'text') value = read(el, null);
+        else if (op === 'attribute') value = read(el, arg);
+        else throw new Error('unknown pipeline step: ' + op);
+        results.push(value);
+    } catch (e) {
+        return {results: results, next: index, error: String(e)};
+    }
+}
+return {results: results, next: index, error: null};
+""" % LOCATE
+
+
+EVALUATE = """var locate = %s;
+var tree = arguments[0], root = arguments[1] || document;
+function attribute(el, name) {
+    var value = el[name];
+    if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+        value = el.getAttribute(name);
+    }
+    if (typeof value === 'boolean') return value ? 'true' : null;
+    return value === undefined || value === null ? null : String(value);
+}
+function matches(actual, mode, expected) {
+    if (actual === null || actual === undefined) return false;
+    if (mode === 'present') return true;
+    if (mode === 'is') return actual === expected;
+    if (mode === 'contains') return actual.indexOf(expected) !== -1;
+    if (mode === 'matches') return new RegExp(expected).test(actual);
+    throw new Error('unknown match mode: ' + mode);
+}
+function visible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+function evaluate(node, unmet) {
+    var met, i;
+    if (node.op === 'all') {
+        met = true;
+        for (i = 0; i < node.args.length; i++) if (!evaluate(node.args[i], unmet)) met = false;
+        return met;
+    }
+    if (node.op === 'any') {
+        var reasons = [];
+        for (i = 0; i < node.args.length; i++) if (evaluate(node.args[i], reasons)) return true;
+        Array.prototype.push.apply(unmet, reasons);
+        return false;
+    }
+    if (node.op === 'not') met = !evaluate(node.arg, []);
+    else if (node.op === 'count') {
+        var count = locate(node.using, node.value, root, true).length;
+        met = count >= node.min && (node.max === null || count <= node.max);
+    } else {
+        var el = locate(node.using, node.value, root, false);
+        if (!el) met = false;
+        else if (node.op === 'text') {
+            met = matches((el.innerText || el.textContent || '').trim(), node.mode, node.expected);
+        }
+        else if (node.op === 'attribute') met = matches(attribute(el, node.name), node.mode, node.expected);
+        else if (node.op === 'visible') met = visible(el);
+        else throw new Error('unknown condition: ' + node.op);
+    }
+    if (!met) unmet.push(node.id);
+    return met;
+}
+var unmet = [];
+return {met: evaluate(tree, unmet), unmet: unmet};
+""" % LOCATE
+
+
+PROFILE = """var locate = %s;
+var locators = arguments[0], repeat = arguments[1], results = [], first = null, same = true;
+for (var i = 0; i < locators.length; i++) {
+    var using = locators[i][0], value = locators[i][1];
+    try {
+        var found = locate(using, value, document, true);
+        var begin = performance.now();
+        for (var r = 0; r < repeat; r++) locate(using, value, document, true);
+        results.push({ms: (performance.now() - begin) / repeat, count: found.length, error: null});
+    } catch (e) {
+        results.push({ms: null, count: 0, error: String(e)});
+        same = false;
+        continue;
+    }
+    if (first === null) { first = found; continue; }
+    if (found.length !== first.length) { same = false; continue; }
+    for (var j = 0; j < found.length; j++) if (found[j] !== first[j]) { same = false; break; }
+}
+return {results: results, same: same && first !== null && first.length > 0};
+""" % LOCATE
+
+
+NAVIGATION_TIMING = """var nav = performance.getEntriesByType ? performance.getEntriesByType('navigation')[0] : null;
+function seconds(ms) { return ms > 0 ? ms / 1000 : null; }
+if (nav) {
+    return {interactive: seconds(nav.domInteractive), content_loaded: seconds(nav.domContentLoadedEventEnd),
+            loaded: seconds(nav.loadEventEnd)};
+}
+var t = performance.timing;
+if (!t) return null;
+return {interactive: seconds(t.domInteractive - t.navigationStart),
+        content_loaded: seconds(t.domContentLoadedEventEnd - t.navigationStart),
+        loaded: seconds(t.loadEventEnd - t.navigationStart)};
+"""
+
+
+CLEAR_STORAGE = """try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
@@ -0,0 +1,30 @@
+"""
+Stats:
+
+Summaries of measured values (seconds) shared by benchmark, navigation and scheduler reports.
+
+Example usage:
+    from seleniumactions.stats import summary
+
+    summary([0.1, 0.2, 0.4])  # -> {'count': 3, 'p50': 0.2, 'p95': 0.4, 'p99': 0.4, 'total': 0.7...}
+"""
+import math
+from typing import List
+
+
+def percentile(values: List[float], p: float) -> float:
+    """ nearest-rank percentile, p in 0..100 """
+    if not values: return 0.0
+    ordered = sorted(values)
+    rank = min(max(1, math.ceil(p / 100 * len(ordered))), len(ordered))
+    return ordered[rank - 1]
+
+
+def summary(values: List[float]) -> dict:
+    return {
+        'count': len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'total': sum(values)
+    }
@@ -0,0 +1,7 @@
+"""
+Test support - not used by the library at runtime.
+
+fakes - FakeWebDriver answering WebDriver commands from in-memory browser state (no browser needed),
+used by the test suite and the benchmark harness (seleniumactions.benchmark). It emulates selenium's
+command protocol and scripts, so it follows the selenium version the package is tested with.
+"""
@@ -0,0 +1,519 @@
+"""
+Fake WebDriver stand-in for tests and benchmarks (no browser needed), test support - see seleniumactions.testing.
+
+FakeWebDriver is a real selenium WebDriver talking to FakeCommandExecutor instead of a browser,
+so every call goes through the regular command path (WebElement, ActionChains, execute_script ...).
+FakeBrowser holds pages with elements which can appear with a delay after page load.
+Browser side of seleniumactions scripts (OBSERVE, TRACK_REQUESTS, SETTLE, READ, PIPELINE, EVALUATE, PROFILE,
+NAVIGATION_TIMING) is emulated in python.
+
+Example:
+    browser = FakeBrowser()
+    browser.add_element(('id', 'home'), text='Home', appear_after=0.2)
+    driver = FakeWebDriver(browser, latency=0.001)
+"""
+import base64
+import json
+import pkgutil
+import re
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumactions import scripts
+
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+SHADOW_KEY = 'shadow-6066-11e4-a52e-4f735466cecf'
+# WebElement.get_attribute sends selenium's bundled getAttribute atom, recognized by its source
+GET_ATTRIBUTE = 'return (%s).apply(null, arguments);' % pkgutil.get_data(
+    'selenium.webdriver.remote', 'getAttribute.js').decode('utf8')
+
+
+def w3c_locator(locator_tuple: tuple) -> tuple:
+    """
+    same translation selenium does before sending find command (id, name, class -> css selector),
+    relative .// XPath is the same as // one (scope is given by root element)
+    """
+    using, value = locator_tuple
+    if using == 'id': return ('css selector', f'[id="{value}"]')
+    if using == 'name': return ('css selector', f'[name="{value}"]')
+    if using == 'class name': return ('css selector', f'.{value}')
+    if using == 'tag name': return ('css selector', value)
+    if using == 'xpath' and value.startswith('.//'): return (using, value[1:])
+    return (using, value)
+
+
+class FakeElement:
+    """
+    Element registered on fake page, aliases - other locators matching it, parent - containing element
+    frame - element is iframe (children are in its document), shadow - children are in element's shadow root
+    """
+    def __init__(self, locator_tuple: tuple, text: str = '', appear_after: float = 0,
+                 attributes: dict = None, aliases: List[tuple] = None, parent: 'FakeElement' = None,
+                 frame: bool = False, shadow: bool = False) -> None:
+        self.locator_tuple = w3c_locator(locator_tuple)
+        self.aliases = [w3c_locator(alias) for alias in aliases or ()]
+        self.parent = parent
+        self.text = text
+        self.appear_after = appear_after
+        self.attributes = dict(attributes or {})
+        self.frame = frame
+        self.shadow = shadow
+        self.request_on_click = 0.0
+        self.clicks = 0
+        self.submits = 0
+
+    def boundary(self) -> 'FakeElement':
+        """ closest iframe or shadow host containing element (None - top document) """
+        parent = self.parent
+        while parent is not None and not (parent.frame or parent.shadow): parent = parent.parent
+        return parent
+
+    def document(self) -> 'FakeElement':
+        """ iframe containing element (None - top document) """
+        parent = self.parent
+        while parent is not None and not parent.frame: parent = parent.parent
+        return parent
+
+    def within(self, root: 'FakeElement') -> bool:
+        parent = self.parent
+        while parent is not None and parent is not root: parent = parent.parent
+        return parent is root
+
+
+class FakePage:
+    """ Page with title, elements and Navigation Timing (seconds, see scripts.NAVIGATION_TIMING) """
+    def __init__(self, url: str, title: str = '') -> None:
+        self.url = url
+        self.title = title
+        self.elements: List[FakeElement] = []
+        self.timing = {'interactive': 0.01, 'content_loaded': 0.02, 'loaded': 0.05}
+
+
+class FakeBrowser:
+    """
+    Browser state: pages, current page and its load time (elements appear relative to it)
+
+    Elements from previous page load are stale after navigation, as are elements of other frame than current one.
+    Requests (fetch / XHR) are counted by settle only when request hooks were installed before they started,
+    hooks_on_new_document - hooks are in every loaded document (registered with CDP).
+    """
+    def __init__(self, url: str = 'about:blank') -> None:
+        self.pages: Dict[str, FakePage] = {}
+        self.generation = 0
+        self.loaded_at = time.monotonic()
+        self.url = url
+        self.cookies: Dict[str, dict] = {}
+        self.timeouts = {'implicit': 0, 'pageLoad': 300000, 'script': 30000}
+        self.frame: FakeElement = None
+        self.hooks_on_new_document = False
+        self.tracking = False
+        self.requests: List[float] = []
+        self.page(url)
+
+    def page(self, url: str, title: str = None) -> FakePage:
+        if url not in self.pages: self.pages[url] = FakePage(url)
+        if title is not None: self.pages[url].title = title
+        return self.pages[url]
+
+    @property
+    def current(self) -> FakePage:
+        return self.page(self.url)
+
+    def add_element(self, locator_tuple: tuple, text: str = '', appear_after: float = 0,
+                    attributes: dict = None, url: str = None, aliases: List[tuple] = None,
+                    parent: FakeElement = None, frame: bool = False, shadow: bool = False) -> FakeElement:
+        element = FakeElement(locator_tuple, text, appear_after, attributes, aliases, parent, frame, shadow)
+        self.page(url or self.url).elements.append(element)
+        return element
+
+    def load(self, url: str) -> None:
+        self.url = url
+        self.generation += 1
+        self.frame = None
+        self.tracking = self.hooks_on_new_document
+        self.requests = []
+        self.loaded_at = time.monotonic()
+        for element in self.current.elements:
+            element.attributes.pop('value', None)
+
+    def request(self, seconds: float) -> None:
+        """ page starts fetch / XHR taking seconds, counted only when hooks are installed """
+        if self.tracking: self.requests.append(time.monotonic() + seconds)
+
+    def visible(self, locator_tuple: tuple, root: FakeElement = None,
+                shadow_host: FakeElement = None) -> List[FakeElement]:
+        """
+        elements matching locator which already appeared in current frame
+        (within root element / in shadow root of shadow_host when given)
+        """
+        elapsed = time.monotonic() - self.loaded_at
+        locator_tuple = w3c_locator(locator_tuple)
+        boundary = root.boundary() if root is not None else shadow_host or self.frame
+        return [e for e in self.current.elements
+                if e.locator_tuple == locator_tuple or locator_tuple in e.aliases
+                if e.appear_after <= elapsed and e.boundary() is boundary and (root is None or e.within(root))]
+
+    def visible_elements(self) -> List[FakeElement]:
+        """ elements of current page which already appeared """
+        elapsed = time.monotonic() - self.loaded_at
+        return [e for e in self.current.elements if e.appear_after <= elapsed]
+
+    def element_id(self, element: FakeElement) -> str:
+        return f'{self.generation}:{self.current.elements.index(element)}'
+
+    def element(self, element_id: str) -> FakeElement:
+        generation, index = element_id.split(':')
+        if int(generation) != self.generation: raise StaleElement(element_id)
+        element = self.current.elements[int(index)]
+        if element.document() is not self.frame: raise StaleElement(f'{element_id} is in other frame')
+        return element
+
+
+class FakeError(Exception):
+    error = 'unknown error'
+
+
+class NoSuchElement(FakeError):
+    error = 'no such element'
+
+
+class StaleElement(FakeError):
+    error = 'stale element reference'
+
+
+class JavascriptError(FakeError):
+    error = 'javascript error'
+
+
+class NoSuchFrame(FakeError):
+    error = 'no such frame'
+
+
+class NoSuchShadowRoot(FakeError):
+    error = 'no such shadow root'
+
+
+class ClickIntercepted(FakeError):
+    error = 'element click intercepted'
+
+
+class GridError(FakeError):
+    """ generic error with Grid proxy message (hub lost connection to node) """
+    def __init__(self, message: str = 'Unable to execute request for an existing session: connection reset') -> None:
+        super().__init__(message)
+
+
+def observe(browser: FakeBrowser, args: list):
+    """ browser side of scripts.OBSERVE """
+    using, value, all, timeout_ms = args
+    end = time.monotonic() + timeout_ms / 1000
+    while True:
+        found = browser.visible((using, value))
+        if found:
+            refs = [{ELEMENT_KEY: browser.element_id(e)} for e in found]
+            return refs if all else refs[0]
+        if time.monotonic() >= end: return None
+        time.sleep(0.001)
+
+
+def track_requests(browser: FakeBrowser, args: list):
+    """ browser side of scripts.TRACK_REQUESTS """
+    installed = not browser.tracking
+    browser.tracking = True
+    return installed
+
+
+def settle(browser: FakeBrowser, args: list):
+    """ browser side of scripts.SETTLE - quiet when no counted request is pending """
+    budget_ms, _ = args
+    tracked = not track_requests(browser, args)
+    begin = time.monotonic()
+    while True:
+        elapsed = time.monotonic() - begin
+        if not [end for end in browser.requests if end > time.monotonic()]:
+            return {'settled': True, 'elapsed': int(elapsed * 1000), 'tracked': tracked}
+        if elapsed * 1000 >= budget_ms: return {'settled': False, 'elapsed': int(elapsed * 1000), 'tracked': tracked}
+        time.sleep(0.001)
+
+
+def script_root(browser: FakeBrowser, root: dict) -> dict:
+    """ FakeBrowser.visible kwargs for root argument of page scripts - element or shadow root (None - whole frame) """
+    if not root: return {}
+    if SHADOW_KEY in root: return {'shadow_host': browser.element(root[SHADOW_KEY])}
+    return {'root': browser.element(root[ELEMENT_KEY])}
+
+
+def read(browser: FakeBrowser, args: list):
+    """ browser side of scripts.READ """
+    locators, attr, all, root = args
+    root = script_root(browser, root)
+    values, missing = [], []
+    for i, locator_tuple in enumerate(locators):
+        found = browser.visible(tuple(locator_tuple), **root)
+        extracted = [e.text if attr is None else e.attributes.get(attr) for e in found]
+        if not found: missing.append(i)
+        values.append(extracted if all else (extracted[0] if found else None))
+    return {'values': values, 'missing': missing}
+
+
+def pipeline(browser: FakeBrowser, args: list):
+    """ browser side of scripts.PIPELINE """
+    steps, index, root = args
+    root = script_root(browser, root)
+    results = []
+    for index in range(index, len(steps)):
+        op, using, value, arg = steps[index]
+        found = browser.visible((using, value), **root)
+        if not found: return {'results': results, 'next': index, 'error': None}
+        element, result = found[0], None
+        if op == 'click': element.clicks += 1
+        elif op == 'clear': element.attributes['value'] = ''
+        elif op == 'set_value': element.attributes['value'] = arg
+        elif op == 'submit': element.submits += 1
+        elif op == 'text': result = element.text
+        elif op == 'attribute': result = element.attributes.get(arg)
+        else: return {'results': results, 'next': index, 'error': f'Error: unknown pipeline step: {op}'}
+        results.append(result)
+    return {'results': results, 'next': len(steps), 'error': None}
+
+
+def evaluate(browser: FakeBrowser, args: list):
+    """ browser side of scripts.EVALUATE - element is visible unless it has 'hidden' attribute """
+    tree, root = args
+    root = script_root(browser, root)
+
+    def matches(actual, mode: str, expected) -> bool:
+        if actual is None: return False
+        if mode == 'present': return True
+        if mode == 'is': return actual == expected
+        if mode == 'contains': return expected in actual
+        return re.search(expected, actual) is not None
+
+    def check(node: dict, unmet: list) -> bool:
+        if node['op'] == 'all':
+            met = [check(arg, unmet) for arg in node['args']]
+            return all(met)
+        if node['op'] == 'any':
+            reasons = []
+            if any(check(arg, reasons) for arg in node['args']): return True
+            unmet.extend(reasons)
+            return False
+        if node['op'] == 'not': met = not check(node['arg'], [])
+        else:
+            found = browser.visible((node['using'], node['value']), **root)
+            if node['op'] == 'count':
+                met = len(found) >= node['min'] and (node['max'] is None or len(found) <= node['max'])
+            elif not found: met = False
+            elif node['op'] == 'text': met = matches(found[0].text.strip(), node['mode'], node['expected'])
+            elif node['op'] == 'attribute':
+                met = matches(found[0].attributes.get(node['name']), node['mode'], node['expected'])
+            else: met = not found[0].attributes.get('hidden')
+        if not met: unmet.append(node['id'])
+        return met
+
+    unmet = []
+    return {'met': check(tree, unmet), 'unmet': unmet}
+
+
+def profile(browser: FakeBrowser, args: list):
+    """ browser side of scripts.PROFILE """
+    locators, repeat = args
+    results, matched = [], []
+    for using, value in locators:
+        found = browser.visible((using, value))
+        begin = time.perf_counter()
+        for _ in range(repeat):
+            browser.visible((using, value))
+        results.append({'ms': (time.perf_counter() - begin) * 1000 / max(repeat, 1), 'count': len(found),
+                        'error': None})
+        matched.append([id(e) for e in found])
+    return {'results': results, 'same': bool(matched[0]) and all(m == matched[0] for m in matched)}
+
+
+def navigation_timing(browser: FakeBrowser, args: list):
+    """ browser side of scripts.NAVIGATION_TIMING """
+    return dict(browser.current.timing)
+
+
+class FakeCommandExecutor:
+    """
+    Command executor answering WebDriver commands from FakeBrowser state
+
+    latency: seconds slept on every command (simulated HTTP round-trip)
+    scripts: handlers for execute_script / execute_async_script, {script: handler(browser, args)}
+    commands: Counter of executed commands
+    faults: errors to answer commands with instead of executing them, {command: [FakeError, ...]}, see fail
+    """
+    def __init__(self, browser: FakeBrowser, latency: float = 0) -> None:
+        self.browser = browser
+        self.latency = latency
+        self.scripts: Dict[str, Callable] = {scripts.OBSERVE: observe, scripts.SETTLE: settle, scripts.READ: read,
+                                             scripts.TRACK_REQUESTS: track_requests,
+                                             scripts.PIPELINE: pipeline, scripts.EVALUATE: evaluate,
+                                             scripts.PROFILE: profile, scripts.NAVIGATION_TIMING: navigation_timing}
+        self.commands = Counter()
+        self.faults: Dict[str, List[FakeError]] = {}
+
+    def fail(self, command: str, error: FakeError, times: int = 1) -> None:
+        """ answer next `times` calls of command with error (ex: fail('clickElement', ClickIntercepted('overlay'))) """
+        self.faults.setdefault(command, []).extend([error] * times)
+
+    def execute(self, command: str, params: dict) -> dict:
+        self.commands[command] += 1
+        if self.latency: time.sleep(self.latency)
+        handler = getattr(self, f'_cmd_{command}', None)
+        try:
+            if self.faults.get(command): raise self.faults[command].pop(0)
+            value = handler(params or {}) if handler else None
+        except FakeError as e:
+            return {'status': 404, 'value': json.dumps({'value': {'error': e.error, 'message': str(e)}})}
+        return {'value': value}
+
+    def close(self) -> None:
+        pass
+
+    def _ref(self, element: FakeElement) -> dict:
+        return {ELEMENT_KEY: self.browser.element_id(element)}
+
+    def _element(self, params: dict) -> FakeElement:
+        return self.browser.element(params['id'])
+
+    def _cmd_newSession(self, params):
+        return {'sessionId': 'fake-session', 'capabilities': {'browserName': 'fake'}}
+
+    def _cmd_get(self, params):
+        self.browser.load(params['url'])
+
+    def _cmd_refresh(self, params):
+        self.browser.load(self.browser.url)
+
+    def _cmd_getTimeouts(self, params):
+        return dict(self.browser.timeouts)
+
+    def _cmd_setTimeouts(self, params):
+        self.browser.timeouts.update({k: v for k, v in params.items() if k in self.browser.timeouts})
+
+    def _cmd_getCurrentUrl(self, params):
+        return self.browser.url
+
+    def _cmd_getTitle(self, params):
+        return self.browser.current.title
+
+    def _cmd_addCookie(self, params):
+        cookie = params['cookie']
+        self.browser.cookies[cookie['name']] = cookie
+
+    def _cmd_getAllCookies(self, params):
+        return list(self.browser.cookies.values())
+
+    def _cmd_deleteAllCookies(self, params):
+        self.browser.cookies.clear()
+
+    def _cmd_screenshot(self, params):
+        return base64.b64encode(f'PNG {self.browser.url} {self.browser.generation}'.encode()).decode()
+
+    def _cmd_getPageSource(self, params):
+        elements = ''.join(f'<div data-locator="{e.locator_tuple}">{e.text}</div>'
+                           for e in self.browser.visible_elements())
+        return f'<html><head><title>{self.browser.current.title}</title></head><body>{elements}</body></html>'
+
+    def _cmd_findElement(self, params):
+        found = self.browser.visible((params['using'], params['value']))
+        if not found: raise NoSuchElement(f'{params["using"]}={params["value"]}')
+        return self._ref(found[0])
+
+    def _cmd_findElements(self, params):
+        return [self._ref(e) for e in self.browser.visible((params['using'], params['value']))]
+
+    def _cmd_findChildElement(self, params):
+        found = self.browser.visible((params['using'], params['value']), self._element(params))
+        if not found: raise NoSuchElement(f'{params["using"]}={params["value"]} in {params["id"]}')
+        return self._ref(found[0])
+
+    def _cmd_findChildElements(self, params):
+        return [self._ref(e) for e in self.browser.visible((params['using'], params['value']), self._element(params))]
+
+    def _cmd_switchToFrame(self, params):
+        reference = params.get('id')
+        if reference is None:
+            self.browser.frame = None
+            return
+        element = self.browser.element(reference[ELEMENT_KEY]) if isinstance(reference, dict) else None
+        if element is None or not element.frame: raise NoSuchFrame(str(reference))
+        self.browser.frame = element
+
+    def _cmd_switchToParentFrame(self, params):
+        if self.browser.frame is not None: self.browser.frame = self.browser.frame.document()
+
+    def _cmd_getShadowRoot(self, params):
+        element = self._element(params)
+        if not element.shadow: raise NoSuchShadowRoot(params['id'])
+        return {SHADOW_KEY: params['id']}
+
+    def _cmd_findElementFromShadowRoot(self, params):
+        found = self.browser.visible((params['using'], params['value']), shadow_host=self._shadow_host(params))
+        if not found: raise NoSuchElement(f'{params["using"]}={params["value"]} in shadow root {params["shadowId"]}')
+        return self._ref(found[0])
+
+    def _cmd_findElementsFromShadowRoot(self, params):
+        return [self._ref(e) for e in self.browser.visible((params['using'], params['value']),
+                                                           shadow_host=self._shadow_host(params))]
+
+    def _shadow_host(self, params: dict) -> FakeElement:
+        try:
+            return self.browser.element(params['shadowId'])
+        except StaleElement:
+            raise FakeError(f'detached shadow root {params["shadowId"]}')
+
+    def _cmd_clickElement(self, params):
+        element = self._element(params)
+        element.clicks += 1
+        if element.request_on_click: self.browser.request(element.request_on_click)
+
+    def _cmd_clearElement(self, params):
+        self._element(params).attributes['value'] = ''
+
+    def _cmd_sendKeysToElement(self, params):
+        element = self._element(params)
+        element.attributes['value'] = element.attributes.get('value', '') + params.get('text', '')
+
+    def _cmd_getElementTagName(self, params):
+        return self._element(params).attributes.get('tag', 'div')
+
+    def _cmd_getElementText(self, params):
+        return self._element(params).text
+
+    def _cmd_getElementAttribute(self, params):
+        return self._element(params).attributes.get(params['name'])
+
+    def _cmd_getElementProperty(self, params):
+        return self._element(params).attributes.get(params['name'])
+
+    def _cmd_w3cExecuteScript(self, params):
+        return self._script(params)
+
+    def _cmd_w3cExecuteScriptAsync(self, params):
+        return self._script(params)
+
+    def _script(self, params):
+        script, args = params['script'], params.get('args', [])
+        if script == GET_ATTRIBUTE:
+            element = self.browser.element(args[0][ELEMENT_KEY])
+            return element.text if args[1] == 'innerText' else element.attributes.get(args[1])
+        if script in self.scripts:
+            return self.scripts[script](self.browser, args)
+        return None
+
+
+class FakeWebDriver(WebDriver):
+    """ selenium WebDriver backed by FakeCommandExecutor """
+    def __init__(self, browser: FakeBrowser = None, latency: float = 0) -> None:
+        super().__init__(command_executor=FakeCommandExecutor(browser or FakeBrowser(), latency))
+
+    @property
+    def browser(self) -> FakeBrowser:
+        return self.command_executor.browser
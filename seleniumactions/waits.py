@@ -0,0 +1,194 @@
+"""
+Waits:
+
+PollingWait is a drop-in replacement for selenium WebDriverWait, which polls with a fixed 0.5 sec interval.
+Delays between condition checks are taken from a PollingStrategy:
+- FixedPolling - same behaviour as WebDriverWait (default)
+- BackoffPolling - exponential backoff starting at few miliseconds, with a cap and jitter
+
+Example usage:
+    from seleniumactions import FluentFinder, BackoffPolling
+
+    finder = FluentFinder(driver, timeouts=timeouts, default_timeout=5, polling=BackoffPolling())
+    finder.find_element(loc)  # uses finder polling strategy
+    finder.find_element(loc, polling=FixedPolling(0.1))  # per call override
+
+Fail-fast waits - failure conditions are checked in the same poll as the expected one,
+wait aborts with FailureConditionMet as soon as one of them is met:
+    finder.fail_on = [LocatorExists(ERROR_TOAST)]  # every wait of the finder
+    actions.wait_for(LocatorExists(TABLE), fail_on=[LocatorExists(ERROR_500)])  # single wait
+"""
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, List
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from seleniumactions.instrumentation import current_span, waiting
+
+
+class FailureConditionMet(TimeoutException):
+    """
+    Wait aborted because failure condition was met before the expected one.
+    condition: failure condition which won, elapsed: seconds since wait start, value: what condition returned
+    """
+    def __init__(self, condition, elapsed: float, value=None, screen=None, stacktrace=None) -> None:
+        super().__init__(f'{condition} met after {round(elapsed, 3)} sec', screen, stacktrace)
+        self.condition = condition
+        self.elapsed = elapsed
+        self.value = value
+
+
+class PollingStrategy(ABC):
+    """
+    Abstraction for delays between condition checks
+
+    immediate: check condition right away (True) or wait first interval before the first check (False)
+    """
+    immediate = True
+
+    @abstractmethod
+    def intervals(self) -> Iterator[float]:
+        """ yields delays (in seconds) between consecutive condition checks """
+        pass
+
+
+class FixedPolling(PollingStrategy):
+    """
+    Fixed delay between checks, same as selenium WebDriverWait (0.5 sec by default)
+    """
+    def __init__(self, interval: float = 0.5, immediate: bool = True) -> None:
+        if interval <= 0: raise ValueError(f'Polling interval must be positive, got {interval}')
+        self.interval = interval
+        self.immediate = immediate
+
+    def intervals(self) -> Iterator[float]:
+        while True:
+            yield self.interval
+
+    def __str__(self):
+        return f'fixed polling -> {self.interval} sec'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class BackoffPolling(PollingStrategy):
+    """
+    Exponential backoff between checks
+
+    Parameters:
+    initial: first delay in seconds
+    factor: delay multiplier applied after every check
+    cap: max delay in seconds
+    jitter: random +/- fraction applied to each delay (0.1 -> +/-10%), spreads checks of parallel sessions
+    immediate: check condition right away, then backoff (default) or start with initial delay
+    seed: seed for jitter random generator (for reproducible runs)
+
+    Example:
+    BackoffPolling()  # 5ms, 10ms, 20ms ... 250ms, 250ms ...
+    BackoffPolling(initial=0.01, factor=1.5, cap=1, jitter=0)
+    """
+    def __init__(self, initial: float = 0.005, factor: float = 2.0, cap: float = 0.25,
+                 jitter: float = 0.1, immediate: bool = True, seed: int = None) -> None:
+        if initial <= 0 or cap <= 0: raise ValueError('Polling initial delay and cap must be positive')
+        if factor < 1: raise ValueError(f'Backoff factor must be >= 1, got {factor}')
+        if not 0 <= jitter < 1: raise ValueError(f'Jitter must be in [0, 1) range, got {jitter}')
+        self.initial = initial
+        self.factor = factor
+        self.cap = cap
+        self.jitter = jitter
+        self.immediate = immediate
+        self.__random = random.Random(seed)
+
+    def intervals(self) -> Iterator[float]:
+        delay = min(self.initial, self.cap)
+        while True:
+            if self.jitter:
+                yield delay * (1 + self.__random.uniform(-self.jitter, self.jitter))
+            else:
+                yield delay
+            delay = min(delay * self.factor, self.cap)
+
+    def __str__(self):
+        return f'backoff polling -> {self.initial}..{self.cap} sec, x{self.factor}, jitter {self.jitter}'
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class PollingWait:
+    """
+    WebDriverWait counterpart using PollingStrategy for delays between checks.
+    Last check is always made at the timeout deadline, so condition met just before timeout is not missed.
+
+    fail_on: failure conditions checked in the same poll, first one met aborts the wait (FailureConditionMet).
+    After the wait .won is the condition which ended it (None on timeout) and .elapsed seconds it took,
+    both are also stored in current instrumentation span when there were failure conditions.
+
+    Example:
+    PollingWait(driver, 5, BackoffPolling()).until(LocatorExists(("id", "home")))
+    PollingWait(driver, 5, fail_on=[LocatorExists(("id", "error"))]).until(LocatorExists(("id", "home")))
+    """
+    def __init__(self, driver: WebDriver, timeout: float, polling: PollingStrategy = None,
+                 ignored_exceptions: tuple = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep,
+                 fail_on: List[Callable] = None) -> None:
+        self.driver = driver
+        self.timeout = float(timeout)
+        self.polling = polling or FixedPolling()
+        self.ignored_exceptions = (NoSuchElementException,) + tuple(ignored_exceptions or ())
+        self.fail_on = list(fail_on or ())
+        self.won = None
+        self.elapsed = None
+        self.__clock = clock
+        self.__sleep = sleep
+
+    def until(self, method: Callable, message: str = ''):
+        """ Calls method with driver until its return value is truthy, raises TimeoutException otherwise """
+        with waiting():
+            return self.__until(method, message)
+
+    def __until(self, method: Callable, message: str):
+        screen, stacktrace = None, None
+        begin = self.__clock()
+        end = begin + self.timeout
+        intervals = self.polling.intervals()
+        if not self.polling.immediate:
+            self.__sleep(max(0.0, min(next(intervals), end - self.__clock())))
+        while True:
+            try:
+                value = method(self.driver)
+                if value: return self.__finish(method, begin, value)
+            except self.ignored_exceptions as e:
+                screen = getattr(e, 'screen', None)
+                stacktrace = getattr(e, 'stacktrace', None)
+            for condition in self.fail_on:
+                try:
+                    matched = condition(self.driver)
+                except self.ignored_exceptions:
+                    matched = False
+                if matched:
+                    self.__finish(condition, begin)
+                    raise FailureConditionMet(condition, self.elapsed, matched, screen, stacktrace)
+            remaining = end - self.__clock()
+            if remaining <= 0: break
+            self.__sleep(min(next(intervals), remaining))
+        self.__finish(None, begin)
+        raise TimeoutException(message, screen, stacktrace)
+
+    def __finish(self, condition, begin: float, value=None):
+        self.won = condition
+        self.elapsed = self.__clock() - begin
+        span = current_span()
+        if span is not None and self.fail_on:
+            span.attributes['won'] = str(condition) if condition is not None else 'timeout'
+            span.attributes['won_after'] = self.elapsed
+        return value
+
+    def __str__(self):
+        return f'polling wait -> {self.timeout} sec, {self.polling}'
+
+    def __repr__(self):
+        return self.__str__()
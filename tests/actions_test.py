@@ -0,0 +1,145 @@
+import time
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions import scripts
+from seleniumactions.conditions import LocatorExists
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.observers import ObserverFinder
+from seleniumactions.testing.fakes import FakeWebDriver, JavascriptError
+from seleniumactions.waits import FailureConditionMet
+
+
+def broken(browser, args):
+    raise JavascriptError('settle failed')
+
+
+class CdpWebDriver(FakeWebDriver):
+    """ fake driver with Chrome DevTools Protocol, scripts added for new documents run in every loaded page """
+    def __init__(self) -> None:
+        super().__init__()
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        self.cdp.append((cmd, cmd_args))
+        if cmd == 'Page.addScriptToEvaluateOnNewDocument': self.browser.hooks_on_new_document = True
+        return {}
+
+
+@pytest.mark.usefixtures('fake')
+class ActionsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.button = self.driver.browser.add_element(('id', 'button'), text='Click me')
+        self.input = self.driver.browser.add_element(('name', 'email'))
+        self.finder = self.fake.finder()
+
+    def test_click_and_type(self):
+        actions = self.fake.actions(self.finder)
+        actions.click(('id', 'button'))
+        actions.type_text(('name', 'email'), 'jimmy@choo.io')
+        assert self.button.clicks == 1
+        assert actions.get_attribute(('name', 'email'), 'value') == 'jimmy@choo.io'
+        assert actions.get_text(('id', 'button')) == 'Click me'
+
+    def test_settle_mode(self):
+        actions = self.fake.actions(self.finder, wait_between=0.5, settle=True)
+        begin = time.monotonic()
+        actions.click(('id', 'button'))
+        actions.clear(('name', 'email'))
+        assert time.monotonic() - begin < 0.5
+        assert actions.settle_stats.count == 2
+        assert actions.settle_stats.budget == 1.0
+        assert actions.settle_stats.saved > 0.5
+        assert actions.settle_stats.timeouts == 0
+
+    def test_settle_waits_for_request_started_by_step(self):
+        self.button.request_on_click = 0.15
+        actions = self.fake.actions(self.finder, wait_between=1, settle=True)
+        begin = time.monotonic()
+        actions.click(('id', 'button'))
+        assert time.monotonic() - begin >= 0.15
+        actions.click(('id', 'button'))  # settle found hooks in the document, no extra script call
+        assert self.driver.command_executor.commands['w3cExecuteScript'] == 1
+        assert actions.settle_stats.untracked == 0 and actions.settle_stats.timeouts == 0
+
+    def test_request_hooks_registered_for_new_documents(self):
+        session = self.fake.new(CdpWebDriver)
+        driver = session.driver
+        driver.browser.add_element(('id', 'button'), url='https://some.site.io').request_on_click = 0.15
+        actions = session.actions(wait_between=1, settle=True)
+        actions.goto('https://some.site.io')
+        begin = time.monotonic()
+        actions.click(('id', 'button'))
+        assert time.monotonic() - begin >= 0.15
+        assert [cmd for cmd, _ in driver.cdp] == ['Page.addScriptToEvaluateOnNewDocument']
+        assert driver.command_executor.commands['w3cExecuteScript'] == 1  # current document only
+
+    def test_settle_fallback_sleeps(self):
+        self.driver.command_executor.scripts[scripts.SETTLE] = broken
+        actions = self.fake.actions(self.finder, wait_between=0.1, settle=True)
+        assert actions.settle_page() >= 0.1
+        assert actions.settle_stats.timeouts == 1
+
+    def test_settle_skipped_without_budget(self):
+        actions = self.fake.actions(self.finder, settle=True)
+        actions.click(('id', 'button'))
+        assert self.driver.command_executor.commands['w3cExecuteScriptAsync'] == 0
+
+    def test_batch_reads(self):
+        for i in range(3):
+            self.driver.browser.add_element(('css selector', 'td'), text=f'cell {i}', attributes={'title': f't{i}'})
+        actions = self.fake.actions(self.finder)
+        assert actions.get_texts([('id', 'button'), ('css selector', 'td')]) == ['Click me', 'cell 0']
+        assert actions.get_texts({'button': ('id', 'button')}) == {'button': 'Click me'}
+        assert actions.get_attributes([('css selector', 'td')], attr='title') == ['t0']
+        assert actions.get_all_texts(('css selector', 'td')) == ['cell 0', 'cell 1', 'cell 2']
+        assert actions.get_all_attributes(('css selector', 'td'), attr='title') == ['t0', 't1', 't2']
+        assert self.driver.command_executor.commands['w3cExecuteScript'] == 5
+        assert self.driver.command_executor.commands['findElement'] == 0
+
+    def test_batch_read_waits_for_whole_batch(self):
+        self.driver.browser.add_element(('id', 'late'), text='Late', appear_after=0.1)
+        actions = self.fake.actions(self.finder)
+        assert actions.get_texts([('id', 'button'), ('id', 'late')]) == ['Click me', 'Late']
+        with self.assertRaises(TimeoutException) as e:
+            actions.get_texts([('id', 'button'), ('id', 'missing')], explicit_timeout=0.1)
+        assert "('id', 'missing')" in e.exception.msg
+
+    def test_wait_for_fails_fast_on_error_toast(self):
+        toast = LocatorExists(('css selector', '.error-toast'))
+        self.driver.browser.add_element(('css selector', '.error-toast'), appear_after=0.1)
+        actions = self.fake.actions(self.finder, wait_for_condition_timeout=5)
+        sink = instrumentation.add_sink(MemorySink())
+        begin = time.monotonic()
+        try:
+            with self.assertRaises(FailureConditionMet) as e:
+                actions.wait_for(LocatorExists(('id', 'table')), fail_on=[toast])
+        finally:
+            instrumentation.remove_sink(sink)
+        assert time.monotonic() - begin < 1
+        assert e.exception.condition is toast
+        assert sink.spans[0].attributes['won'] == str(toast)
+
+    def test_batch_read_fails_fast(self):
+        self.driver.browser.add_element(('id', 'error-500'))
+        self.finder.fail_on = [LocatorExists(('id', 'error-500'))]
+        with self.assertRaises(FailureConditionMet):
+            self.fake.actions(self.finder).get_texts([('id', 'button'), ('id', 'missing')])
+
+    def test_finder_failure_conditions_apply_to_finds(self):
+        self.driver.browser.add_element(('id', 'error-500'))
+        for finder in (self.finder, self.fake.finder(ObserverFinder, default_timeout=5)):
+            finder.fail_on = [LocatorExists(('id', 'error-500'))]
+            with self.assertRaises(FailureConditionMet):
+                finder.find_element(('id', 'missing'))
+            assert finder.find_element(('id', 'button'))
+            with self.assertRaises(FailureConditionMet):
+                finder.scoped(('id', 'button')).find_element(('id', 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
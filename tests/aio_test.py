@@ -0,0 +1,139 @@
+import asyncio
+import time
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.aio import AsyncActions, AsyncFinder, AsyncPage
+from seleniumactions.commands import CommandCounter
+from seleniumactions.conditions import LocatorExists
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.waits import FailureConditionMet, FixedPolling
+
+
+class LoginPage(AsyncPage):
+    url = 'https://async.local/login'
+
+    EMAIL = ('name', 'email')
+    WELCOME = ('id', 'welcome')
+
+    async def login(self, email: str) -> str:
+        await self.actions.type_text(self.EMAIL, email)
+        return await self.actions.get_text(self.WELCOME)
+
+
+class Sidebar(AsyncPage):
+    root = ('id', 'sidebar')
+
+    LINK = ('xpath', '//a')
+
+    async def first_link(self) -> str:
+        return await self.actions.get_text(self.LINK)
+
+
+def session(fake, appear_after: float = 0, latency: float = 0, **finder_options):
+    fake = fake.new(latency=latency)
+    driver = fake.driver
+    driver.browser.add_element(('name', 'email'), url=LoginPage.url)
+    driver.browser.add_element(('id', 'welcome'), text='Welcome', url=LoginPage.url, appear_after=appear_after)
+    return driver, fake.actions(fake.finder(AsyncFinder, **finder_options), AsyncActions)
+
+
+@pytest.mark.usefixtures('fake')
+class AsyncActionsTest(unittest.TestCase):
+
+    def test_actions(self):
+        driver, actions = session(self.fake)
+        button = driver.browser.add_element(('id', 'button'), text='Click me')
+
+        async def scenario():
+            await actions.click(('id', 'button'))
+            await actions.type_text(('id', 'button'), 'abc')
+            await actions.wait_for(LocatorExists(('id', 'button')), timeout='short')
+            return await actions.get_text(('id', 'button')), await actions.get_attribute(('id', 'button'), 'value')
+
+        assert asyncio.run(scenario()) == ('Click me', 'abc')
+        assert button.clicks == 1
+
+    def test_page_and_batch_reads(self):
+        driver, actions = session(self.fake)
+
+        async def scenario():
+            page = LoginPage(actions)
+            await page.open()
+            welcome = await page.login('jimmy@choo.io')
+            texts = await actions.get_texts({'welcome': LoginPage.WELCOME})
+            return welcome, texts, await page.title
+
+        assert asyncio.run(scenario()) == ('Welcome', {'welcome': 'Welcome'}, '')
+
+    def test_page_with_root(self):
+        driver, actions = session(self.fake)
+        driver.browser.add_element(Sidebar.LINK, text='Article')
+        sidebar = driver.browser.add_element(Sidebar.root)
+        driver.browser.add_element(Sidebar.LINK, text='News', parent=sidebar)
+
+        async def scenario():
+            page = Sidebar(actions)
+            links = [await page.first_link(), *await page.actions.get_texts([Sidebar.LINK])]
+            elements = await page.actions.finder.find_elements(Sidebar.LINK)
+            return links + [e.text for e in elements] + [await actions.get_text(Sidebar.LINK)]
+
+        assert asyncio.run(scenario()) == ['News', 'News', 'News', 'Article']  # unscoped actions search whole page
+        assert driver.command_executor.commands['findElement'] == 2  # root located once
+
+    def test_batch_read_fails_fast(self):
+        driver, actions = session(self.fake)
+        driver.browser.add_element(('id', 'error-500'))
+        actions.finder.fail_on = [LocatorExists(('id', 'error-500'))]
+        with self.assertRaises(FailureConditionMet):
+            asyncio.run(actions.get_texts([('id', 'missing')]))
+
+    def test_timeout(self):
+        _, actions = session(self.fake)
+
+        async def scenario():
+            await actions.get_text(('id', 'missing'), explicit_timeout=0.2)
+
+        with self.assertRaises(TimeoutException):
+            asyncio.run(scenario())
+
+    def test_sessions_run_concurrently(self):
+        sessions = [session(self.fake, appear_after=0.3, polling=FixedPolling(0.05))[1] for _ in range(5)]
+
+        async def scenario(actions):
+            page = LoginPage(actions)
+            await page.open()
+            return await page.login('jimmy@choo.io')
+
+        async def main():
+            return await asyncio.gather(*[scenario(actions) for actions in sessions])
+
+        begin = time.monotonic()
+        assert asyncio.run(main()) == ['Welcome'] * 5
+        assert time.monotonic() - begin < 1.0
+
+    def test_spans_and_command_scopes(self):
+        counter = CommandCounter()
+        _, actions = session(self.fake, command_counter=counter)
+        sink = instrumentation.add_sink(MemorySink())
+
+        async def scenario():
+            page = LoginPage(actions)
+            await page.open()
+            await page.login('jimmy@choo.io')
+            await actions.sleep(0.05)
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            instrumentation.remove_sink(sink)
+        by_method = {span.method: span for span in sink.spans}
+        assert by_method['type_text'].parent is by_method['LoginPage.login']
+        assert counter.stats['LoginPage.login']['commands'] >= 2
+        assert counter.stats['get_text']['commands'] >= 1
+
+
+if __name__ == '__main__':
+    unittest.main()
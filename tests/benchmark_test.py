@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from seleniumactions.benchmark import Benchmark, compare, default_benchmark, load_report, main, save_report
+from seleniumactions.stats import percentile
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_report(self):
+        report = default_benchmark(latency=0, runs=1).run()
+        assert set(report['scenarios']) == {'page_login', 'finder_late_elements', 'table_reads'}
+        assert report['actions']['type_text']['count'] == 2
+        assert report['actions']['click']['p99'] >= report['actions']['click']['p50']
+        assert report['wait_seconds'] > 0.2
+        assert report['commands']['get'] == 1
+        assert report['pages']['_BenchmarkPage.login']['count'] == 1
+        assert report['command_count'] == sum(report['commands'].values())
+
+    def test_custom_scenario(self):
+        benchmark = Benchmark(latency=0, runs=2)
+
+        @benchmark.scenario('click', setup=lambda browser: browser.add_element(('id', 'b')))
+        def click(actions):
+            actions.click(('id', 'b'))
+
+        report = benchmark.run()
+        assert report['actions']['click']['count'] == 2
+        assert report['commands']['clickElement'] == 2
+
+    def test_compare(self):
+        baseline = {'actions': {'click': {'p95': 0.1}}, 'scenarios': {}, 'command_count': 10}
+        faster = {'actions': {'click': {'p95': 0.11}}, 'scenarios': {}, 'command_count': 10}
+        slower = {'actions': {'click': {'p95': 0.2}}, 'scenarios': {}, 'command_count': 20}
+        assert compare(faster, baseline) == []
+        assert len(compare(slower, baseline)) == 2
+
+    def test_main_fails_on_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            save_report({'scenarios': {'page_login': {'p95': 0.0001}}, 'actions': {}}, baseline)
+            output = os.path.join(directory, 'report.json')
+            assert main(['--latency', '0', '--runs', '1', '--output', output, '--baseline', baseline,
+                         '--import-runs', '1']) == 1
+            assert load_report(output)['import']['count'] == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
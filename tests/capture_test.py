@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.actions import Actions
+from seleniumactions.capture import Capture
+
+
+HOME = ('id', 'home')
+MISSING = ('id', 'missing')
+
+
+@pytest.mark.usefixtures('fake')
+class CaptureTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.driver = self.fake.driver
+        self.driver.browser.add_element(HOME, text='Home')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def actions(self, capture: Capture) -> Actions:
+        return self.fake.actions(self.fake.finder(default_timeout=0.1), capture=capture)
+
+    def index(self) -> list:
+        with open(os.path.join(self.directory.name, Capture.index_name), encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_failed_step_is_captured_once(self):
+        with Capture(self.directory.name) as capture:
+            actions = self.actions(capture)
+            with pytest.raises(TimeoutException):
+                actions.click(MISSING)
+        entries = self.index()
+        assert len(entries) == 1
+        assert entries[0]['step'] == 'click' and entries[0]['error'].startswith('TimeoutException')
+        assert [name.split('.', 1)[1] for name in entries[0]['files']] == ['png', 'html.gz']
+        assert all(os.path.exists(os.path.join(self.directory.name, name)) for name in entries[0]['files'])
+        assert capture.stats['captured'] == 1 and capture.stats['fetch_errors'] == 0
+
+    def test_capture_errors_never_mask_step_error(self):
+        self.driver.command_executor.fail('getPageSource', ConnectionResetError('connection reset by peer'))
+        capture = Capture(self.directory.name, screenshot=False)
+        actions = self.actions(capture)
+        with pytest.raises(TimeoutException):
+            actions.click(MISSING)
+        capture.close()
+        with pytest.raises(TimeoutException):
+            actions.get_text(MISSING)
+        assert capture.stats['captured'] == 1 and capture.stats['fetch_errors'] == 2
+
+    def test_identical_snapshots_are_deduped(self):
+        with Capture(self.directory.name, every=1) as capture:
+            actions = self.actions(capture)
+            for _ in range(3):
+                actions.get_text(HOME)
+        entries = self.index()
+        assert len(entries) == 3
+        assert len({tuple(entry['files']) for entry in entries}) == 1
+        assert capture.stats['written'] == 2 and capture.stats['deduped'] == 4
+
+    def test_every_nth_step(self):
+        with Capture(self.directory.name, every=2, screenshot=False) as capture:
+            actions = self.actions(capture)
+            for _ in range(5):
+                actions.click(HOME)
+        assert capture.stats['captured'] == 2
+
+    def test_retention_evicts_oldest_files(self):
+        with Capture(self.directory.name, max_bytes=150, compress=False, workers=1) as capture:
+            for i in range(4):
+                self.driver.browser.current.title = f'page {i}'
+                capture.take(self.driver, 'manual')
+                capture.flush()
+        files = [name for name in os.listdir(self.directory.name) if name != Capture.index_name]
+        assert capture.stats['evicted'] > 0
+        assert sum(os.path.getsize(os.path.join(self.directory.name, name)) for name in files) <= 150
+        assert capture.stats['bytes'] <= 150
+
+    def test_index_drops_evicted_captures(self):
+        with Capture(self.directory.name, screenshot=False, max_bytes=150, compress=False, workers=1) as capture:
+            for i in range(4):
+                self.driver.browser.current.title = f'page {i}'
+                capture.take(self.driver, 'manual')
+                capture.flush()
+        files = [name for name in os.listdir(self.directory.name) if name != Capture.index_name]
+        assert capture.stats['evicted'] > 0
+        assert sorted(entry['files'] for entry in self.index()) == sorted([name] for name in files)
@@ -0,0 +1,86 @@
+import unittest
+
+import pytest
+
+from seleniumactions.actions import Actions
+from seleniumactions.commands import CommandBudget, CommandBudgetExceeded, CommandBudgetWarning, CommandCounter
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.pages import Page
+
+
+class LoginPage(Page):
+    url = 'https://login.local'
+
+    def login(self) -> None:
+        self.actions.type_text(('name', 'email'), 'jimmy@choo.io')
+        self.actions.click(('id', 'submit'))
+
+
+class RememberingLoginPage(LoginPage):
+
+    def login(self) -> None:
+        super().login()
+        self.actions.click(('id', 'remember'))
+
+
+@pytest.mark.usefixtures('fake')
+class CommandCounterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        for locator_tuple in (('name', 'email'), ('id', 'submit'), ('id', 'remember')):
+            self.driver.browser.add_element(locator_tuple, url=LoginPage.url)
+
+    def actions(self, counter: CommandCounter) -> Actions:
+        return self.fake.actions(self.fake.finder(command_counter=counter))
+
+    def test_counts_per_action_and_page_method(self):
+        counter = CommandCounter(count_bytes=True)
+        page = LoginPage(self.actions(counter))
+        page.open()
+        page.login()
+        assert counter.stats['goto']['commands'] == 1
+        assert counter.stats['click'] == dict(counter.stats['click'], calls=1, commands=2, max=2)
+        assert counter.stats['type_text']['commands'] == 2
+        assert counter.stats['LoginPage.login']['commands'] == 4
+        assert counter.stats['LoginPage.login']['kind'] == 'page'
+        assert counter.stats['LoginPage.open']['commands'] == 1
+        assert counter.stats['click']['bytes_sent'] > 0
+        assert counter.stats['click']['bytes_received'] > 0
+        assert counter.total['findElement'] == 2
+        assert counter.worst(1) == [('LoginPage.login', 4)]
+
+    def test_bytes_are_opt_in(self):
+        counter = CommandCounter()
+        LoginPage(self.actions(counter)).open()
+        assert counter.stats['goto'] == dict(counter.stats['goto'], commands=1, bytes_sent=0, bytes_received=0)
+
+    def test_override_calling_super_is_one_step(self):
+        counter = CommandCounter()
+        sink = instrumentation.add_sink(MemorySink())
+        try:
+            page = RememberingLoginPage(self.actions(counter))
+            page.open()
+            page.login()
+        finally:
+            instrumentation.remove_sink(sink)
+        assert counter.stats['RememberingLoginPage.login'] == dict(counter.stats['RememberingLoginPage.login'],
+                                                                   calls=1, commands=6)
+        assert [span.method for span in sink.spans].count('RememberingLoginPage.login') == 1
+
+    def test_budget_warns(self):
+        actions = self.actions(CommandCounter(budget=CommandBudget(limit=1)))
+        actions.goto(LoginPage.url)
+        with self.assertWarns(CommandBudgetWarning):
+            actions.click(('id', 'submit'))
+
+    def test_budget_fails(self):
+        counter = CommandCounter(budget=CommandBudget(limits={'LoginPage.login': 3}, fail=True))
+        page = LoginPage(self.actions(counter))
+        page.open()
+        with self.assertRaises(CommandBudgetExceeded):
+            page.login()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.conditions import Condition, Matches, absent, any_of, attribute_is, count, has_attribute, \
+    present, text_contains, text_is, text_matches, visible
+from seleniumactions.waits import FailureConditionMet
+
+
+SPINNER = ('id', 'spinner')
+TABLE = ('id', 'table')
+ROWS = ('css selector', 'tr')
+STATUS = ('id', 'status')
+ERROR = ('css selector', '.error')
+
+
+@pytest.mark.usefixtures('fake')
+class ComposableConditionsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.browser = self.driver.browser
+        self.actions = self.fake.actions()
+
+    def scripts_run(self) -> int:
+        return self.driver.command_executor.commands['w3cExecuteScript']
+
+    def test_whole_expression_is_single_script_per_check(self):
+        self.browser.add_element(TABLE)
+        self.browser.add_element(STATUS, text=' Done \n', attributes={'data-state': 'done'})
+        for _ in range(3):
+            self.browser.add_element(ROWS)
+        condition = absent(SPINNER) & present(TABLE) & count(ROWS, at_least=3) \
+            & (text_is(STATUS, 'Done') | attribute_is(STATUS, 'data-state', 'failed'))
+        assert condition(self.driver) is True
+        assert condition.unmet == []
+        assert self.scripts_run() == 1
+
+    def test_unmet_lists_failing_leaves(self):
+        self.browser.add_element(SPINNER)
+        self.browser.add_element(STATUS, text='Loading')
+        condition = absent(SPINNER) & present(TABLE) & text_contains(STATUS, 'Load')
+        assert condition(self.driver) is False
+        assert [str(c) for c in condition.unmet] == [f'absent {SPINNER}', f'present {TABLE}']
+
+    def test_any_of_and_not(self):
+        self.browser.add_element(STATUS, text='Error 500', attributes={'hidden': 'true'})
+        assert (~present(SPINNER))(self.driver) is True
+        assert (~visible(STATUS))(self.driver) is True
+        condition = any_of(text_matches(STATUS, r'^Error \d+$'), has_attribute(STATUS, 'aria-busy'))
+        assert condition(self.driver) is True
+        condition = any_of(text_is(STATUS, 'Done'), count(ROWS, exactly=2))
+        assert condition(self.driver) is False
+        assert len(condition.unmet) == 2
+
+    def test_wait_for_met_after_delay(self):
+        self.browser.add_element(TABLE, appear_after=0.2)
+        self.actions.wait_for(absent(SPINNER) & present(TABLE))
+
+    def test_wait_for_timeout_reports_unmet(self):
+        self.browser.add_element(TABLE)
+        with pytest.raises(TimeoutException) as e:
+            self.actions.wait_for(present(TABLE) & count(ROWS, at_least=10), explicit_timeout=0.3)
+        assert f'count {ROWS} >= 10' in e.value.msg
+        assert f'present {TABLE}' not in e.value.msg.split('unmet:')[1]
+
+    def test_wait_for_leaves_shared_condition_untouched(self):
+        condition = present(TABLE) & count(ROWS, at_least=10)
+        scoped = self.fake.actions(self.actions.finder.scoped(STATUS))
+        self.browser.add_element(STATUS)
+        for actions in (self.actions, scoped):
+            with pytest.raises(TimeoutException) as e:
+                actions.wait_for(condition, explicit_timeout=0.1)
+            assert f'present {TABLE}' in e.value.msg.split('unmet:')[1]
+        assert condition.root is None and condition.unmet == []
+
+    def test_fail_on_condition(self):
+        self.browser.add_element(ERROR)
+        with pytest.raises(FailureConditionMet):
+            self.actions.wait_for(present(TABLE), fail_on=[present(ERROR)])
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            Matches(STATUS, 'x', mode='startswith')
+
+    def test_count_needs_bounds(self):
+        with pytest.raises(ValueError):
+            count(ROWS)
+        assert str(count(ROWS, at_most=0)) == f'absent {ROWS}'
+
+    def test_condition_is_abstract(self):
+        with pytest.raises(TypeError):
+            Condition()
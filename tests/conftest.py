@@ -0,0 +1,43 @@
+"""
+Shared test fixtures - FakeWebDriver session (seleniumactions.testing.fakes) with finder / actions factories.
+
+unittest.TestCase classes get the session as self.fake with @pytest.mark.usefixtures('fake').
+"""
+import pytest
+
+from seleniumactions.actions import Actions
+from seleniumactions.elements import FluentFinder
+from seleniumactions.testing.fakes import FakeWebDriver
+
+
+TIMEOUTS = {"short": 1, "medium": 2, "long": 3, "absurd": 5}
+
+
+class FakeSession:
+    """ fake driver with finder / actions built with test timeouts """
+    timeouts = TIMEOUTS
+
+    def __init__(self, driver=None) -> None:
+        self.driver = driver if driver is not None else FakeWebDriver()
+
+    @property
+    def browser(self):
+        return self.driver.browser
+
+    def new(self, driver_class=FakeWebDriver, **driver_options) -> 'FakeSession':
+        """ session with another driver - e.g. with latency or CDP support """
+        return FakeSession(driver_class(**driver_options))
+
+    def finder(self, finder_class=FluentFinder, default_timeout: float = 1, **options):
+        return finder_class(self.driver, timeouts=TIMEOUTS, default_timeout=default_timeout, **options)
+
+    def actions(self, finder=None, actions_class=Actions, wait_for_condition_timeout: float = 1, **options):
+        if finder is None: finder = self.finder()
+        return actions_class(finder, wait_for_condition_timeout=wait_for_condition_timeout, **options)
+
+
+@pytest.fixture
+def fake(request) -> FakeSession:
+    session = FakeSession()
+    if request.instance is not None: request.instance.fake = session
+    return session
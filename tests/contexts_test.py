@@ -0,0 +1,154 @@
+import pickle
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.actions import Actions
+from seleniumactions.cache import ElementCache
+from seleniumactions.conditions import LocatorCount, LocatorExists, present, text_is
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.locators import Locator, LocatorPath, Using, frame, shadow
+
+
+EDITOR = frame(('id', 'editor'))
+PREVIEW = frame(('id', 'preview'))
+TOOLBAR = shadow(('css selector', 'x-toolbar'))
+
+PUBLISH = ('id', 'publish')
+BODY = LocatorPath('css selector', 'div.body', [EDITOR])
+SAVE = LocatorPath('css selector', 'button.save', [EDITOR, TOOLBAR])
+TITLE = LocatorPath('id', 'title', [EDITOR, PREVIEW])
+
+
+@pytest.mark.usefixtures('fake')
+class ContextsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        browser = self.driver.browser
+        self.publish = browser.add_element(PUBLISH, text='Publish')
+        editor = browser.add_element(('id', 'editor'), frame=True)
+        self.body = browser.add_element(('css selector', 'div.body'), text='Body', parent=editor)
+        toolbar = browser.add_element(('css selector', 'x-toolbar'), parent=editor, shadow=True)
+        self.save = browser.add_element(('css selector', 'button.save'), text='Save', parent=toolbar)
+        preview = browser.add_element(('id', 'preview'), parent=editor, frame=True)
+        browser.add_element(('id', 'title'), text='Draft', parent=preview)
+        self.commands = self.driver.command_executor.commands
+
+    def actions(self, **finder_kwargs) -> Actions:
+        return self.fake.actions(self.fake.finder(default_timeout=0.2, **finder_kwargs))
+
+    def test_switches_only_when_frame_changes(self):
+        actions = self.actions()
+        actions.click(SAVE)
+        actions.type_text(BODY, 'hello')
+        actions.click(SAVE)
+        actions.click(PUBLISH)
+        actions.click(PUBLISH)
+        assert self.save.clicks == 2 and self.publish.clicks == 2
+        assert self.body.attributes['value'] == 'hello'
+        stats = actions.finder.contexts.stats
+        assert stats['switches'] == self.commands['switchToFrame'] == 2
+        assert stats['skipped'] == 2
+        assert stats['frame_lookups'] == 1 and stats['shadow_lookups'] == 1
+        assert self.commands['getShadowRoot'] == 1
+
+    def test_plain_lookups_stay_in_top_document(self):
+        actions = self.actions()
+        actions.click(PUBLISH)
+        assert actions.get_text(PUBLISH) == 'Publish'
+        assert self.commands['switchToFrame'] == 0
+
+    def test_nested_frame_and_back_to_parent(self):
+        actions = self.actions()
+        assert actions.get_text(TITLE) == 'Draft'
+        actions.type_text(BODY, 'x')
+        assert self.commands['switchToFrame'] == 2
+        assert self.commands['switchToParentFrame'] == 1
+
+    def test_driver_is_back_in_top_document_after_frame_step(self):
+        actions = self.actions()
+        actions.click(SAVE)
+        actions.wait_for(LocatorExists(PUBLISH), explicit_timeout=0.2)
+        assert actions.finder.contexts.current == ()
+        actions.click(BODY)
+        actions.execute_js('return 1')
+        assert actions.finder.contexts.current == ()
+
+    def test_conditions_are_evaluated_in_locator_context(self):
+        actions = self.actions()
+        actions.wait_for(LocatorCount(BODY, 1), explicit_timeout=0.2)
+        actions.wait_for(present(SAVE) & text_is(SAVE, 'Save'), explicit_timeout=0.2)
+        actions.wait_for(present(PUBLISH), fail_on=[present(TITLE)], explicit_timeout=0.2)
+        with pytest.raises(TimeoutException) as e:
+            actions.wait_for(LocatorCount(BODY, 2), explicit_timeout=0.1)
+        assert 'div.body' in e.value.msg.split('unmet:')[1]
+        with pytest.raises(ValueError):
+            present(BODY) & present(PUBLISH)
+        with pytest.raises(ValueError):
+            LocatorExists(BODY)
+        with pytest.raises(ValueError):
+            present(BODY)(self.driver)  # context can't be resolved without finder
+
+    def test_batch_reads_in_locator_contexts(self):
+        actions = self.actions()
+        assert actions.get_texts([BODY, PUBLISH, SAVE, TITLE]) == ['Body', 'Publish', 'Save', 'Draft']
+        assert actions.get_all_texts(BODY) == ['Body']
+        assert actions.get_attributes({'body': BODY}, 'value') == {'body': None}
+
+    def test_pipeline_steps_in_locator_contexts(self):
+        actions = self.actions()
+        result = actions.pipeline().set_value(BODY, 'hello').get_text(BODY).click(PUBLISH).get_text(SAVE).run()
+        assert result.ok and result.values == [None, 'Body', None, 'Save']
+        assert result.round_trips == 3
+        assert self.body.attributes['value'] == 'hello' and self.publish.clicks == 1
+
+    def test_stale_handles_are_located_again(self):
+        actions = self.actions()
+        actions.click(SAVE)
+        self.driver.browser.load(self.driver.browser.url)  # reloaded behind finder's back
+        actions.click(SAVE)
+        assert self.save.clicks == 2
+        assert actions.finder.contexts.stats['stale'] == 1
+        assert actions.finder.contexts.stats['shadow_lookups'] == 2
+
+    def test_cached_element_is_used_in_its_frame(self):
+        actions = self.actions(element_cache=ElementCache())
+        assert actions.get_text(SAVE) == 'Save'
+        assert actions.get_text(PUBLISH) == 'Publish'
+        finds = self.commands['findElementFromShadowRoot']
+        actions.click(SAVE)
+        assert self.save.clicks == 1
+        assert self.commands['findElementFromShadowRoot'] == finds
+        assert actions.finder.element_cache.hits == 1
+
+    def test_switches_are_added_to_span(self):
+        sink = instrumentation.add_sink(MemorySink())
+        try:
+            self.actions().click(SAVE)
+        finally:
+            instrumentation.remove_sink(sink)
+        assert sink.spans[0].attributes['context_switches'] == 1
+
+    def test_scoped_component_in_frame(self):
+        finder = self.actions().finder
+        toolbar = finder.scoped(LocatorPath('css selector', 'x-toolbar', [EDITOR]))
+        assert finder.scoped(LocatorPath('css selector', 'x-toolbar', [EDITOR])) is toolbar
+        assert finder.scoped(('css selector', 'x-toolbar')) is not toolbar
+        assert toolbar.root_element().tag_name == 'div'
+        with pytest.raises(ValueError):
+            toolbar.find_element(BODY)
+
+    def test_locator_with_context(self):
+        save = Locator(Using.CSS, 'button.{kind}', context=[EDITOR, TOOLBAR])
+        by = save.get_by(kind='save')
+        assert by == ('css selector', 'button.save')
+        assert by.context == (EDITOR, TOOLBAR)
+        assert by.key != ('css selector', 'button.save')
+        assert pickle.loads(pickle.dumps(by)).key == by.key
+        assert Locator(Using.ID, 'publish').get_by().__class__ is tuple
+        with pytest.raises(ValueError):
+            LocatorPath('xpath', '//button', [TOOLBAR])
+        with pytest.raises(ValueError):
+            LocatorPath('css selector', 'button', [('window', ('id', 'x'))])
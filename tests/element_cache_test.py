@@ -0,0 +1,87 @@
+import time
+import unittest
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from seleniumactions.cache import ElementCache
+
+
+BUTTON = ('id', 'button')
+
+
+@pytest.mark.usefixtures('fake')
+class ElementCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.driver.browser.add_element(BUTTON, text='Click me', url='https://a.local')
+        self.driver.browser.add_element(BUTTON, text='Click me', url='https://b.local')
+        self.cache = ElementCache(max_size=2, ttl=10)
+        self.finder = self.fake.finder(element_cache=self.cache)
+        self.actions = self.fake.actions(self.finder)
+        self.actions.goto('https://a.local')
+
+    @property
+    def commands(self):
+        return self.driver.command_executor.commands
+
+    def test_hit_after_liveness_check(self):
+        self.actions.get_text(BUTTON)
+        self.actions.get_attribute(BUTTON, 'title')
+        self.actions.click(BUTTON)
+        assert self.commands['findElement'] == 1
+        assert self.commands['getElementTagName'] == 2
+        assert self.cache.stats() == dict(self.cache.stats(), hits=2, misses=1)
+
+    def test_handle_is_kept_across_mutating_step(self):
+        self.actions.get_text(BUTTON)
+        self.actions.click(BUTTON)
+        self.actions.get_attribute(BUTTON, 'title')
+        assert self.commands['findElement'] == 1
+        assert self.commands['getElementTagName'] == 2
+        assert self.commands['clickElement'] == 1
+        assert self.cache.stats() == dict(self.cache.stats(), hits=2, misses=1, stale=0)
+
+    def test_lists_are_not_cached(self):
+        self.finder.find_elements(BUTTON)
+        self.finder.find_elements(BUTTON)
+        assert self.commands['findElements'] == 2
+        assert len(self.cache) == 0
+
+    def test_navigation_clears(self):
+        self.actions.click(BUTTON)
+        self.actions.goto('https://b.local')
+        self.actions.click(BUTTON)
+        assert self.commands['findElement'] == 2
+        assert self.cache.stats()['stale'] == 0
+
+    def test_stale_evicted(self):
+        self.actions.get_text(BUTTON)
+        self.driver.get('https://b.local')  # navigation behind finder back
+        self.actions.click(BUTTON)
+        assert self.cache.stats()['stale'] == 1
+        assert self.commands['findElement'] == 2
+
+    def test_stale_without_verify(self):
+        self.cache.verify = False
+        self.actions.get_text(BUTTON)
+        self.driver.get('https://b.local')
+        with self.assertRaises(StaleElementReferenceException):
+            self.actions.click(BUTTON)
+        self.actions.click(BUTTON)
+        assert self.commands['findElement'] == 2
+
+    def test_size_and_ttl(self):
+        for i in range(3):
+            self.cache.put(('id', f'e{i}'), object())
+        assert len(self.cache) == 2
+        assert self.cache.stats()['evicted'] == 1
+        self.cache.ttl = 0.01
+        time.sleep(0.02)
+        assert self.cache.get(('id', 'e2')) is None
+        assert self.cache.stats()['expired'] == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
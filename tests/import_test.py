@@ -0,0 +1,48 @@
+import logging
+import subprocess
+import sys
+import unittest
+
+import seleniumactions
+from seleniumactions import disable_logging, enable_logging
+from seleniumactions.benchmark import import_time
+
+
+def imported_modules(statement: str) -> list:
+    code = f'import sys; {statement}; print(" ".join(sorted(sys.modules)))'
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_locators_import_does_not_load_webdriver(self):
+        modules = imported_modules('import seleniumactions; from seleniumactions import Locator, Using')
+        assert not [module for module in modules if module.startswith('selenium.')]
+        assert 'seleniumactions.actions' not in modules
+
+    def test_exports_are_resolved_on_access(self):
+        from seleniumactions.actions import Actions
+        assert seleniumactions.Actions is Actions
+        assert set(seleniumactions.__all__) <= set(dir(seleniumactions))
+        with self.assertRaises(AttributeError):
+            seleniumactions.Missing
+
+    def test_no_handlers_attached_on_import(self):
+        modules = imported_modules('import logging, seleniumactions.actions; '
+                                   'assert not logging.getLogger("ACTIONS").handlers; '
+                                   'assert not logging.getLogger("FINDER").handlers')
+        assert 'seleniumactions.elements' in modules
+
+    def test_enable_logging_is_opt_in(self):
+        handler = enable_logging(level=logging.DEBUG)
+        enable_logging(level=logging.DEBUG)
+        try:
+            assert logging.getLogger('ACTIONS').handlers.count(handler) == 0
+            assert len(logging.getLogger('FINDER').handlers) == 1
+        finally:
+            disable_logging()
+        assert not logging.getLogger('ACTIONS').handlers
+
+    def test_import_time_benchmark(self):
+        stats = import_time('from seleniumactions import Locator', runs=2)
+        assert stats['count'] == 2 and stats['p50'] > 0
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.instrumentation import (HistogramSink, JsonLinesSink, MemorySink, instrumentation,
+                                             current_span, waiting)
+
+
+@pytest.mark.usefixtures('fake')
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.driver.browser.add_element(('id', 'late'), text='Late', appear_after=0.05)
+        self.actions = self.fake.actions(wait_between=0.01)
+        self.sink = instrumentation.add_sink(MemorySink())
+
+    def tearDown(self) -> None:
+        instrumentation.remove_sink(self.sink)
+
+    def test_span(self):
+        self.actions.click(('id', 'late'), timeout='short')
+        span, = self.sink.spans
+        assert span.method == 'click'
+        assert span.locator == ('id', 'late')
+        assert span.timeout == 1
+        assert span.ok
+        assert span.wait >= 0.05
+        assert span.sleep >= 0.01
+        assert abs(span.duration - span.wait - span.sleep - span.execute) < 1e-6
+
+    def test_error(self):
+        with self.assertRaises(TimeoutException):
+            self.actions.get_text(('id', 'missing'), explicit_timeout=0.01)
+        span, = self.sink.spans
+        assert span.error == 'TimeoutException'
+        assert span.to_dict()['ok'] is False
+
+    def test_nesting(self):
+        with instrumentation.span('login flow') as flow:
+            assert current_span() is flow
+            self.actions.get_text(('id', 'late'))
+        text, parent = self.sink.spans
+        assert text.parent is parent
+        assert text.method == 'get_text'
+        assert parent.method == 'login flow'
+        assert parent.wait == text.wait
+        assert current_span() is None
+
+    def test_child_of_waiting_parent_counts_once(self):
+        with instrumentation.span('poll') as poll:
+            with waiting():
+                self.actions.get_text(('id', 'late'))
+        text, parent = self.sink.spans
+        assert parent is poll and text.wait >= 0.05
+        assert text.wait <= parent.wait <= parent.duration
+
+    def test_attributes_are_nested(self):
+        with instrumentation.span('step') as span:
+            span.attributes.update({'id': 'custom', 'duration': -1})
+        data = self.sink.spans[0].to_dict()
+        assert data['id'] == span.id and data['duration'] >= 0
+        assert data['attributes'] == {'id': 'custom', 'duration': -1}
+
+    def test_histogram(self):
+        histogram = instrumentation.add_sink(HistogramSink(buckets=(0.001, 10)))
+        try:
+            self.actions.click(('id', 'late'))
+            self.actions.click(('id', 'late'))
+        finally:
+            instrumentation.remove_sink(histogram)
+        rendered = histogram.render()
+        assert 'seleniumactions_action_seconds_bucket{method="click",le="0.001"} 0' in rendered
+        assert 'seleniumactions_action_seconds_bucket{method="click",le="10"} 2' in rendered
+        assert 'seleniumactions_action_seconds_count{method="click"} 2' in rendered
+
+    def test_json_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'spans.jsonl')
+            sink = instrumentation.add_sink(JsonLinesSink(path))
+            try:
+                self.actions.goto('about:blank')
+            finally:
+                instrumentation.remove_sink(sink)
+                sink.close()
+            with open(path) as f:
+                record = json.loads(f.readline())
+        assert record['method'] == 'goto'
+        assert record['ok'] is True
+
+    def test_disabled(self):
+        instrumentation.remove_sink(self.sink)
+        assert instrumentation.span('noop').__enter__() is None
+        self.actions.click(('id', 'late'))
+        assert self.sink.spans == []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Locator.get_by() micro-benchmark.
+
+Logs per-call cost of current (compiled template + resolved cache) implementation
+and the legacy one, which re-parsed the template on every parameters access.
+Assertions cover cache behaviour only - wall-clock comparisons are too noisy on shared runners.
+Run with: python -m pytest tests/locator_benchmark_test.py
+"""
+import logging
+import re
+import timeit
+import unittest
+
+from seleniumactions.elements import Locator, Using
+
+
+logger = logging.getLogger('BENCHMARK')
+
+TEMPLATE = "//ul/li[@class='{class_name}' and contains(., '{label}')]"
+LABELS = [f'label-{i}' for i in range(32)]
+NUMBER = 20000
+
+
+class LegacyLocator:
+    """ Locator.get_by() as implemented before templates were compiled """
+    def __init__(self, using: str, value: str) -> None:
+        self.using = using
+        self.value = value
+
+    @property
+    def parameters(self):
+        if params := re.findall(r'{\w+}', self.value):
+            return [re.sub(r'[{}]', '', param) for param in params]
+        return []
+
+    @property
+    def is_parameterized(self):
+        return len(self.parameters) > 0
+
+    def get_by(self, **kwargs):
+        if not self.is_parameterized: return (self.using, self.value)
+        if len(kwargs.keys()) == 0: raise ValueError(f'get_by method is missing keyword arguments: {self.parameters}')
+        for param in self.parameters:
+            if param not in kwargs.keys():
+                raise ValueError(f'get_by method is missing keyword argument: {param}')
+        return (self.using, self.value.format(**kwargs))
+
+
+def per_call_us(locator, labels) -> float:
+    def run():
+        for label in labels:
+            locator.get_by(class_name='menu', label=label)
+    return timeit.timeit(run, number=NUMBER // len(labels)) / NUMBER * 1e6
+
+
+class LocatorBenchmarkTest(unittest.TestCase):
+
+    def test_get_by_per_call_cost(self):
+        legacy = LegacyLocator(Using.XPATH, TEMPLATE)
+        compiled = Locator(Using.XPATH, TEMPLATE)
+        uncached = Locator(Using.XPATH, TEMPLATE)
+        uncached.cache_size = 0
+        for label in LABELS:
+            assert compiled.get_by(class_name='menu', label=label) == legacy.get_by(class_name='menu', label=label)
+
+        legacy_us = per_call_us(legacy, LABELS)
+        uncached_us = per_call_us(uncached, LABELS)
+        compiled_us = per_call_us(compiled, LABELS)
+        logger.info(f'get_by() per call: legacy {legacy_us:.3f} us, '
+                    f'compiled {uncached_us:.3f} us, compiled + cache {compiled_us:.3f} us')
+
+    def test_resolved_cache_hits_and_eviction(self):
+        locator = Locator(Using.XPATH, TEMPLATE)
+        locator.cache_size = len(LABELS)
+        resolved = [locator.get_by(class_name='menu', label=label) for label in LABELS]
+        assert all(locator.get_by(class_name='menu', label=label) is by for label, by in zip(LABELS, resolved))
+        locator.get_by(class_name='menu', label='one-more')  # evicts least recently used - LABELS[0]
+        assert locator.get_by(class_name='menu', label=LABELS[1]) is resolved[1]
+        assert locator.get_by(class_name='menu', label=LABELS[0]) is not resolved[0]
+        uncached = Locator(Using.XPATH, TEMPLATE)
+        uncached.cache_size = 0
+        assert uncached.get_by(class_name='menu', label='a') is not uncached.get_by(class_name='menu', label='a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from seleniumactions.elements import Locator, Using
+from seleniumactions.elements import Locator, LocatorTemplate, Using
 import unittest
 
 
@@ -27,7 +27,52 @@ class LocatorTests(unittest.TestCase):
         assert parmeterized == ('xpath', expected_value)
 
     def test_parmeterization_erros(self):
-        pass  # todo: impl -> check exception raising ...
+        locator = Locator(using=Using.NAME, value='{action}-{foo}')
+        with self.assertRaises(ValueError) as e:
+            locator.get_by()
+        assert str(e.exception) == "get_by method is missing keyword arguments: ['action', 'foo']"
+        with self.assertRaises(ValueError) as e:
+            locator.get_by(action='goto')
+        assert str(e.exception) == 'get_by method is missing keyword argument: foo'
+
+    def test_template_compiled(self):
+        locator = Locator(using=Using.XPATH, value="//li[@class='{class_name}' and contains(., '{label}')]")
+        template = locator.template
+        assert template.parameters == ('class_name', 'label')
+        assert template.fields == ('class_name', 'label')
+        assert template.segments == ("//li[@class='", "' and contains(., '", "')]")
+        with self.assertRaises(AttributeError):
+            template.value = 'foo'
+
+    def test_template_escaping(self):
+        locator = Locator(using=Using.XPATH, value='//a[contains(@style, "50%")][.="{{literal}}-{text}"]')
+        assert locator.get_by(literal='x', text='y') == ('xpath', '//a[contains(@style, "50%")][.="{literal}-y"]')
+
+    def test_template_fallback(self):
+        template = LocatorTemplate('//a[@id="{item.id}"]', [])
+        assert template.fields == ()
+        assert template.format({'item': type('Item', (), {'id': 7})}) == '//a[@id="7"]'
+        assert LocatorTemplate('div{', []).value == 'div{'
+
+    def test_resolved_cache(self):
+        locator = Locator(using=Using.XPATH, value='//button[.="{label}"]')
+        locator.cache_size = 2
+        first = locator.get_by(label='a')
+        assert locator.get_by(label='a') is first
+        locator.get_by(label='b')
+        locator.get_by(label='c')
+        assert locator.get_by(label='a') is not first
+        assert locator.get_by(label='a') == first
+        assert locator.get_by(label=['unhashable']) == ('xpath', "//button[.=\"['unhashable']\"]")
+
+    def test_resolved_cache_keeps_value_types_apart(self):
+        locator = Locator(using=Using.XPATH, value='//td[{index}]')
+        assert locator.get_by(index=1) == ('xpath', '//td[1]')
+        assert locator.get_by(index=True) == ('xpath', '//td[True]')
+        assert locator.get_by(index=1.0) == ('xpath', '//td[1.0]')
+        fallback = Locator(using=Using.XPATH, value='//td[{index}][{index!s}]')
+        assert fallback.get_by(index=1) == ('xpath', '//td[1][1]')
+        assert fallback.get_by(index=True) == ('xpath', '//td[True][True]')
 
 
 if __name__ == '__main__':
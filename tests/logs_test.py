@@ -0,0 +1,105 @@
+import io
+import logging
+import threading
+import unittest
+
+import pytest
+
+from seleniumactions.logs import BufferedHandler, disable_logging, enable_logging, logging_stats
+
+
+class Rendered:
+    """ counts how many times log argument was formatted """
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return 'rendered'
+
+
+class BlockingStream(io.StringIO):
+    """ stream whose writes wait until released """
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.writing.set()
+        self.release.wait(5)
+        return super().write(s)
+
+
+@pytest.mark.usefixtures('fake')
+class LogsTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        disable_logging()
+
+    def test_messages_are_formatted_only_when_emitted(self):
+        stream = io.StringIO()
+        enable_logging(level=logging.INFO, stream=stream)
+        argument = Rendered()
+        logging.getLogger('FINDER').debug('find_element: %s', argument)
+        assert argument.calls == 0
+        logging.getLogger('ACTIONS').info('click %s', argument)
+        assert argument.calls >= 1
+        assert stream.getvalue() == 'click rendered\n'
+
+    def test_disable_restores_application_level(self):
+        logger = logging.getLogger('ACTIONS')
+        logger.setLevel(logging.WARNING)
+        try:
+            enable_logging(level=logging.DEBUG, stream=io.StringIO())
+            enable_logging(level=logging.INFO, stream=io.StringIO())
+            assert logger.level == logging.INFO
+            disable_logging()
+            assert logger.level == logging.WARNING
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+    def test_queued_records_are_written_by_background_thread(self):
+        stream = io.StringIO()
+        enable_logging(stream=stream, queued=True)
+        self.fake.browser.add_element(('id', 'home'))
+        actions = self.fake.actions()
+        actions.click(('id', 'home'))
+        actions.execute_js('return "' + 'x' * 500 + '"')
+        disable_logging()
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "click ('id', 'home')"
+        assert lines[-1].startswith('execute js ') and len(lines[-1]) < 100
+
+    def test_full_buffer_drops_records(self):
+        handler = BufferedHandler(buffer=2)
+        logger = logging.getLogger('seleniumactions.test.buffer')
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(5):
+                logger.warning('message %s', i)
+        finally:
+            logger.removeHandler(handler)
+        assert (handler.queued, handler.dropped) == (2, 3)
+        assert handler.queue.get_nowait().getMessage() == 'message 0'
+
+    def test_disable_waits_for_room_in_full_buffer(self):
+        stream = BlockingStream()
+        enable_logging(stream=stream, queued=True, buffer=1)
+        logger = logging.getLogger('ACTIONS')
+        logger.info('first')
+        assert stream.writing.wait(1)  # listener took first record and is stuck writing it
+        logger.info('second')
+        logger.info('third')  # buffer is full
+        threading.Timer(0.1, stream.release.set).start()
+        disable_logging()
+        assert stream.getvalue().splitlines() == ['first', 'second']
+        assert logging_stats() == {'queued': 0, 'written': 0, 'dropped': 0}
+
+    def test_stats(self):
+        enable_logging(stream=io.StringIO(), queued=True, buffer=100)
+        for i in range(10):
+            logging.getLogger('ACTIONS').info('step %s', i)
+        logging.getLogger('ACTIONS').handlers[-1].queue.join()  # listener marks written records as done
+        assert logging_stats() == {'queued': 10, 'written': 10, 'dropped': 0}
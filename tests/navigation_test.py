@@ -0,0 +1,94 @@
+import unittest
+
+import pytest
+
+from seleniumactions.navigation import ResourceBlocking
+from seleniumactions.pages import Page
+from seleniumactions.testing.fakes import FakeWebDriver
+
+
+class CdpWebDriver(FakeWebDriver):
+    """ fake driver with Chrome DevTools Protocol commands """
+    def __init__(self) -> None:
+        super().__init__()
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        self.cdp.append((cmd, cmd_args))
+        return {}
+
+
+class Dashboard(Page):
+    url = 'https://some.site.io/dashboard'
+    reuse = 'reload'
+    blocking = ResourceBlocking(urls=['*tracker.io*'], types=['font'])
+
+    BUTTON = ('id', 'button')
+
+    def press(self) -> None:
+        self.actions.click(self.BUTTON)
+
+
+class Plain(Page):
+    url = 'https://some.site.io/plain'
+
+
+@pytest.mark.usefixtures('fake')
+class NavigationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        session = self.fake.new(CdpWebDriver)
+        self.driver = session.driver
+        self.driver.browser.add_element(Dashboard.BUTTON, url=Dashboard.url)
+        self.actions = session.actions()
+        self.commands = self.driver.command_executor.commands
+
+    def test_default_goto_always_loads(self):
+        assert self.actions.goto(Plain.url) == 'get'
+        assert self.actions.goto(Plain.url) == 'get'
+        assert self.commands['get'] == 2 and self.commands['getCurrentUrl'] == 0
+
+    def test_clean_page_is_skipped_dirty_page_reloaded(self):
+        page = Dashboard(self.actions)
+        page.open()
+        page.open()
+        assert self.commands['get'] == 1 and self.commands['refresh'] == 0
+        page.press()
+        page.open()
+        assert self.commands['get'] == 1 and self.commands['refresh'] == 1
+        assert [o.how for o in self.actions.navigation.opens] == ['get', 'skip', 'reload']
+        assert self.actions.navigation.report()['Dashboard']['skipped'] == 1
+
+    def test_page_changed_behind_actions_back_is_loaded(self):
+        assert self.actions.goto(Dashboard.url, reuse='skip') == 'get'
+        self.driver.get(Plain.url)
+        assert self.actions.goto(Dashboard.url, reuse='skip') == 'get'
+
+    def test_resource_blocking_is_applied_per_page(self):
+        Dashboard(self.actions).open()
+        Dashboard(self.actions).open()
+        blocked = [args['urls'] for cmd, args in self.driver.cdp if cmd == 'Network.setBlockedURLs']
+        assert blocked == [['*tracker.io*', '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']]
+        Plain(self.actions).open()
+        assert self.driver.cdp[-1] == ('Network.setBlockedURLs', {'urls': []})
+
+    def test_blocking_skipped_without_cdp(self):
+        actions = self.fake.actions()
+        assert actions.navigation.block(self.fake.driver, Dashboard.blocking) is False
+        Dashboard(actions).open()
+        assert actions.navigation.opens[0].how == 'get'
+
+    def test_time_to_interactive(self):
+        self.actions.navigation.measure = True
+        Dashboard(self.actions).open()
+        Dashboard(self.actions).open()
+        first, second = self.actions.navigation.opens
+        assert first.interactive == 0.01 and first.loaded == 0.05
+        assert second.how == 'skip' and second.interactive is None
+        assert self.actions.navigation.report()['Dashboard']['interactive']['count'] == 1
+
+    def test_invalid_reuse(self):
+        with pytest.raises(ValueError):
+            self.actions.goto(Plain.url, reuse='always')
+        with pytest.raises(ValueError):
+            ResourceBlocking(types=['video'])
@@ -0,0 +1,78 @@
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions import scripts
+from seleniumactions.conditions import LocatorExists
+from seleniumactions.observers import ObserverFinder
+from seleniumactions.testing.fakes import JavascriptError
+
+
+def broken(browser, args):
+    raise JavascriptError('observer injection failed')
+
+
+@pytest.mark.usefixtures('fake')
+class ObserverFinderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.finder = self.fake.finder(ObserverFinder)
+
+    @property
+    def commands(self):
+        return self.driver.command_executor.commands
+
+    def test_find_element_single_round_trip(self):
+        self.driver.browser.add_element(('id', 'late'), text='Late', appear_after=0.05)
+        self.driver.browser.add_element(('id', 'late'), text='Later', appear_after=0.05)
+        assert self.finder.find_element(('id', 'late')).text == 'Late'
+        assert len(self.finder.find_elements(('id', 'late'))) == 2
+        assert self.commands['w3cExecuteScriptAsync'] == 2
+        assert self.commands['getTimeouts'] == 2
+        assert self.commands['setTimeouts'] == 0  # session script timeout (30 sec) is long enough
+        assert self.commands['findElement'] == 0
+
+    def test_script_timeout_is_restored(self):
+        self.driver.set_script_timeout(2)
+        self.driver.command_executor.fail('w3cExecuteScriptAsync', JavascriptError('navigated'))
+        self.driver.browser.add_element(('id', 'late'))
+        self.finder.find_element(('id', 'late'), explicit_timeout=0.5)
+        self.finder.find_element(('id', 'late'), explicit_timeout=0.5)
+        assert self.commands['setTimeouts'] == 1 + 4
+        assert self.driver.timeouts.script == 2
+
+    def test_script_timeout_changed_later_is_kept(self):
+        self.driver.set_script_timeout(2)
+        self.driver.browser.add_element(('id', 'late'))
+        self.finder.find_element(('id', 'late'), explicit_timeout=0.5)
+        self.driver.set_script_timeout(3)
+        self.finder.find_element(('id', 'late'), explicit_timeout=0.5)
+        assert self.driver.timeouts.script == 3
+
+    def test_not_found(self):
+        with self.assertRaises(TimeoutException):
+            self.finder.find_element(('id', 'missing'), explicit_timeout=0.05)
+
+    def test_fallback_to_polling(self):
+        self.driver.command_executor.scripts[scripts.OBSERVE] = broken
+        self.driver.browser.add_element(('xpath', '//late'), appear_after=0.05)
+        assert self.finder.find_element(('xpath', '//late')) is not None
+        assert self.commands['findElement'] > 0
+
+    def test_unsupported_strategy_polls(self):
+        self.driver.browser.add_element(('-ios predicate string', 'late'))
+        assert self.finder.find_element(('-ios predicate string', 'late')) is not None
+        assert self.commands['w3cExecuteScriptAsync'] == 0
+
+    def test_wait_locator_exists(self):
+        self.driver.browser.add_element(('css selector', '.late'), appear_after=0.05)
+        assert self.finder.wait(1).until(LocatorExists(('css selector', '.late'))) is True
+        assert self.commands['findElement'] == 0
+        with self.assertRaises(TimeoutException):
+            self.finder.wait(0.05).until(LocatorExists(('css selector', '.missing')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import types
+import unittest
+
+from seleniumactions.elements import Locator, Using
+from seleniumactions.optimizer import LocatorProfiler, collect_locators, is_scope_safe, optimize_locator, xpath_to_css
+from seleniumactions.testing.fakes import FakeWebDriver
+
+
+class XPathToCssTest(unittest.TestCase):
+
+    def test_rewrites(self):
+        cases = {
+            "//*[@id='home']": ('id', 'home'),
+            '//*[@name="email"]': ('name', 'email'),
+            "//button": ('css selector', 'button'),
+            "//form[@name='login']//button[@type='{kind}']":
+                ('css selector', "form[name='login'] button[type='{kind}']"),
+            "//ul/li[@class='{class_name}' and @data-id]": ('css selector', "ul > li[class='{class_name}'][data-id]"),
+            "//*[contains(@class, 'menu')]/a[starts-with(@href, \"/blog\")]":
+                ('css selector', "[class*='menu'] > a[href^=\"/blog\"]"),
+            "/html/body//div": ('css selector', 'html:root > body div'),
+            "//div[@id='{id}'][@role='tab']": ('css selector', "div[id='{id}'][role='tab']"),
+        }
+        for xpath, expected in cases.items():
+            assert xpath_to_css(xpath) == expected, xpath
+
+    def test_unsafe_xpath_is_not_rewritten(self):
+        for xpath in ("//ul/li[@class='{class_name}' and contains(., '{label}')]",
+                      "//button[.='{label}']",
+                      "//li[1]",
+                      "//a[@href='x' or @href='y']",
+                      "//div/..",
+                      "//div | //span",
+                      "//{tag}[@id='x']",
+                      "//a[contains(@class, '')]",
+                      "//a[@title='a\\b']",
+                      "//svg:rect",
+                      "div[@id='x']",
+                      "//following-sibling::div"):
+            assert xpath_to_css(xpath) is None, xpath
+
+    def test_scope_safe_rewrites(self):
+        for xpath in ("//*[@id='home']", "//button[@type='{kind}']", "//a[@href='//x/y']"):
+            assert is_scope_safe(xpath), xpath
+        for xpath in ("//form//button", "//ul/li", "/html", "/html/body//div"):
+            assert not is_scope_safe(xpath), xpath
+
+    def test_optimized_locator_keeps_parameters(self):
+        locator = Locator(Using.XPATH, "//li[@data-label='{label}']")
+        optimized = optimize_locator(locator)
+        assert optimized.parameters == ['label']
+        assert optimized.get_by(label='News') == ('css selector', "li[data-label='News']")
+        assert optimize_locator(('css selector', 'li')) is None
+
+
+class RuntimeSwapTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        Locator.use_optimized = False
+
+    def test_swap_is_opt_in(self):
+        locator = Locator(Using.XPATH, "//li[@data-label='{label}']")
+        locator.set_optimized(optimize_locator(locator))
+        assert locator.get_by(label='a') == ('xpath', "//li[@data-label='a']")
+        Locator.use_optimized = True
+        assert locator.get_by(label='a') == ('css selector', "li[data-label='a']")
+        with self.assertRaises(ValueError):
+            locator.get_by()
+
+    def test_parameters_have_to_match(self):
+        with self.assertRaises(ValueError):
+            Locator(Using.XPATH, "//li[@id='{a}']").set_optimized(Locator(Using.CSS, "li[id='{b}']"))
+
+
+class LocatorProfilerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.module = types.ModuleType('fake_pages')
+        sys.modules['fake_pages'] = self.module
+        exec('''
+from seleniumactions import Locator, Using
+
+HEADER = ('id', 'header')
+
+
+class Locators:
+    item = Locator(Using.XPATH, "//ul/li[@data-label='{label}']")
+    text_item = Locator(Using.XPATH, "//li[.='{label}']")
+    spoofed = Locator(Using.XPATH, "//input[@type='submit']")
+    gone = Locator(Using.XPATH, "//div[@id='gone']")
+''', vars(self.module))
+        self.driver = FakeWebDriver()
+        browser = self.driver.browser
+        browser.add_element(('id', 'header'))
+        browser.add_element(('xpath', "//ul/li[@data-label='News']"),
+                            aliases=[('css selector', "ul > li[data-label='News']")])
+        browser.add_element(('xpath', "//li[.='label']"))
+        browser.add_element(('xpath', "//input[@type='submit']"))
+        browser.add_element(('css selector', "input[type='submit']"))  # matched case-insensitively by CSS
+
+    def tearDown(self) -> None:
+        del sys.modules['fake_pages']
+
+    def test_collect_locators(self):
+        names = {'HEADER', 'Locators.item', 'Locators.text_item', 'Locators.spoofed', 'Locators.gone'}
+        assert set(collect_locators([self.module])) == names
+
+    def test_profile_and_apply(self):
+        report = LocatorProfiler(self.driver, repeat=3, slow_ms=0).profile_all(
+            [self.module], samples={'Locators.item': {'label': 'News'}})
+        profiles = {p.name: p for p in report.profiles}
+        assert profiles['Locators.item'].matches == 1
+        assert profiles['Locators.item'].verified
+        assert report.skipped == ['Locators.text_item'] and 'Locators.text_item' not in profiles  # no samples
+        assert profiles['Locators.spoofed'].suggestion is not None and not profiles['Locators.spoofed'].verified
+        assert profiles['Locators.gone'].suggestion is not None and not profiles['Locators.gone'].verified
+        assert len(report.slow) == 4
+        assert not profiles['Locators.item'].scope_safe  # ul > li chain
+        assert report.apply() == 0
+        assert report.apply(scoped=False) == 1
+        assert self.module.Locators.item.optimized is not None
+        assert self.module.Locators.spoofed.optimized is None
+        assert report.to_dict()['profiles'][0]['name'] in profiles
+        with self.assertRaises(ValueError):
+            LocatorProfiler(self.driver).profile('Locators.item', self.module.Locators.item)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import pytest
+
+from seleniumactions import scripts
+from seleniumactions.conditions import LocatorExists
+from seleniumactions.waits import FailureConditionMet
+
+
+EMAIL = ('name', 'email')
+PASSWORD = ('name', 'password')
+SUBMIT = ('xpath', '//button[@type="submit"]')
+WELCOME = ('id', 'welcome')
+
+
+def failing(browser, args):
+    steps, index, root = args
+    return {'results': [None], 'next': index + 1, 'error': 'TypeError: form is null'}  # first step ran, second failed
+
+
+@pytest.mark.usefixtures('fake')
+class PipelineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        browser = self.driver.browser
+        self.email = browser.add_element(EMAIL, attributes={'value': 'old'})
+        self.password = browser.add_element(PASSWORD)
+        self.submit = browser.add_element(SUBMIT, appear_after=0.1)
+        browser.add_element(WELCOME, text='Welcome', attributes={'class': 'banner'})
+        self.actions = self.fake.actions()
+
+    def test_scriptable_steps_run_in_single_script(self):
+        result = self.actions.pipeline()\
+            .clear(EMAIL).set_value(EMAIL, 'jimmy@choo.io')\
+            .click(SUBMIT)\
+            .get_text(WELCOME).get_attribute(WELCOME, 'class')\
+            .run()
+        assert result.ok and result.failed_at is None
+        assert result.values == [None, None, None, 'Welcome', 'banner']
+        assert self.email.attributes['value'] == 'jimmy@choo.io'
+        assert self.submit.clicks == 1
+        commands = self.driver.command_executor.commands
+        assert commands['findElement'] == 0
+        assert result.round_trips == commands['w3cExecuteScript'] >= 2  # submit button appears later
+
+    def test_native_steps(self):
+        result = self.actions.pipeline()\
+            .set_value(EMAIL, 'jimmy@choo.io')\
+            .type_text(PASSWORD, 'secret', text_mask='***')\
+            .click(SUBMIT, trusted=True)\
+            .submit(SUBMIT)\
+            .run()
+        assert result.ok
+        assert self.password.attributes['value'] == 'secret'
+        assert self.submit.clicks == 1 and self.submit.submits == 1
+        assert self.driver.command_executor.commands['clickElement'] == 1
+
+    def test_failure_condition_aborts_pipeline(self):
+        self.driver.browser.add_element(('id', 'error-500'))
+        self.actions.finder.fail_on = [LocatorExists(('id', 'error-500'))]
+        for pipeline in (self.actions.pipeline().click(('id', 'missing')),
+                         self.actions.pipeline().click(('id', 'missing'), trusted=True)):
+            with self.assertRaises(FailureConditionMet):
+                pipeline.run()
+
+    def test_first_failure_index(self):
+        result = self.actions.pipeline()\
+            .set_value(EMAIL, 'jimmy@choo.io')\
+            .click(('id', 'missing'))\
+            .get_text(WELCOME)\
+            .run(explicit_timeout=0.2)
+        assert not result.ok
+        assert result.failed_at == 1
+        assert result.error.startswith('TimeoutException')
+        assert result.values == [None, None, None]
+
+    def test_native_failure_stops_pipeline(self):
+        result = self.actions.pipeline()\
+            .type_text(('id', 'missing'), 'abc')\
+            .click(SUBMIT)\
+            .run(explicit_timeout=0.2)
+        assert result.failed_at == 0
+        assert self.submit.clicks == 0
+
+    def test_script_error(self):
+        self.driver.command_executor.scripts[scripts.PIPELINE] = failing
+        result = self.actions.pipeline().clear(EMAIL).submit(EMAIL).run()
+        assert result.failed_at == 1
+        assert result.error == 'TypeError: form is null'
+
+    def test_segments(self):
+        pipeline = self.actions.pipeline()\
+            .clear(EMAIL).submit().click(SUBMIT).type_text(PASSWORD, 'x').get_text(WELCOME)
+        assert [(first, len(steps)) for first, steps in pipeline.segments()] == [(0, 2), (2, 1), (3, 1), (4, 1)]
+
+
+if __name__ == '__main__':
+    unittest.main()
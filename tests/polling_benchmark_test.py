@@ -0,0 +1,78 @@
+"""
+Polling benchmark - latency of FluentFinder.find_element for elements appearing after a delay.
+
+Compares default FixedPolling (same as selenium WebDriverWait) with BackoffPolling,
+against FakeWebDriver with small command latency (logged only - wall-clock comparisons are too noisy
+on shared runners), assertions use the same waits on a simulated clock.
+Run with: python -m pytest tests/polling_benchmark_test.py
+"""
+import logging
+import statistics
+import time
+import unittest
+
+from seleniumactions.testing.fakes import FakeWebDriver
+from seleniumactions.waits import BackoffPolling, FixedPolling, PollingWait
+
+from conftest import FakeSession
+
+
+logger = logging.getLogger('BENCHMARK')
+
+DELAYS = [0.02, 0.12]
+RUNS = 3
+
+
+def measure(polling, delay: float) -> list:
+    session = FakeSession(FakeWebDriver(latency=0.001))
+    driver = session.driver
+    driver.browser.add_element(('id', 'late'), appear_after=delay)
+    finder = session.finder(default_timeout=2, polling=polling)
+    latencies = []
+    for _ in range(RUNS):
+        driver.get('about:blank')
+        begin = time.perf_counter()
+        finder.find_element(('id', 'late'))
+        latencies.append(time.perf_counter() - begin - delay)
+    return latencies
+
+
+def simulated_latency(polling, delay: float) -> float:
+    """ extra latency of PollingWait for condition met after delay, on a simulated clock """
+    clock = SimulatedClock()
+    PollingWait(None, 2, polling, clock=clock, sleep=clock.sleep).until(lambda driver: clock.now >= delay)
+    return clock.now - delay
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class PollingBenchmarkTest(unittest.TestCase):
+
+    def test_latency_distribution(self):
+        for delay in DELAYS:
+            fixed = measure(FixedPolling(), delay)
+            backoff = measure(BackoffPolling(), delay)
+            for name, latencies in (('fixed', fixed), ('backoff', backoff)):
+                logger.info(f'element after {delay * 1000:.0f} ms, {name} polling: '
+                            f'extra latency median {statistics.median(latencies) * 1000:.1f} ms, '
+                            f'max {max(latencies) * 1000:.1f} ms')
+
+    def test_simulated_latency(self):
+        for delay in DELAYS:
+            fixed = simulated_latency(FixedPolling(), delay)
+            backoff = simulated_latency(BackoffPolling(jitter=0), delay)
+            assert backoff < fixed
+            assert backoff <= delay  # next check at most one (doubled) interval after the element appeared
+
+
+if __name__ == '__main__':
+    unittest.main()
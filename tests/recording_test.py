@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from seleniumactions.recording import Recorder, Recording, ReplayMismatch, ReplayWebDriver
+from seleniumactions.testing.fakes import FakeWebDriver
+
+from conftest import FakeSession
+
+
+URL = 'https://some.site.io'
+MENU = ('id', 'menu')
+HEADER = ('id', 'header')
+
+
+def flow(driver) -> str:
+    session = FakeSession(driver)
+    actions = session.actions(session.finder(default_timeout=2), wait_for_condition_timeout=2)
+    actions.goto(URL)
+    actions.click(MENU)
+    return actions.get_text(HEADER)
+
+
+class RecordingTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        driver = FakeWebDriver(latency=0.005)
+        driver.browser.add_element(MENU, url=URL)
+        driver.browser.add_element(HEADER, text='Welcome', appear_after=0.1, url=URL)
+        self.recorder = Recorder().install(driver)
+        self.text = flow(driver)
+        driver.quit()
+
+    def test_recording_saved_and_loaded(self):
+        recording = self.recorder.recording
+        assert recording.entries[0].command == 'get'
+        assert recording.latency >= 0.005 * len(recording)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('flow.jsonl', 'flow.jsonl.gz'):
+                path = os.path.join(directory, name)
+                recording.save(path)
+                loaded = Recording.load(path)
+                assert [e.key for e in loaded.entries] == [e.key for e in recording.entries]
+                assert [e.response for e in loaded.entries] == [e.response for e in recording.entries]
+
+    def test_replay_without_latency(self):
+        driver = ReplayWebDriver(self.recorder.recording, timing='none')
+        assert flow(driver) == self.text
+        driver.quit()
+        executor = driver.command_executor
+        assert executor.done
+        assert executor.stats['latency'] == 0.0
+        assert executor.stats['served'] + executor.stats['skipped'] == len(self.recorder.recording)
+
+    def test_replay_with_original_timing(self):
+        driver = ReplayWebDriver(self.recorder.recording, timing='original')
+        assert flow(driver) == self.text
+        assert 0 < driver.command_executor.stats['latency'] <= self.recorder.recording.latency
+
+    def test_replay_of_different_flow_fails(self):
+        driver = ReplayWebDriver(self.recorder.recording)
+        with pytest.raises(ReplayMismatch):
+            driver.get('https://other.site.io')
+
+    def test_invalid_timing(self):
+        with pytest.raises(ValueError):
+            ReplayWebDriver(self.recorder.recording, timing='fast')
@@ -0,0 +1,162 @@
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+import pytest
+
+from seleniumactions.locators import Locator, Using, frame
+from seleniumactions.registry import LocatorError, LocatorRegistry, check_css, check_syntax, check_xpath, main
+
+
+LOCATORS = '''
+from seleniumactions import Locator, Using
+
+
+class ButtonByLabel(Locator):
+    def __init__(self) -> None:
+        super().__init__(Using.XPATH, "//button[.='{label}']")
+
+
+class Locators:
+    button = ButtonByLabel()
+    menu = Locator(Using.XPATH, "//ul/li[@class='{class_name}' and contains(., '{label}')]")
+'''
+
+PAGES = '''
+from seleniumactions import Page, Locator, Using
+
+
+class LoginPage(Page):
+    url = 'https://some.site.io/login'
+    EMAIL = ('name', 'email')
+    SUBMIT = Locator(Using.CSS, 'form#login button[type="submit"]').get_by()
+'''
+
+HOME = '''
+from seleniumactions import Page
+
+
+class HomePage(Page):
+    EMAIL = ('name', 'email')
+'''
+
+EDITOR = '''
+from seleniumactions import Page, Locator, Using
+from seleniumactions.locators import LocatorPath, frame
+
+
+class EditorPage(Page):
+    EMAIL = LocatorPath('name', 'email', [frame(('id', 'editor'))])  # not a duplicate of top document email
+    BODY = LocatorPath('css selector', 'div.body', [frame(('id', 'editor'))])
+    BODY_AGAIN = LocatorPath('css selector', 'div.body', [frame(('id', 'editor'))])
+    SAVE = Locator(Using.CSS, 'button.{kind}', context=[frame(('id', 'editor'))])
+'''
+
+BROKEN = '''
+from seleniumactions import Locator, Using
+
+
+class Broken:
+    header = Locator(Using.XPATH, "//h*[.='{text}']")
+    row = Locator(Using.XPATH, "//tr[{}]")
+    card = ('class name', 'card active')
+    link = Locator(Using.CSS, "nav > > a[href='{href}']")
+'''
+
+
+class LocatorRegistryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.package = f'registry_pages_{id(self)}'
+        self.write('__init__.py', '')
+        self.write('locators.py', LOCATORS)
+        self.write('login.py', PAGES)
+        self.write('home.py', HOME)
+        sys.path.insert(0, self.directory.name)
+        self.cache = os.path.join(self.directory.name, 'locators.json')
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.directory.name)
+        for name in [name for name in sys.modules if name.startswith(self.package)]:
+            del sys.modules[name]
+        self.directory.cleanup()
+
+    def write(self, name: str, source: str) -> str:
+        path = os.path.join(self.directory.name, self.package, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(textwrap.dedent(source))
+        return path
+
+    def test_package_is_collected(self):
+        registry = LocatorRegistry.build([self.package])
+        assert set(registry.names()) == {f'{self.package}.{name}' for name in (
+            'locators.Locators.button', 'locators.Locators.menu', 'login.LoginPage.EMAIL', 'login.LoginPage.SUBMIT',
+            'home.HomePage.EMAIL'
+        )}
+        assert registry.get_by(f'{self.package}.locators.Locators.button', label='Next') == \
+            ('xpath', "//button[.='Next']")
+        assert registry.get_by(f'{self.package}.login.LoginPage.EMAIL') == ('name', 'email')
+        assert [issue.kind for issue in registry.warnings] == ['duplicate']
+
+    def test_all_errors_are_reported_at_once(self):
+        self.write('broken.py', BROKEN)
+        with pytest.raises(LocatorError) as e:
+            LocatorRegistry.build([self.package])
+        kinds = {issue.name.rsplit('.', 1)[1]: issue.kind for issue in e.value.issues}
+        assert kinds == {'header': 'syntax', 'row': 'parameters', 'card': 'syntax', 'link': 'syntax'}
+        assert main([self.package]) == 1
+
+    def test_cache_roundtrip(self):
+        built = LocatorRegistry.cached(self.cache, [self.package])
+        loaded = LocatorRegistry.load(self.cache)
+        assert loaded is not None and loaded.names() == built.names()
+        name = f'{self.package}.locators.Locators.menu'
+        assert loaded.template(name).fields == ('class_name', 'label')
+        assert loaded.get_by(name, class_name='menu', label='Foo') == built.get_by(name, class_name='menu', label='Foo')
+        assert [str(issue) for issue in loaded.warnings] == [str(issue) for issue in built.warnings]
+        assert LocatorRegistry.cached(self.cache, [self.package]).names() == built.names()
+
+    def test_context_is_kept(self):
+        self.write('editor.py', EDITOR)
+        registry = LocatorRegistry.build([self.package])
+        registry.save(self.cache)
+        for r in (registry, LocatorRegistry.load(self.cache)):
+            body = r.get_by(f'{self.package}.editor.EditorPage.BODY')
+            assert body.context == (frame(('id', 'editor')),)
+            save = r.get_by(f'{self.package}.editor.EditorPage.SAVE', kind='save')
+            assert save == ('css selector', 'button.save') and save.context == body.context
+        duplicates = [issue.name for issue in registry.warnings]
+        assert len(duplicates) == 2 and f'{self.package}.editor.EditorPage.BODY_AGAIN' in duplicates
+        assert f'{self.package}.editor.EditorPage.EMAIL' not in duplicates
+
+    def test_cache_is_stale_after_source_change(self):
+        LocatorRegistry.build([self.package]).save(self.cache)
+        path = self.write('home.py', HOME + "    LOGO = ('id', 'logo')\n")
+        os.utime(path, ns=(0, 0))
+        assert LocatorRegistry.load(self.cache) is None
+        assert LocatorRegistry.load(self.cache, check=False) is not None
+        assert LocatorRegistry.load(os.path.join(self.directory.name, 'missing.json')) is None
+
+    def test_locator_from_compiled_template(self):
+        source = Locator(Using.XPATH, '//a[@id="{id}"]')
+        locator = Locator(source.using, source.value, template=source.template)
+        assert locator.template is source.template
+        assert locator.get_by(id='home') == ('xpath', '//a[@id="home"]')
+
+    def test_syntax_checks(self):
+        assert check_xpath("//li[@class='a' and contains(., '[')]") is None
+        assert check_xpath('//div[@id="x"') == 'unbalanced brackets'
+        assert check_xpath("//a[.='x]") == 'unclosed string literal'
+        assert check_xpath('//div[]') == 'empty predicate'
+        assert check_xpath('//div/') == 'unexpected end of expression'
+        assert check_css('ul > li:nth-child(2n+1) a[title~="x"]') is None
+        assert check_css('//div') == 'XPath given as css selector'
+        assert check_css('div >') == 'dangling combinator'
+        assert check_css('a[href') == 'unbalanced brackets'
+        assert check_syntax('tag name', 'h1') is None
+        assert check_syntax('link text', ' ') == 'empty value'
+        assert check_syntax('text', 'foo') == "unknown strategy 'text'"
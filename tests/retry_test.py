@@ -0,0 +1,163 @@
+import asyncio
+import time
+import unittest
+
+import pytest
+from selenium.common.exceptions import (ElementClickInterceptedException, StaleElementReferenceException,
+                                        TimeoutException, WebDriverException)
+from urllib3.exceptions import MaxRetryError, ProtocolError, ReadTimeoutError
+
+from seleniumactions.actions import Actions
+from seleniumactions.aio import AsyncActions, AsyncFinder
+from seleniumactions.elements import ElementCache, Finder, FluentFinder
+from seleniumactions.instrumentation import MemorySink, instrumentation
+from seleniumactions.retry import RetryPolicy, is_transient
+from seleniumactions.testing.fakes import ClickIntercepted, GridError, NoSuchElement, StaleElement
+from seleniumactions.waits import FixedPolling
+
+
+SAVE = ('id', 'save')
+EMAIL = ('name', 'email')
+
+
+class PlainFinder(Finder):
+    """ custom finder without default_timeout """
+    def find_element(self, locator_tuple: tuple, timeout: str = None, explicit_timeout: int = None, **kwargs):
+        return self.wait(self.resolve_timeout(timeout, explicit_timeout, 1)).until(self.presence(locator_tuple))
+
+    def find_elements(self, locator_tuple: tuple, timeout: str = None, explicit_timeout: int = None, **kwargs):
+        return self.wait(self.resolve_timeout(timeout, explicit_timeout, 1)).until(self.presence(locator_tuple, True))
+
+
+@pytest.mark.usefixtures('fake')
+class RetryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.save = self.driver.browser.add_element(SAVE, text='Save')
+        self.email = self.driver.browser.add_element(EMAIL)
+        self.executor = self.driver.command_executor
+        self.policy = RetryPolicy(backoff=FixedPolling(0.01))
+
+    def actions(self, policy: RetryPolicy = None, **finder_kwargs) -> Actions:
+        return self.fake.actions(self.fake.finder(default_timeout=0.2, **finder_kwargs), retry=policy)
+
+    def test_intercepted_click_is_retried(self):
+        self.executor.fail('clickElement', ClickIntercepted('overlay'), times=2)
+        self.actions(self.policy).click(SAVE)
+        assert self.save.clicks == 1
+        stats = self.policy.stats.locators[SAVE]
+        assert stats['retries'] == 2 and stats['gave_up'] == 0
+        assert stats['errors'] == {'ElementClickInterceptedException': 2}
+        assert stats['lost'] > 0
+
+    def test_stale_element_is_found_again(self):
+        actions = self.actions(self.policy, element_cache=ElementCache())
+        actions.get_text(EMAIL)  # cached handle
+        self.executor.fail('sendKeysToElement', StaleElement('re-rendered'))
+        finds = self.executor.commands['findElement']
+        actions.type_text(EMAIL, 'jimmy@choo.io')
+        assert self.email.attributes['value'] == 'jimmy@choo.io'
+        assert self.executor.commands['findElement'] == finds + 1
+        assert self.policy.stats.retries == 1
+
+    def test_gives_up_after_max_retries(self):
+        self.executor.fail('clickElement', ClickIntercepted('overlay'), times=5)
+        with pytest.raises(ElementClickInterceptedException):
+            self.actions(self.policy).click(SAVE)
+        assert self.executor.commands['clickElement'] == 4
+        assert self.policy.stats.locators[SAVE]['gave_up'] == 1
+
+    def test_budget_bounds_retries(self):
+        policy = RetryPolicy(rules={ElementClickInterceptedException: 100}, budget=0.1, backoff=FixedPolling(0.04))
+        self.executor.fail('clickElement', ClickIntercepted('overlay'), times=100)
+        with pytest.raises(ElementClickInterceptedException):
+            self.actions(policy).click(SAVE)
+        assert 2 <= self.executor.commands['clickElement'] <= 4
+        assert policy.stats.locators[SAVE]['lost'] < 0.2
+
+    def test_budget_bucket_is_resolved_with_finder_timeouts(self):
+        policy = RetryPolicy(budget='medium')
+        assert policy.budget_seconds(self.actions().finder) == 2
+        with pytest.raises(ValueError):
+            RetryPolicy(budget=0)
+        with pytest.raises(ValueError):
+            Actions(FluentFinder(self.driver, timeouts={'long': 3}, default_timeout=1), 1, retry=policy)
+
+    def test_budget_is_not_recorded_as_span_timeout(self):
+        sink = instrumentation.add_sink(MemorySink())
+        try:
+            with instrumentation.span('outer') as outer:
+                self.actions(RetryPolicy(budget='long')).get_text(SAVE, explicit_timeout=0.2)
+        finally:
+            instrumentation.remove_sink(sink)
+        assert outer.timeout is None
+        assert sink.spans[0].timeout == 0.2
+
+    def test_retry_with_finder_without_default_timeout(self):
+        actions = Actions(PlainFinder(self.driver, self.fake.timeouts), 1, retry=self.policy)
+        self.executor.fail('clickElement', ClickIntercepted('overlay'))
+        actions.click(SAVE)
+        assert self.save.clicks == 1
+
+    def test_errors_without_rule_are_not_retried(self):
+        self.executor.fail('clickElement', StaleElement('gone'))
+        policy = RetryPolicy(rules={ElementClickInterceptedException: 3})
+        with pytest.raises(StaleElementReferenceException):
+            self.actions(policy).click(SAVE)
+        assert self.executor.commands['clickElement'] == 1
+        assert policy.stats.locators == {}
+
+    def test_transient_grid_error(self):
+        assert is_transient(WebDriverException('502 Bad Gateway'))
+        assert is_transient(ConnectionResetError())
+        assert not is_transient(WebDriverException('unknown command'))
+        assert not is_transient(StaleElementReferenceException('Connection reset'))
+        self.executor.fail('w3cExecuteScript', GridError())
+        assert self.actions(self.policy).get_text(SAVE) == 'Save'
+        assert self.policy.stats.locators[SAVE]['errors'] == {'WebDriverException': 1}
+
+    def test_urllib3_errors_are_transient(self):
+        assert is_transient(ProtocolError('Connection aborted.', ConnectionResetError()))
+        assert is_transient(MaxRetryError(None, '/session/1/element', reason=ConnectionRefusedError()))
+        assert is_transient(ReadTimeoutError(None, '/session/1/element', 'Read timed out.'))
+
+    def test_transient_error_is_retried_only_in_idempotent_steps(self):
+        actions = self.actions(self.policy)
+        for command, step in (('clickElement', lambda: actions.click(SAVE)),
+                              ('sendKeysToElement', lambda: actions.type_text(EMAIL, 'jimmy@choo.io')),
+                              ('w3cExecuteScript', lambda: actions.submit(SAVE))):
+            self.executor.fail(command, ProtocolError('Connection aborted.'))
+            with pytest.raises(ProtocolError):
+                step()
+        assert self.save.clicks == 0 and 'value' not in self.email.attributes
+        self.executor.fail('clearElement', ProtocolError('Connection aborted.'))
+        actions.clear(EMAIL)
+        assert self.policy.stats.retries == 1
+
+    def test_find_again_is_bounded_by_budget(self):
+        policy = RetryPolicy(budget=0.3, backoff=FixedPolling(0.01))
+        actions = self.fake.actions(self.fake.finder(default_timeout=5, element_cache=ElementCache()), retry=policy)
+        actions.get_text(SAVE)  # cached handle
+        self.executor.fail('clickElement', StaleElement('re-rendered'))
+        self.executor.fail('findElement', NoSuchElement('gone'), times=1000)
+        begin = time.perf_counter()
+        with pytest.raises(TimeoutException):
+            actions.click(SAVE)
+        assert time.perf_counter() - begin < 1
+
+    def test_worst_offenders(self):
+        actions = self.actions(self.policy)
+        self.executor.fail('clickElement', ClickIntercepted('overlay'), times=3)
+        actions.click(SAVE)
+        self.executor.fail('clearElement', StaleElement('gone'))
+        actions.clear(EMAIL)
+        assert [locator for locator, _ in self.policy.stats.worst()] == [SAVE, EMAIL]
+        assert self.policy.stats.retries == 4
+
+    def test_async_retry(self):
+        actions = self.fake.actions(self.fake.finder(AsyncFinder, default_timeout=0.2), AsyncActions, retry=self.policy)
+        self.executor.fail('clickElement', ClickIntercepted('overlay'))
+        asyncio.run(actions.click(SAVE))
+        assert self.save.clicks == 1
+        assert self.policy.stats.retries == 1
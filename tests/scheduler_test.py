@@ -0,0 +1,129 @@
+import time
+import unittest
+
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.elements import Finder
+from seleniumactions.scheduler import Scheduler, Session, SessionPool
+from seleniumactions.testing.fakes import FakeWebDriver
+
+from conftest import FakeSession
+
+
+URL = 'https://scheduler.local/'
+
+
+def fake_driver() -> FakeWebDriver:
+    driver = FakeWebDriver()
+    driver.browser.add_element(('id', 'header'), text='Header', url=URL)
+    return driver
+
+
+class CdpWebDriver(FakeWebDriver):
+    """ fake driver with Chrome DevTools Protocol commands """
+    def __init__(self) -> None:
+        super().__init__()
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        self.cdp.append((cmd, cmd_args))
+        if cmd == 'Network.clearBrowserCookies': self.browser.cookies.clear()
+        return {}
+
+
+def finder(driver) -> Finder:
+    return FakeSession(driver).finder(default_timeout=0.5)
+
+
+def read_header(actions) -> str:
+    actions.goto(URL)
+    actions.webdriver.add_cookie({'name': 'session', 'value': 'abc'})
+    time.sleep(0.1)
+    return actions.get_text(('id', 'header'))
+
+
+def missing(actions) -> None:
+    actions.goto(URL)
+    actions.get_text(('id', 'missing'), explicit_timeout=0.1)
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def test_runs_scenarios_in_parallel_on_warm_sessions(self):
+        launched = []
+
+        def driver_factory():
+            launched.append(1)
+            return fake_driver()
+
+        with Scheduler(driver_factory, finder, workers=4) as scheduler:
+            report = scheduler.run([read_header] * 8)
+            sessions = scheduler.pool.sessions
+        assert [result.value for result in report.results] == ['Header'] * 8
+        assert len(launched) == 4
+        assert report.wall < 0.6
+        workers = report.to_dict()['workers']
+        assert sum(w['scenarios'] for w in workers.values()) == 8
+        assert all(0 < w['utilization'] <= 1 for w in workers.values())
+        assert report.queue_wait['count'] == 8
+        for session in sessions:
+            assert session.driver.browser.cookies == {}
+            assert session.driver.browser.url == Session.blank_url
+
+    def test_failed_scenario_is_reported(self):
+        with Scheduler(fake_driver, finder, workers=2) as scheduler:
+            report = scheduler.run({'ok': read_header, 'missing': missing})
+        assert [result.name for result in report.failed] == ['missing']
+        assert report.failed[0].error.startswith(TimeoutException.__name__)
+
+    def test_session_relaunched_when_reset_fails(self):
+        def broken_reset(session):
+            raise RuntimeError('browser crashed')
+
+        with SessionPool(fake_driver, finder, size=1, reset=broken_reset) as pool:
+            session = pool.acquire()
+            pool.release(session)
+            assert pool.acquire() is not session
+            assert pool.relaunched == 1
+
+    def test_failed_relaunch_is_reported_and_session_kept(self):
+        launched = []
+
+        def flaky_driver():
+            launched.append(1)
+            if len(launched) == 2: raise RuntimeError('no browser')
+            return fake_driver()
+
+        def broken_reset(session):
+            raise RuntimeError('browser crashed')
+
+        with Scheduler(flaky_driver, finder, workers=1, reset=broken_reset) as scheduler:
+            report = scheduler.run([read_header] * 3)
+            pool = scheduler.pool
+        assert [result.value for result in report.results] == ['Header'] * 3
+        assert report.results[0].reset_error == 'RuntimeError: no browser'
+        assert [result.reset_error for result in report.results[1:]] == [None, None]
+        assert pool.relaunch_failed == 1 and pool.relaunched == 2
+
+    def test_reset_clears_cookies_of_all_origins_with_cdp(self):
+        driver = CdpWebDriver()
+        session = Session('cdp', driver, finder(driver), None)
+        driver.add_cookie({'name': 'session', 'value': 'abc'})
+        session.reset()
+        assert driver.cdp == [('Network.clearBrowserCookies', {})]
+        assert driver.command_executor.commands['deleteAllCookies'] == 0
+        assert driver.browser.cookies == {}
+
+    def test_process_mode(self):
+        with Scheduler(fake_driver, finder, workers=2, mode='process') as scheduler:
+            report = scheduler.run([read_header] * 4)
+        assert [result.value for result in report.results] == ['Header'] * 4
+        assert len(report.workers) == 2
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            Scheduler(fake_driver, finder, mode='fiber')
+
+
+if __name__ == '__main__':
+    unittest.main()
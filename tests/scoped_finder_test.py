@@ -0,0 +1,82 @@
+import unittest
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from seleniumactions.elements import ScopedFinder
+from seleniumactions.pages import Page
+
+
+SIDEBAR = ('id', 'sidebar')
+CONTENT = ('id', 'content')
+LINK = ('xpath', '//a')
+
+
+class Sidebar(Page):
+    root = SIDEBAR
+
+    def first_link(self) -> str:
+        return self.actions.get_text(LINK)
+
+
+@pytest.mark.usefixtures('fake')
+class ScopedFinderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        browser = self.driver.browser
+        self.sidebar = browser.add_element(SIDEBAR)
+        self.content = browser.add_element(CONTENT)
+        self.content_link = browser.add_element(LINK, text='Article', parent=self.content)
+        self.sidebar_link = browser.add_element(LINK, text='News', parent=self.sidebar)
+        self.late_link = browser.add_element(LINK, text='Blog', parent=self.sidebar, appear_after=0.1)
+        self.finder = self.fake.finder()
+        self.actions = self.fake.actions(self.finder)
+
+    def test_lookups_run_relative_to_root(self):
+        scoped = self.finder.scoped(SIDEBAR)
+        assert scoped.find_element(LINK).text == 'News'
+        assert [e.text for e in scoped.find_elements(LINK, explicit_timeout=0.5)] in (['News'], ['News', 'Blog'])
+        commands = self.driver.command_executor.commands
+        assert commands['findElement'] == 1  # root located once
+        assert commands['findChildElement'] == 1
+        assert ScopedFinder.relative(LINK) == ('xpath', './/a')
+
+    def test_scoped_finder_is_shared_per_root(self):
+        assert self.finder.scoped(SIDEBAR) is self.finder.scoped(list(SIDEBAR))
+        assert self.finder.scoped(SIDEBAR) is not self.finder.scoped(CONTENT)
+
+    def test_nested_scopes(self):
+        self.driver.browser.add_element(('class name', 'label'), text='inner', parent=self.sidebar_link)
+        nested = self.finder.scoped(SIDEBAR).scoped(LINK)
+        assert nested.find_element(('class name', 'label')).text == 'inner'
+
+    def test_missing_child_times_out(self):
+        with self.assertRaises(TimeoutException):
+            self.finder.scoped(CONTENT).find_element(('id', 'sidebar'), explicit_timeout=0.2)
+
+    def test_root_located_again_after_navigation(self):
+        scoped = self.actions.scoped(SIDEBAR)
+        assert scoped.get_text(LINK) == 'News'
+        self.actions.goto('about:blank')
+        assert scoped.get_text(LINK) == 'News'
+        assert self.driver.command_executor.commands['findElement'] == 2
+
+    def test_stale_root_is_located_again(self):
+        scoped = self.finder.scoped(SIDEBAR)
+        scoped.find_element(LINK)
+        self.driver.browser.load(self.driver.browser.url)  # page re-rendered, root element is stale
+        assert scoped.find_element(LINK).text == 'News'
+        assert self.driver.command_executor.commands['findElement'] == 2
+
+    def test_page_root_scopes_actions_and_batch_reads(self):
+        page = Sidebar(self.actions)
+        assert page.first_link() == 'News'
+        assert page.actions.get_texts([LINK]) == ['News']
+        assert page.actions.get_all_texts(LINK, explicit_timeout=0.5) in (['News'], ['News', 'Blog'])
+        assert page.actions.pipeline().get_text(LINK).run().values == ['News']
+        assert self.actions.get_text(LINK) == 'Article'  # unscoped actions search whole document
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
+from seleniumactions.waits import BackoffPolling, FailureConditionMet, FixedPolling, PollingWait
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def take(iterator, n: int) -> list:
+    return [round(next(iterator), 6) for _ in range(n)]
+
+
+class PollingStrategyTest(unittest.TestCase):
+
+    def test_fixed(self):
+        assert take(FixedPolling(0.5).intervals(), 3) == [0.5, 0.5, 0.5]
+
+    def test_backoff_capped(self):
+        polling = BackoffPolling(initial=0.005, factor=2, cap=0.03, jitter=0)
+        assert take(polling.intervals(), 5) == [0.005, 0.01, 0.02, 0.03, 0.03]
+
+    def test_backoff_jitter(self):
+        polling = BackoffPolling(initial=0.1, factor=1, cap=0.1, jitter=0.2, seed=1)
+        for interval in take(polling.intervals(), 50):
+            assert 0.08 <= interval <= 0.12
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            BackoffPolling(factor=0.5)
+        with self.assertRaises(ValueError):
+            FixedPolling(0)
+
+
+class PollingWaitTest(unittest.TestCase):
+
+    def test_immediate_success(self):
+        clock = FakeClock()
+        wait = PollingWait(None, 1, BackoffPolling(jitter=0), clock=clock, sleep=clock.sleep)
+        assert wait.until(lambda driver: 'found') == 'found'
+        assert clock.sleeps == []
+
+    def test_delayed_first_check(self):
+        clock = FakeClock()
+        wait = PollingWait(None, 1, BackoffPolling(initial=0.01, jitter=0, immediate=False),
+                           clock=clock, sleep=clock.sleep)
+        assert wait.until(lambda driver: True)
+        assert clock.sleeps == [0.01]
+
+    def test_backoff_until_found(self):
+        clock = FakeClock()
+
+        def appears(driver):
+            if clock.now < 0.02: raise NoSuchElementException()
+            return True
+
+        wait = PollingWait(None, 1, BackoffPolling(initial=0.005, jitter=0), clock=clock, sleep=clock.sleep)
+        assert wait.until(appears)
+        assert clock.sleeps == [0.005, 0.01, 0.02]
+
+    def test_timeout_checks_at_deadline(self):
+        clock = FakeClock()
+        checks = []
+        wait = PollingWait(None, 1.2, FixedPolling(0.5), clock=clock, sleep=clock.sleep)
+        with self.assertRaises(TimeoutException):
+            wait.until(lambda driver: checks.append(clock.now))
+        assert checks == [0.0, 0.5, 1.0, 1.2]
+
+
+class FailFastWaitTest(unittest.TestCase):
+
+    def test_failure_condition_aborts_wait(self):
+        clock = FakeClock()
+
+        def error_banner(driver):
+            if clock.now < 1.0: raise NoSuchElementException()
+            return 'Internal Server Error'
+
+        wait = PollingWait(None, 30, FixedPolling(0.5), clock=clock, sleep=clock.sleep, fail_on=[error_banner])
+        with self.assertRaises(FailureConditionMet) as raised:
+            wait.until(lambda driver: False)
+        assert raised.exception.condition is error_banner
+        assert raised.exception.elapsed == 1.0
+        assert raised.exception.value == 'Internal Server Error'
+        assert isinstance(raised.exception, TimeoutException)
+        assert wait.won is error_banner and wait.elapsed == 1.0
+
+    def test_expected_condition_wins_same_poll(self):
+        clock = FakeClock()
+
+        def expected(driver):
+            return clock.now >= 0.5
+
+        wait = PollingWait(None, 5, FixedPolling(0.5), clock=clock, sleep=clock.sleep,
+                           fail_on=[lambda driver: clock.now >= 0.5])
+        assert wait.until(expected)
+        assert wait.won is expected and wait.elapsed == 0.5
+
+    def test_timeout_without_failure(self):
+        clock = FakeClock()
+        wait = PollingWait(None, 1, FixedPolling(0.5), clock=clock, sleep=clock.sleep,
+                           fail_on=[lambda driver: False])
+        with self.assertRaises(TimeoutException) as raised:
+            wait.until(lambda driver: False)
+        assert not isinstance(raised.exception, FailureConditionMet)
+        assert wait.won is None and wait.elapsed == 1
+
+
+@pytest.mark.usefixtures('fake')
+class DeprecatedConditionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = self.fake.driver
+        self.driver.browser.add_element(('id', 'menu'), text='Menu')
+        self.finder = self.fake.finder(default_timeout=0.2)
+
+    def test_condition_argument_is_still_accepted(self):
+        with pytest.deprecated_call():
+            assert self.finder.find_element(('id', 'menu'), None, None, EC.presence_of_element_located).text == 'Menu'
+        with pytest.deprecated_call():
+            assert len(self.finder.find_elements(('id', 'menu'), condition=EC.presence_of_all_elements_located)) == 1
+        with pytest.deprecated_call(), pytest.raises(TimeoutException):
+            self.finder.find_element(('id', 'missing'), condition=EC.presence_of_element_located,
+                                     polling=FixedPolling(0.05))
+
+    def test_condition_in_scope(self):
+        root = self.driver.browser.add_element(('id', 'dashboard'))
+        self.driver.browser.add_element(('css selector', 'td'), text='cell', parent=root)
+        dashboard = self.finder.scoped(('id', 'dashboard'))
+        with pytest.deprecated_call():
+            cell = dashboard.find_element(('css selector', 'td'), condition=EC.presence_of_element_located)
+        assert cell.text == 'cell'
+        with pytest.deprecated_call(), pytest.raises(TimeoutException):
+            dashboard.find_element(('id', 'menu'), condition=EC.presence_of_element_located)
+
+
+if __name__ == '__main__':
+    unittest.main()